@@ -0,0 +1,30 @@
+"""Add HTTP validators and content hash to CompanySource
+
+Revision ID: 7c1e2f9a4b3d
+Revises: 003_rename_categories
+Create Date: 2026-10-16 23:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e2f9a4b3d'
+down_revision: Union[str, None] = '003_rename_categories'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('company_sources', sa.Column('etag', sa.String(length=255), nullable=True))
+    op.add_column('company_sources', sa.Column('last_modified', sa.String(length=64), nullable=True))
+    op.add_column('company_sources', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('company_sources', 'content_hash')
+    op.drop_column('company_sources', 'last_modified')
+    op.drop_column('company_sources', 'etag')
@@ -0,0 +1,26 @@
+"""Add snapshot_id to Score
+
+Revision ID: 9d4b7e2c1a6f
+Revises: 7c1e2f9a4b3d
+Create Date: 2026-10-17 09:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4b7e2c1a6f'
+down_revision: Union[str, None] = '7c1e2f9a4b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('scores', sa.Column('snapshot_id', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('scores', 'snapshot_id')
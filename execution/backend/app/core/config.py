@@ -11,6 +11,40 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./data/signalscore.db"
     
+    # Scrape cache (empty string disables it)
+    SCRAPE_CACHE_DIR: str = "./data/scrape_cache"
+    
+    # HTML parser backend: html.parser, lxml or selectolax (see scrapers/document.py)
+    HTML_PARSER: str = "html.parser"
+    
+    # Page text kept for analysis: "full" (all but script/style/nav/header/footer) or "main" (main content block)
+    TEXT_EXTRACTION_MODE: str = "full"
+    
+    # Drop raw HTML from scrape results once parsed (scoring only needs text + links)
+    LEAN_SCRAPE_RESULTS: bool = True
+    
+    # Fetch over plain HTTP first; render in a browser only for SPA shells
+    ADAPTIVE_ESCALATION: bool = True
+    
+    # Headless render profile: "scoring" blocks images/fonts/CSS/trackers, "debug" blocks nothing
+    RENDER_PROFILE: str = "scoring"
+    
+    # Content-addressed store for the scraped text behind each score (empty string disables it)
+    SNAPSHOT_DIR: str = "./data/snapshots"
+    
+    # Record ("record") or serve ("replay") all scrape, probe and search traffic
+    # from a gzip archive for offline, repeatable runs; "off" goes live
+    HTTP_ARCHIVE_MODE: str = "off"
+    HTTP_ARCHIVE_PATH: str = "./data/http_archive.jsonl.gz"
+    
+    # Time budget for one scoring job, split across its stages (0 disables it)
+    SCORING_BUDGET_SECONDS: float = 150.0
+    
+    # Discovery probes (subdomains, corporate pages, alternate TLDs): requests in
+    # flight at once, and the most URLs probed for one company
+    DISCOVERY_PROBE_CONCURRENCY: int = 8
+    DISCOVERY_PROBE_BUDGET: int = 40
+    
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://frontend:3000"]
     
@@ -1,16 +1,28 @@
 """SignalScore Backend - FastAPI Application Entry Point."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.api.v1.router import api_router
+from app.services.scrapers import close_shared_orchestrator
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release long-lived scraping resources (pooled HTTP connections) on shutdown."""
+    yield
+    await close_shared_orchestrator()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="SignalScore API - AI Readiness scoring for companies",
     version="0.1.0",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS middleware for frontend
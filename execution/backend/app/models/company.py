@@ -78,6 +78,9 @@ class Score(Base):
     component_scores: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
     evidence: Mapped[List[str]] = mapped_column(JSON, nullable=False)
     
+    # Scraped text behind this score, in the snapshot store (see services/snapshots.py)
+    snapshot_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    
     # Relationship
     company: Mapped["Company"] = relationship(back_populates="scores")
 
@@ -119,6 +122,20 @@ class CompanySource(Base):
         nullable=False,
     )
 
+    # HTTP validators and extracted-text hash from the last scrape, so a
+    # rescore can send a conditional GET and skip sources that haven't changed
+    etag: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_modified: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
+    def validators(self) -> dict:
+        """Stored ETag / Last-Modified, for ScraperOrchestrator.scrape(validators=...)."""
+        return {
+            key: value
+            for key, value in (("etag", self.etag), ("last_modified", self.last_modified))
+            if value
+        }
+
     def __repr__(self) -> str:
         return f"<CompanySource(id={self.id}, url='{self.url}')>"
 
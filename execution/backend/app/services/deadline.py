@@ -0,0 +1,136 @@
+"""Per-job time budget split across scoring stages.
+
+A scoring job runs discovery, then several scrape waves. Without a limit its
+latency is the sum of every search query, probe and render. A Deadline gives
+the job a total budget and hands each stage a share of whatever is left:
+
+    share = remaining * weight(stage) / sum(weight of this and later stages)
+
+Time an early stage doesn't use rolls over to the later ones, and a stage
+that never runs gives its share to the stages after it. A stage that runs
+out of budget is cancelled (async) or told to stop (`out_of_time`, for
+blocking code in a thread), recorded as truncated, and scoring continues
+with whatever evidence was gathered.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Relative share of the job budget per score_company stage, in run order
+SCORING_STAGE_WEIGHTS = {
+    "discovery": 0.35,
+    "homepage": 0.10,
+    "satellites": 0.25,
+    "subdomains": 0.05,
+    "emergency_crawl": 0.10,
+    "deep_scrape": 0.15,
+}
+
+
+class Deadline:
+    """
+    A total time budget shared by ordered, weighted stages.
+
+    `total_seconds <= 0` means unlimited: stages get no budget and are never
+    truncated, but their timings are still recorded.
+
+    Usage:
+        deadline = Deadline(150, SCORING_STAGE_WEIGHTS)
+        results = await deadline.run("satellites", scrape_all(), default=[])
+        deadline.summary()  # {"truncated": [...], "stages": {...}, ...}
+    """
+
+    def __init__(
+        self,
+        total_seconds: float,
+        weights: dict[str, float],
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.total_seconds = total_seconds
+        self.weights = dict(weights)
+        self.clock = clock
+        self.started = clock()
+        self.spent: dict[str, float] = {}  # Stage -> seconds taken
+        self.budgets: dict[str, Optional[float]] = {}  # Stage -> seconds granted
+        self.truncated: list[str] = []
+        self._stage_started: dict[str, float] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.total_seconds > 0
+
+    def elapsed(self) -> float:
+        return self.clock() - self.started
+
+    def remaining(self) -> float:
+        if not self.enabled:
+            return math.inf
+        return max(0.0, self.total_seconds - self.elapsed())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def stage_budget(self, stage: str) -> Optional[float]:
+        """Seconds `stage` may take now (None = unlimited)."""
+        if not self.enabled:
+            return None
+        order = list(self.weights)
+        later = order[order.index(stage):] if stage in self.weights else []
+        pool = sum(self.weights[s] for s in later)
+        if pool <= 0:
+            return self.remaining()
+        return self.remaining() * self.weights[stage] / pool
+
+    def begin(self, stage: str) -> Optional[float]:
+        """Start timing `stage`; returns its budget in seconds (None = unlimited)."""
+        budget = self.stage_budget(stage)
+        self.budgets[stage] = budget
+        self._stage_started[stage] = self.clock()
+        return budget
+
+    def end(self, stage: str, truncated: bool = False) -> None:
+        started = self._stage_started.pop(stage, self.clock())
+        self.spent[stage] = round(self.clock() - started, 2)
+        if truncated and stage not in self.truncated:
+            self.truncated.append(stage)
+            logger.warning(f"Stage {stage!r} hit its deadline after {self.spent[stage]}s; continuing with partial results")
+
+    async def run(self, stage: str, awaitable: Awaitable, default: Any = None) -> Any:
+        """
+        Await `awaitable` within the stage's budget.
+
+        On timeout the awaitable is cancelled, the stage is marked truncated
+        and `default` is returned. Pass a container the awaitable fills in as
+        `default` to keep its partial results.
+        """
+        budget = self.begin(stage)
+        try:
+            if budget is None:
+                result = await awaitable
+            else:
+                result = await asyncio.wait_for(awaitable, timeout=budget)
+        except asyncio.TimeoutError:
+            self.end(stage, truncated=True)
+            return default
+        self.end(stage)
+        return result
+
+    def summary(self) -> dict:
+        """Budget, elapsed time, truncated stages and per-stage seconds, for the trace."""
+        return {
+            "budget_seconds": self.total_seconds if self.enabled else None,
+            "elapsed_seconds": round(self.elapsed(), 2),
+            "truncated": list(self.truncated),
+            "stages": {
+                stage: {
+                    "budget": None if self.budgets.get(stage) is None else round(self.budgets[stage], 2),
+                    "spent": spent,
+                }
+                for stage, spent in self.spent.items()
+            },
+        }
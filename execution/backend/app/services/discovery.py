@@ -1,9 +1,12 @@
+import asyncio
 import logging
 import time
-import requests
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Dict, Optional, Union
 from urllib.parse import urlparse
 
+import httpx
+
 try:
     from googlesearch import search
 except ImportError:
@@ -13,19 +16,59 @@ except ImportError:
 
 from app.models.company import CompanySource
 from app.services.scrapers.ats_detector import ATSDetector
+from app.services.scrapers.document import ParsedDocument
+from app.services.scrapers.http_archive import ArchiveTransport, HttpArchive, archived_search, shared_archive
 
 logger = logging.getLogger(__name__)
 
+PROBE_TIMEOUT_SECONDS = 2.0  # Fast timeout, we just want to know if it responds
+
 class DiscoveryService:
     """
     Service to discover satellite URLs (Engineering Blogs, GitHub, etc.)
     using search queries.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        archive: Optional[HttpArchive] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        from app.core.config import settings
+
         self.ats_detector = ATSDetector()
+        # Record/replay of searches and probes (HTTP_ARCHIVE_MODE); None = live
+        self.archive = archive if archive is not None else shared_archive()
         self.search_failed = False
         self.collected_snippets: List[str] = []
+        self._subdomains: Dict[str, List[Dict[str, str]]] = {}  # Probed domain -> found subdomains
+        # URL probes (subdomains, corporate pages, alternate TLDs) run concurrently on one client
+        self._transport = transport  # Tests substitute a MockTransport
+        self.probe_concurrency = max(1, settings.DISCOVERY_PROBE_CONCURRENCY)
+        self.probes_left = settings.DISCOVERY_PROBE_BUDGET  # Per company (one DiscoveryService per scoring job)
+        self.probe_budget_spent = False
+        self._probed: Dict[str, bool] = {}  # URL -> responded
+        self._probe_client: Optional[httpx.AsyncClient] = None  # Open while a probe batch runs
+        self._probe_slots: Optional[asyncio.Semaphore] = None
+        # time.monotonic() after which searches and probes are skipped (None = no limit)
+        self.deadline_at: Optional[float] = None
+        self.truncated = False  # Set once the deadline cut discovery short
+
+    def _search(self, query: str, num_results: int) -> list:
+        """Run a search query (recorded/replayed through the HTTP archive, if any)."""
+        return archived_search(
+            self.archive, query, num_results,
+            lambda: search(query, num_results=num_results, advanced=True),
+        )
+
+    def _out_of_time(self) -> bool:
+        """True once `deadline_at` has passed; remaining searches and probes become no-ops."""
+        if self.deadline_at is None or time.monotonic() < self.deadline_at:
+            return False
+        if not self.truncated:
+            logger.warning("Discovery deadline reached; skipping remaining searches and probes")
+            self.truncated = True
+        return True
 
     def find_sources(self, company_name: str, main_domain: str) -> List[Dict[str, str]]:
         """
@@ -77,7 +120,13 @@ class DiscoveryService:
         if conf_url:
              discovered.append({"url": conf_url, "type": "conference_speaking"})
 
-        # 6. Probe for corporate pages (IR, newsroom, press) — no Google query needed
+        # 6. Probe for corporate pages (IR, newsroom, press) — no Google query needed.
+        # Alternate TLDs (step 8) and subdomains (at the end) are probed in the same concurrent batch.
+        self._probe_urls(
+            [url for url, _ in self._corporate_page_candidates(main_domain)]
+            + [url for url, _ in self._alternate_tld_candidates(main_domain)]
+            + [url for url, _ in self._subdomain_candidates(main_domain)]
+        )
         corporate_pages = self._probe_corporate_pages(main_domain)
         discovered.extend(corporate_pages)
 
@@ -114,9 +163,28 @@ class DiscoveryService:
     def discover_subdomains(self, company_name: str, domain: str) -> List[Dict[str, str]]:
         """
         Story 4.4: Systematically scan for high-signal subdomains.
+        Probed once per domain per DiscoveryService; repeat calls reuse the result.
         """
-        
+        clean_domain = domain.replace("www.", "")
+        if clean_domain in self._subdomains:
+            return list(self._subdomains[clean_domain])
+
+        candidates = self._subdomain_candidates(clean_domain)
+        exists = self._probe_urls([url for url, _ in candidates])
         found = []
+        for url, signal_type in candidates:
+            if exists[url]:
+                logger.info(f"Discovered Subdomain: {url}")
+                found.append({"url": url, "type": signal_type})
+        
+        if not self.truncated:  # A scan cut short by the deadline isn't worth reusing
+            self._subdomains[clean_domain] = found
+        return list(found)
+
+    @staticmethod
+    def _subdomain_candidates(domain: str) -> List[tuple]:
+        """(url, type) for every high-signal subdomain prefix."""
+        clean_domain = domain.replace("www.", "")
         # High value prefixes
         prefixes = [
             ("ai", "subdomain_ai"),
@@ -131,24 +199,25 @@ class DiscoveryService:
             ("gemini", "subdomain_ai"), # Specific but generic enough for now
             ("firebase", "subdomain_dev")
         ]
-        
-        clean_domain = domain.replace("www.", "")
-        
-        for prefix, signal_type in prefixes:
-            subdomain = f"{prefix}.{clean_domain}"
-            url = f"https://{subdomain}"
-            
-            if self._check_subdomain_exists(url):
-                logger.info(f"Discovered Subdomain: {url}")
-                found.append({"url": url, "type": signal_type})
-                
-        return found
+        return [(f"https://{prefix}.{clean_domain}", signal_type) for prefix, signal_type in prefixes]
         
     def _probe_alternate_tlds(self, company_name: str, domain: str) -> List[Dict[str, str]]:
         """
         Probe alternate TLDs where companies host engineering content.
         e.g., shopify.engineering, google.dev, meta.ai
         """
+        candidates = self._alternate_tld_candidates(domain)
+        exists = self._probe_urls([url for url, _ in candidates])
+        found = []
+        for alt_url, signal_type in candidates:
+            if exists[alt_url]:
+                logger.info(f"Discovered alternate TLD: {alt_url}")
+                found.append({"url": alt_url, "type": signal_type})
+        return found
+
+    @staticmethod
+    def _alternate_tld_candidates(domain: str) -> List[tuple]:
+        """(url, type) for the brand on each alternate TLD other than its own."""
         # Extract the company/brand portion of the domain (e.g., "shopify" from "shopify.com")
         clean_domain = domain.replace("www.", "")
         brand = clean_domain.split(".")[0]
@@ -160,16 +229,8 @@ class DiscoveryService:
             ("tech", "subdomain_engineering"),
         ]
 
-        found = []
-        for tld, signal_type in alt_tlds:
-            alt_url = f"https://{brand}.{tld}"
-            # Skip if it's the same as the main domain
-            if f"{brand}.{tld}" == clean_domain:
-                continue
-            if self._check_subdomain_exists(alt_url):
-                logger.info(f"Discovered alternate TLD: {alt_url}")
-                found.append({"url": alt_url, "type": signal_type})
-        return found
+        # Skip if it's the same as the main domain
+        return [(f"https://{brand}.{tld}", signal_type) for tld, signal_type in alt_tlds if f"{brand}.{tld}" != clean_domain]
 
     def _search_careers_ai_keywords(self, company_name: str, domain: str) -> List[Dict[str, str]]:
         """
@@ -204,8 +265,10 @@ class DiscoveryService:
         found = []
         seen_urls = set()
         for query in queries:
+            if self._out_of_time():
+                break
             try:
-                results = list(search(query, num_results=5, advanced=True))
+                results = self._search(query, num_results=5)
                 # Capture snippet text from all results
                 for result in results:
                     snippet = f"{result.title}. {result.description}"
@@ -230,25 +293,99 @@ class DiscoveryService:
                     logger.error(f"Careers AI keyword search failed for {company_name}: {e}")
         return found
 
-    def _check_subdomain_exists(self, url: str) -> bool:
-        try:
-             # Fast timeout, we just want to know if it responds
-             resp = requests.head(url, timeout=2, allow_redirects=True)
-             if resp.status_code < 400:
-                 return True
-             # Some sites block HEAD, try GET
-             if resp.status_code == 405: # Method Not Allowed
-                 resp = requests.get(url, timeout=2)
-                 return resp.status_code < 400
-        except:
-             return False
+    def _probe_urls(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """
+        Whether each URL responds, probing the ones not yet known concurrently.
+
+        At most `probe_concurrency` probes are in flight, and once the
+        company's probe budget or the discovery deadline is used up the rest
+        count as missing (and stay unprobed, so a later call can't retry them).
+        """
+        urls = list(dict.fromkeys(urls))
+        pending = [url for url in urls if url not in self._probed]
+        if pending:
+            batch = self._probe_batch(pending)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(batch)
+            else:
+                # Called from async code: the batch needs a loop of its own
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    pool.submit(asyncio.run, batch).result()
+        return {url: self._probed.get(url, False) for url in urls}
+
+    async def _probe_batch(self, urls: List[str]) -> None:
+        transport = self._transport
+        if self.archive is not None:
+            inner = None if self.archive.replaying else (transport or httpx.AsyncHTTPTransport())
+            transport = ArchiveTransport(self.archive, inner)
+        self._probe_slots = asyncio.Semaphore(self.probe_concurrency)
+        async with httpx.AsyncClient(
+            timeout=PROBE_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.probe_concurrency),
+            transport=transport,
+        ) as client:
+            self._probe_client = client
+            try:
+                await asyncio.gather(*(self._probe(url) for url in urls))
+            finally:
+                self._probe_client = None
+
+    async def _probe(self, url: str) -> None:
+        # Budget and deadline are checked in URL order, before the first probe starts
+        if self._out_of_time():
+            return
+        if self.probes_left <= 0:
+            if not self.probe_budget_spent:
+                logger.warning("Discovery probe budget used up; skipping remaining probes")
+                self.probe_budget_spent = True
+            return
+        self.probes_left -= 1
+        self._probed[url] = await self._check_subdomain_exists(url)
+
+    async def _check_subdomain_exists(self, url: str) -> bool:
+        async with self._probe_slots:
+            try:
+                response = await self._probe_client.head(url)
+                if response.status_code < 400:
+                    return True
+                # Some sites block HEAD, try GET
+                if response.status_code == 405:  # Method Not Allowed
+                    async with self._probe_client.stream("GET", url) as response:  # Status only, body unread
+                        return response.status_code < 400
+            except Exception:
+                return False
         return False
 
     def _probe_corporate_pages(self, domain: str) -> List[Dict[str, str]]:
-        """Probe well-known corporate URL patterns for IR, newsroom, press."""
+        """
+        Probe well-known corporate URL patterns for IR, newsroom, press.
+
+        All patterns are probed at once; the first pattern (in list order)
+        that responds wins its type.
+        """
+        patterns = self._corporate_page_candidates(domain)
+        exists = self._probe_urls([url for url, _ in patterns])
+
+        seen_types = set()
+        found = []
+        for url, source_type in patterns:
+            if source_type in seen_types:
+                continue
+            if exists[url]:
+                logger.info(f"Discovered corporate page: {url} ({source_type})")
+                found.append({"url": url, "type": source_type})
+                seen_types.add(source_type)
+        return found
+
+    @staticmethod
+    def _corporate_page_candidates(domain: str) -> List[tuple]:
+        """(url, type) for the IR, newsroom and press patterns, in order of preference."""
         clean_domain = domain.replace("www.", "")
 
-        patterns = [
+        return [
             # Path-based
             (f"https://{clean_domain}/investors", "investor_relations"),
             (f"https://{clean_domain}/investor-relations", "investor_relations"),
@@ -266,17 +403,6 @@ class DiscoveryService:
             (f"https://ir.{clean_domain}", "investor_relations"),
         ]
 
-        seen_types = set()
-        found = []
-        for url, source_type in patterns:
-            if source_type in seen_types:
-                continue
-            if self._check_subdomain_exists(url):
-                logger.info(f"Discovered corporate page: {url} ({source_type})")
-                found.append({"url": url, "type": source_type})
-                seen_types.add(source_type)
-        return found
-
     def _search_news_articles(self, company_name: str) -> List[Dict[str, str]]:
         """Search for recent news articles about the company and AI."""
         wire_domains = ["businesswire.com", "prnewswire.com", "globenewswire.com"]
@@ -287,8 +413,10 @@ class DiscoveryService:
         query = f'{company_name} ("artificial intelligence" OR "AI" OR "machine learning") ({site_filter})'
 
         found = []
+        if self._out_of_time():
+            return found
         try:
-            results = list(search(query, num_results=5, advanced=True))
+            results = self._search(query, num_results=5)
             # Capture snippet text from all results
             for result in results:
                 snippet = f"{result.title}. {result.description}"
@@ -324,8 +452,10 @@ class DiscoveryService:
         ]
 
         for query in queries:
+            if self._out_of_time():
+                break
             try:
-                results = list(search(query, num_results=5, advanced=True))
+                results = self._search(query, num_results=5)
                 for result in results:
                     snippet = f"{result.title}. {result.description}"
                     if snippet.strip(". "):
@@ -354,7 +484,7 @@ class DiscoveryService:
         
         return candidates
 
-    def extract_ats_links(self, html: str) -> List[str]:
+    def extract_ats_links(self, html: Union[str, ParsedDocument]) -> List[str]:
         """Detect ATS providers (Greenhouse, Lever, Ashby, Workday) from HTML.
 
         Delegates to ATSDetector which scans both anchor tags and iframes.
@@ -380,9 +510,11 @@ class DiscoveryService:
         return self._perform_search(query, domain_filter=None, keyword_filter="careers")
 
     def _perform_search(self, query: str, domain_filter: Optional[str] = None, keyword_filter: Optional[str] = None) -> Optional[str]:
+        if self._out_of_time():
+            return None
         try:
             # num_results=3 is usually enough to find the top hit
-            results = list(search(query, num_results=3, advanced=True))
+            results = self._search(query, num_results=3)
 
             # Capture snippet text from ALL results (even ones we don't use as URLs)
             for result in results:
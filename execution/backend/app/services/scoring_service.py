@@ -1,25 +1,35 @@
 """Service for orchestrating company scoring."""
 
-from datetime import datetime
-from typing import Optional, Union
+import dataclasses
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, NamedTuple, Optional, Union
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from fastapi import BackgroundTasks
 
-from app.models.company import Company, Score
+from app.core.config import settings
+from app.models.company import Company, CompanySource, Score
 from app.models.enums import AIReadinessCategory
-from app.services.scrapers.orchestrator import ScraperOrchestrator
-from app.services.scrapers.ats_detector import ATSDetector
+from app.services.deadline import SCORING_STAGE_WEIGHTS, Deadline
+from app.services.snapshots import Snapshot, get_snapshot_store, load_latest_snapshots
+from app.services.scrapers.orchestrator import get_shared_orchestrator
+from app.services.scrapers.run import finish_scrape_run, start_scrape_run
+from app.services.scrapers.document import ParsedDocument
+from app.services.scrapers.frontier import CrawlFrontier, crawl
+from app.services.scrapers.structured_data import extract_from_pages
+from app.services.scrapers.types import ScraperResult, ScraperStrategy
+from app.services.scrapers.urls import canonical_url
 from app.services.scoring.calculator import ScoreCalculator, SignalData
 from app.services.scoring.model import get_category_label
 from app.schemas.scores import ScoreResponse, SignalResponse, ComponentScoresResponse, ScoringStatusResponse
-from bs4 import BeautifulSoup
 import asyncio
 import re
+import time
 from typing import Dict
-from urllib.parse import urljoin, urlparse
 import tldextract
 
 # Tiered AI keyword lists for quality-weighted analysis
@@ -80,6 +90,8 @@ AI_KEYWORD_TIERS = {
 # Source types that are news/press/IR (subject to recency weighting)
 NEWS_SOURCE_TYPES = {"news_article", "press_release", "investor_relations", "newsroom"}
 
+DEEP_SCRAPE_LIMIT = 5  # Job descriptions per company, from deep links or embedded postings
+
 _DATE_PATTERNS = [
     r'(\w+ \d{1,2},? \d{4})',
     r'(\d{4}-\d{2}-\d{2})',
@@ -100,7 +112,11 @@ def _estimate_recency_multiplier(text: str) -> float:
     Returns 1.0 for <=45 days, 0.5 for 45-90 days, 0.0 for >90 days.
     Falls back to 0.7 if no date found.
     """
-    now = datetime.now()
+    return _recency_multiplier(_latest_date(text))
+
+
+def _latest_date(text: str) -> Optional[datetime]:
+    """Most recent date (2020 or later) written in `text`, if any."""
     found_dates = []
     for pattern in _DATE_PATTERNS:
         matches = re.findall(pattern, text)
@@ -113,11 +129,14 @@ def _estimate_recency_multiplier(text: str) -> float:
                 except ValueError:
                     continue
 
-    if not found_dates:
+    return max(found_dates) if found_dates else None
+
+
+def _recency_multiplier(most_recent: Optional[datetime]) -> float:
+    if most_recent is None:
         return 0.7
 
-    most_recent = max(found_dates)
-    days_old = (now - most_recent).days
+    days_old = (datetime.now() - most_recent).days
 
     if days_old <= 45:
         return 1.0
@@ -127,6 +146,322 @@ def _estimate_recency_multiplier(text: str) -> float:
         return 0.0
 
 
+# Sources whose AI keywords count as engineering evidence
+ENG_KEYWORD_SOURCES = {"github", "engineering_blog", "job_posting", "job_posting_verified", "ats_link", "careers_fallback", "subdomain_engineering", "subdomain_dev"}
+
+# Comprehensive AI/ML tool detection — exact-match terms grouped by category.
+KNOWN_TOOLS = [
+    # Cloud ML Platforms
+    "sagemaker", "vertex ai", "bedrock", "azure ml", "azure openai",
+    "azure cognitive", "google cloud ai", "amazon q",
+    # Frameworks & Libraries
+    "pytorch", "tensorflow", "jax", "keras", "scikit-learn", "sklearn",
+    "xgboost", "lightgbm", "catboost", "onnx", "triton inference",
+    # LLM Providers & APIs
+    "openai", "anthropic", "cohere", "mistral", "groq",
+    "together ai", "fireworks ai", "replicate", "ollama", "perplexity",
+    # LLM Frameworks & Orchestration
+    "langchain", "langgraph", "langsmith", "llamaindex", "llama index",
+    "semantic kernel", "haystack", "dspy", "crewai", "autogen",
+    "model context protocol",
+    # Model Hubs & Pretrained
+    "huggingface", "hugging face", "transformers",
+    # MLOps & Experiment Tracking
+    "mlflow", "kubeflow", "wandb", "weights and biases", "weights & biases",
+    "neptune", "dvc", "dagshub", "prefect", "airflow",
+    "ray", "anyscale", "metaflow",
+    # Vector / AI Databases
+    "pinecone", "weaviate", "milvus", "qdrant", "chroma", "chromadb",
+    "pgvector", "faiss",
+    # Infrastructure & Cloud
+    "kubernetes", "aws", "gcp", "azure", "databricks", "snowflake",
+    "spark", "delta lake", "lakehouse",
+    # AI Dev Tools & Coding Assistants
+    "copilot", "cursor", "v0", "replit", "tabnine", "codeium",
+    "windsurf", "amazon codewhisperer",
+    # Specific Models & Products
+    "claude", "gemini", "llama", "stable diffusion",
+    "dall-e", "midjourney", "whisper",
+    # Observability & Evaluation
+    "langfuse", "helicone", "arize", "whylabs", "deepchecks",
+    # Code & Repo Hosting
+    "github",
+]
+
+# Regex patterns for versioned tool names (e.g., "GPT-4o", "Claude 3.5")
+TOOL_REGEXES = [
+    (r'\bgpt-?\d', "openai"),          # GPT-4, GPT-3.5, GPT4o
+    (r'\bclaude[ -]?\d', "anthropic"),  # Claude 3, Claude-3.5
+    (r'\bgemini[ -]?\d', "gemini"),     # Gemini 1.5, Gemini-Pro
+    (r'\bllama[ -]?\d', "llama"),       # Llama 2, Llama-3
+    (r'\bmistral[ -]?\d', "mistral"),   # Mistral 7B, Mistral-Large
+    (r'\bstable diffusion', "stable diffusion"),
+    (r'\bdall-?e', "dall-e"),
+]
+
+# Agentic signals: infrastructure-level (chaos engineering, self-healing) and
+# product-level (AI-powered automation, workflow, AI assistant) patterns.
+INFRA_AGENTIC_TERMS = ["autonomous", "chaos monkey", "spinnaker", "self-healing", "chaos engineering"]
+PRODUCT_AGENTIC_TERMS = ["ai-powered", "ai powered", "ai assistant", "ai copilot", "automate", "automation", "automated workflow"]
+# Context implying orchestration or AI-friendly documentation boosts a segment
+AGENTIC_BOOST_TERMS = [
+    "langchain", "autogen", "agentic", "orchestration",
+    "llm-ready", "llm ready", "ai-friendly documentation",
+    "agent-friendly", "machine-readable documentation",
+    "ai-optimized documentation", "llm-friendly",
+    "ai agent documentation", "documentation for ai",
+    "model context protocol", "mcp server",
+]
+
+NON_ENG_ROLE_TYPES = [
+    "product_role", "marketing_role", "legal_role",
+    "operations_role", "design_role", "finance_role",
+    "hr_role", "sales_role",
+]
+# Tier 1: AI as competency/skill requirement (strong signal)
+# Language that says "you will USE AI" not just "we talk about AI"
+AI_COMPETENCY_TERMS = [
+    "proficiency with ai", "experience with ai", "familiarity with ai",
+    "ai tools", "ai-assisted", "ai-augmented", "leverage ai",
+    "prompt engineering", "ai literacy", "build prototypes",
+    "use ai to", "using ai", "work with ai", "ai fluency",
+    "llm", "copilot", "generative ai", "genai",
+    "ai-powered workflow", "ai-driven", "ai skills",
+    "chatgpt", "claude", "gemini",
+]
+# Tier 2: AI mentioned in context (weaker signal)
+# The JD references AI but not as a direct skill expectation
+AI_MENTIONED_TERMS = [
+    "artificial intelligence", "machine learning",
+    "automation", "data-driven", "predictive",
+    "agent", "orchestration", "nlp",
+]
+MID_MGMT_TERMS = ["manager", "senior", "lead", "principal", "counsel", "analyst"]
+EXEC_TERMS = ["vice president", "vp ", "chief ", "cto", "cfo", "coo", "head of", "director"]
+
+# Google snippets: non-eng role titles co-occurring with AI terms on one line
+NON_ENG_ROLE_TITLES = [
+    "product manager", "program manager", "project manager",
+    "legal", "counsel", "compliance", "finance", "financial",
+    "marketing", "design", "communications", "operations",
+    "hr ", "human resources", "sales",
+]
+AI_TERMS_FOR_ROLES = [
+    "ai", "artificial intelligence", "machine learning",
+    "generative ai", "genai", "llm", "ml ",
+    "prompt engineering", "ai tools", "ai skills",
+]
+
+# Tool weight by source type (a tool counts once, at its best source's weight)
+SOURCE_WEIGHTS = {
+    "github": 2.0,
+    "engineering_blog": 1.5,
+    "job_posting": 2.0, # High - verified hiring intent (Story 4.3 AC3)
+    "homepage": 0.5,
+    "conference_speaking": 1.0,
+    "job_posting_verified": 2.0, # High (Story 4.3 ATS-detected)
+    "careers_fallback": 1.5, # Medium-High (Story 4.3)
+    "ats_link": 2.0,
+    "subdomain_ai": 2.0, # High (Story 4.4)
+    "subdomain_research": 2.0, # High
+    "subdomain_engineering": 1.5,
+    "subdomain_dev": 1.5,
+    "subdomain_cloud": 1.5,
+    "news_article": 0.75,
+    "press_release": 0.75,
+    "investor_relations": 1.0, # Public commitments to investors
+    "newsroom": 0.75,
+    "google_snippets": 0.75, # Search result titles + descriptions
+    # Non-eng role types (treat like job postings for tool weighting)
+    "product_role": 1.5,
+    "marketing_role": 1.0,
+    "legal_role": 1.0,
+    "operations_role": 1.0,
+    "design_role": 1.0,
+    "finance_role": 1.0,
+    "hr_role": 1.0,
+    "sales_role": 1.0,
+    "careers_ai_keyword_hit": 1.5, # Found via AI keyword search on careers
+}
+
+# AI Platform Provider Detection
+# Companies that BUILD and PROVIDE AI tools/platforms to others are
+# benchmark transformational companies (e.g., Google, Anthropic, OpenAI).
+# Detection: AI-focused sources contain provider-language content — signs
+# the company ships AI products for external use, not just uses AI internally.
+AI_PROVIDER_INDICATORS = [
+    "our api", "our sdk", "our model", "our platform",
+    "api reference", "api documentation",
+    "developer documentation", "developer console",
+    "ai studio", "ai platform", "model api",
+    "inference api", "inference endpoint",
+    "fine-tune", "fine tuning", "model deployment",
+    "playground", "model serving", "deploy model",
+    "foundation model", "large language model",
+    "embed our", "build with our", "integrate with our",
+]
+# subdomain_ai is the strongest signal; engineering_blog and homepage
+# can also contain product descriptions for AI platform companies.
+AI_FOCUSED_TYPES = {"subdomain_ai", "subdomain_dev", "subdomain_cloud", "engineering_blog"}
+
+
+@dataclass
+class SegmentFeatures:
+    """
+    What signal extraction reads from one source type's text.
+
+    Features of two documents merge into the features of their "\\n"-joined
+    text: every term and regex match stays within a line, so counts add up,
+    presence checks OR together and the recency date is the later one. That
+    lets each page be analyzed as soon as it is scraped.
+    """
+
+    tier_matches: Counter = field(default_factory=Counter)  # AI keyword tier -> matches
+    latest_date: Optional[datetime] = None  # News types only
+    exact_tools: set = field(default_factory=set)
+    regex_tools: set = field(default_factory=set)  # Canonical names of versioned tools
+    agentic: int = 0
+    agentic_boost: bool = False
+    ai_competency: bool = False  # Non-eng role types only, like the next three
+    ai_mention: bool = False
+    mid_mgmt: bool = False
+    exec_role: bool = False
+    snippet_role_ai: bool = False  # google_snippets only
+    mentions_platform: bool = False
+    mentions_ai: bool = False
+    provider_indicators: set = field(default_factory=set)  # AI-focused types only
+
+    def merge(self, other: "SegmentFeatures") -> "SegmentFeatures":
+        dates = [d for d in (self.latest_date, other.latest_date) if d is not None]
+        return SegmentFeatures(
+            tier_matches=self.tier_matches + other.tier_matches,
+            latest_date=max(dates) if dates else None,
+            exact_tools=self.exact_tools | other.exact_tools,
+            regex_tools=self.regex_tools | other.regex_tools,
+            agentic=self.agentic + other.agentic,
+            agentic_boost=self.agentic_boost or other.agentic_boost,
+            ai_competency=self.ai_competency or other.ai_competency,
+            ai_mention=self.ai_mention or other.ai_mention,
+            mid_mgmt=self.mid_mgmt or other.mid_mgmt,
+            exec_role=self.exec_role or other.exec_role,
+            snippet_role_ai=self.snippet_role_ai or other.snippet_role_ai,
+            mentions_platform=self.mentions_platform or other.mentions_platform,
+            mentions_ai=self.mentions_ai or other.mentions_ai,
+            provider_indicators=self.provider_indicators | other.provider_indicators,
+        )
+
+
+def _analyze_document(source_type: str, text: str) -> SegmentFeatures:
+    """Signal features of one document of `source_type` (the per-page CPU work)."""
+    text_lower = text.lower()
+    features = SegmentFeatures()
+
+    # 1. AI Keywords — Tiered Analysis
+    for tier_name, tier_config in AI_KEYWORD_TIERS.items():
+        term_count = sum(text_lower.count(term) for term in tier_config["terms"])
+        regex_count = sum(len(re.findall(pat, text_lower)) for pat in tier_config.get("regexes", []))
+        features.tier_matches[tier_name] = term_count + regex_count
+
+    # Recency multiplier for news-type sources
+    if source_type in NEWS_SOURCE_TYPES:
+        features.latest_date = _latest_date(text_lower)
+
+    # 2. Tool Stack Detection
+    features.exact_tools = {tool for tool in KNOWN_TOOLS if tool in text_lower}
+    features.regex_tools = {name for pattern, name in TOOL_REGEXES if re.search(pattern, text_lower)}
+
+    # 3. Agentic Signals
+    features.agentic = sum(text_lower.count(t) for t in INFRA_AGENTIC_TERMS)
+    features.agentic += sum(text_lower.count(t) for t in PRODUCT_AGENTIC_TERMS)
+    # "agent" counted separately — common in both infra and product contexts
+    features.agentic += text_lower.count("agent")
+    features.agentic_boost = any(t in text_lower for t in AGENTIC_BOOST_TERMS)
+
+    # 4. Non-Engineering AI Roles
+    if source_type in NON_ENG_ROLE_TYPES or source_type == "careers_ai_keyword_hit":
+        features.ai_competency = any(k in text_lower for k in AI_COMPETENCY_TERMS)
+        features.ai_mention = any(k in text_lower for k in AI_MENTIONED_TERMS)
+        features.mid_mgmt = any(t in text_lower for t in MID_MGMT_TERMS)
+        features.exec_role = any(t in text_lower for t in EXEC_TERMS)
+
+    # Google Snippets: check each sentence/snippet line for role+AI co-occurrence
+    if source_type == "google_snippets":
+        features.snippet_role_ai = any(
+            any(r in line for r in NON_ENG_ROLE_TITLES) and any(a in line for a in AI_TERMS_FOR_ROLES)
+            for line in text_lower.split("\n")
+        )
+
+    # Platform Team
+    features.mentions_platform = "platform" in text_lower
+    features.mentions_ai = "ai" in text_lower
+
+    if source_type in AI_FOCUSED_TYPES:
+        features.provider_indicators = {ind for ind in AI_PROVIDER_INDICATORS if ind in text_lower}
+
+    return features
+
+
+class _Page(NamedTuple):
+    """A scraped text waiting for analysis."""
+
+    order: tuple  # (stage rank, index): aggregation order, whatever order scrapes finish in
+    url: Optional[str]
+    source_type: Optional[str]  # None: classify the page by URL and content
+    text: str
+    fetched_at: Optional[datetime]
+
+
+class _AnalysisPipeline:
+    """
+    Classifies and analyzes scraped pages while the rest are still downloading.
+
+    Stages hand over each page as its scrape finishes; a consumer task takes
+    them off the queue in between network waits. `finish` merges the
+    per-page features by source type in page order, so the result is the
+    same as analyzing every stage's text once at the end.
+    """
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._analyzed: dict[tuple, tuple[_Page, SegmentFeatures]] = {}
+        self._task = asyncio.create_task(self._consume())
+
+    def add(self, order: tuple, url: Optional[str], source_type: Optional[str], text: str, fetched_at: Optional[datetime]) -> None:
+        self._queue.put_nowait(_Page(order, url, source_type, text, fetched_at))
+
+    def add_result(self, order: tuple, url: str, source_type: Optional[str], result: ScraperResult) -> None:
+        """Queue a successful scrape; an ATS board goes in job by job, each classified on its own."""
+        if result.postings:
+            for j, posting in enumerate(result.postings):
+                text = f"{posting.title}\n{posting.extracted_text}" if posting.title else posting.extracted_text
+                if text:
+                    self.add((*order, j), posting.url, source_type, text, result.scraped_at)
+        elif result.extracted_text:
+            self.add(order, url, source_type, result.extracted_text, result.scraped_at)
+
+    async def _consume(self) -> None:
+        from app.utils.source_detection import detect_source_type
+        while (page := await self._queue.get()) is not None:
+            source_type = page.source_type or detect_source_type(page.url, page.text)
+            self._analyzed[page.order] = (page._replace(source_type=source_type), _analyze_document(source_type, page.text))
+            await asyncio.sleep(0)  # Let finished downloads be handled between pages
+
+    async def finish(self) -> tuple[Dict[str, SegmentFeatures], list[Snapshot]]:
+        """Features per source type and the analyzed documents, once every page is in."""
+        self._queue.put_nowait(None)
+        await self._task
+        segments: Dict[str, SegmentFeatures] = {}
+        documents = []
+        for order in sorted(self._analyzed):
+            page, features = self._analyzed[order]
+            segments[page.source_type] = segments[page.source_type].merge(features) if page.source_type in segments else features
+            documents.append(Snapshot(page.url, page.source_type, page.fetched_at, page.text))
+        return segments, documents
+
+    def cancel(self) -> None:
+        self._task.cancel()
+
+
 def _normalize_component_scores(raw: dict) -> dict:
     """Normalize legacy component score keys from DB data."""
     normalized = dict(raw)
@@ -140,7 +475,7 @@ def _normalize_component_scores(raw: dict) -> dict:
 class ScoringService:
     def __init__(self, db: Session):
         self.db = db
-        self.scraper = ScraperOrchestrator()
+        self.scraper = get_shared_orchestrator()
         self.calculator = ScoreCalculator()
 
     async def check_or_start_scoring(self, url: str, background_tasks: BackgroundTasks) -> Union[ScoreResponse, ScoringStatusResponse]:
@@ -229,14 +564,22 @@ class ScoringService:
 
         log_trace("Starting scoring", {"url": url, "company": company_name})
 
+        # Per-job time budget, shared out across the stages below
+        deadline = Deadline(settings.SCORING_BUDGET_SECONDS, SCORING_STAGE_WEIGHTS)
+
         # 2. Discovery (Run first to allow broad scraping)
         from app.services.discovery import DiscoveryService
         from app.models.company import CompanySource
         
         discovery = DiscoveryService()
         log_trace("DiscoveryService: Finding sources")
-        # Run synchronous blocking search in a separate thread
+        # Run synchronous blocking search in a separate thread; it can't be
+        # cancelled, so it checks its own deadline between searches/probes
+        discovery_budget = deadline.begin("discovery")
+        if discovery_budget is not None:
+            discovery.deadline_at = time.monotonic() + discovery_budget
         discovered_sources = await asyncio.to_thread(discovery.find_sources, company_name, root_domain)
+        deadline.end("discovery", truncated=discovery.truncated)
         log_trace("DiscoveryService Results", {"count": len(discovered_sources), "sources": [s['url'] for s in discovered_sources]})
         print(f"Discovered {len(discovered_sources)} potential sources: {[s['url'] for s in discovered_sources]}")
 
@@ -267,20 +610,30 @@ class ScoringService:
                           discovered_sources.append({"url": s.url, "type": s.source_type})
 
         # 3. Scrape Main URL
+        # Per-job scrape counters (cache hits etc.), reported in the trace
+        scrape_run, scrape_run_token = start_scrape_run()
+        # Each scraped text is classified and analyzed as soon as it arrives
+        pipeline = _AnalysisPipeline()
         try:
-            scrape_result = await self.scraper.scrape(url)
+            scrape_result = await deadline.run("homepage", self.scraper.scrape(url))
+            if scrape_result is None:
+                scrape_result = self._deadline_skipped(url, "homepage")
             
-            # Collect text segments for analysis
-            text_segments = {}
+            source_results = {}  # Source URL -> scrape result, for stored validators
+            listing_pages = []  # (url, document, fetched_at) searched for embedded job postings
+            
+            # Parsed once; ATS detection, job link finding and emergency crawl all read it
+            homepage_doc = scrape_result.parsed_document() if scrape_result.success else None
             
             if not scrape_result.success:
                 # ... existing error handling ...
                 print(f"Scrape failed for {url}")
             else:
-                text_segments["homepage"] = scrape_result.extracted_text or ""
+                pipeline.add((0, 0), url, "homepage", scrape_result.extracted_text or "", scrape_result.scraped_at)
+                listing_pages.append((url, homepage_doc, scrape_result.scraped_at))
                 
                 # Story 4.3: Detect ATS Links (Greenhouse, Lever, etc.)
-                ats_links = discovery.extract_ats_links(scrape_result.raw_html)
+                ats_links = discovery.extract_ats_links(homepage_doc)
                 if ats_links:
                     print(f"Found {len(ats_links)} ATS links (High Confidence): {ats_links}")
                     for link in ats_links:
@@ -290,32 +643,51 @@ class ScoringService:
 
             # 4. Scrape Discovered Sources (Satellite Strategy)
             if discovered_sources:
-                from app.utils.source_detection import detect_source_type
                 print(f"Deep scraping {len(discovered_sources)} satellite sources...")
-                tasks = [self.scraper.scrape(src["url"]) for src in discovered_sources]
-                satellite_results = await asyncio.gather(*tasks)
+                satellites = list(discovered_sources)
 
-                for i, res in enumerate(satellite_results):
-                    if res.success and res.extracted_text:
-                        source_type = discovered_sources[i]['type']
+                def on_satellite(i: int, res: ScraperResult) -> None:
+                    if res.success:
+                        source_type = satellites[i]['type']
                         # Re-classify ATS/job links by department using actual content.
                         # A PM role on Greenhouse should be product_role, not job_posting_verified.
                         if source_type in ("job_posting_verified", "job_posting"):
-                            source_type = detect_source_type(discovered_sources[i]['url'], res.extracted_text)
-                        if source_type in text_segments:
-                             text_segments[source_type] += "\n" + res.extracted_text
-                        else:
-                             text_segments[source_type] = res.extracted_text
+                            source_type = None
+                        pipeline.add_result((1, i), satellites[i]["url"], source_type, res)
 
+                satellite_results = await self._scrape_stage(
+                    deadline, "satellites", [src["url"] for src in satellites], on_result=on_satellite
+                )
+                for i, res in enumerate(satellite_results):
+                    source_results[satellites[i]["url"]] = res
+                    if res.success:
+                        listing_pages.append((satellites[i]["url"], res.parsed_document(), res.scraped_at))
+
+            # 4b. Job postings embedded as structured data (JSON-LD JobPosting, __NEXT_DATA__)
+            # Each one is a full job description we don't have to fetch in the deep scrape
+            # (A posting without a URL of its own shares its listing page's canonical URL: always kept)
+            scraped = {canonical_url(page_url) for page_url, _, _ in listing_pages}
+            embedded_postings = [
+                p for p in extract_from_pages(listing_pages)
+                if not p.has_own_url or canonical_url(p.url) not in scraped
+            ]
+            for i, posting in enumerate(embedded_postings):
+                pipeline.add((2, i), posting.url, None, posting.text, posting.fetched_at)
+            
             # 5. Deep Scrape (Internal Job Links)
-            deep_links = self._find_job_links(scrape_result.raw_html if scrape_result.success else "", url)
+            deep_links = self._find_job_links(homepage_doc, url)
             log_trace("Deep Scrape: Finding job links", {"count": len(deep_links)})
             
             # Story 4.4: Scan for high-signal subdomains (ai.*, research.*)
             # We do this asynchronously or simply just before deep scraping
             print("Scanning for high-signal subdomains...")
             log_trace("Scanning subdomains")
-            subdomains = discovery.discover_subdomains(company_name, root_domain)
+            # find_sources already probed these (memoized); only scrape ones not yet scraped
+            already_scraped = {canonical_url(src["url"]) for src in discovered_sources}
+            subdomains = [
+                s for s in await asyncio.to_thread(discovery.discover_subdomains, company_name, root_domain)
+                if canonical_url(s["url"]) not in already_scraped
+            ]
             if subdomains:
                 log_trace(f"Found {len(subdomains)} subdomains", [s['url'] for s in subdomains])
                 print(f"Found {len(subdomains)} subdomains: {[s['url'] for s in subdomains]}")
@@ -325,44 +697,54 @@ class ScoringService:
                 
                 # Re-trigger scraping for NEWLY found subdomains
                 # Filter out ones we already scraped (unlikely as we just found them)
-                new_tasks = [self.scraper.scrape(src["url"]) for src in subdomains]
-                new_results = await asyncio.gather(*new_tasks)
-                
+                def on_subdomain(i: int, res: ScraperResult) -> None:
+                    if res.success:
+                        pipeline.add_result((3, i), subdomains[i]["url"], subdomains[i]['type'], res)
+
+                new_results = await self._scrape_stage(
+                    deadline, "subdomains", [src["url"] for src in subdomains], on_result=on_subdomain
+                )
                 for i, res in enumerate(new_results):
-                    if res.success and res.extracted_text:
-                        src_type = subdomains[i]['type']
-                        if src_type in text_segments:
-                             text_segments[src_type] += "\n" + res.extracted_text
-                        else:
-                             text_segments[src_type] = res.extracted_text
+                    source_results[subdomains[i]["url"]] = res
 
             # Story 4.3 AC2: Emergency Crawl — if discovery failed and we have few job links,
             # do a deeper crawl to find more job pages
-            if discovery.search_failed and len(deep_links) < 3 and scrape_result.success:
+            if (
+                discovery.search_failed and len(deep_links) < 3 and scrape_result.success
+                and len(embedded_postings) < DEEP_SCRAPE_LIMIT
+            ):
                 print("Emergency Crawl: Discovery failed, expanding job link search...")
-                emergency_links = await self._emergency_crawl(url, scrape_result.raw_html, depth=2)
-                # Merge, dedup
-                existing = set(deep_links)
-                for link in emergency_links:
-                    if link not in existing:
-                        deep_links.append(link)
-                        existing.add(link)
-                print(f"Emergency Crawl found {len(emergency_links)} additional links (total: {len(deep_links)})")
-
-            if deep_links:
-                from app.utils.source_detection import detect_source_type
-                scrape_count = min(len(deep_links), 5)  # Scrape up to 5 in emergency mode
+                emergency_links = await deadline.run(
+                    "emergency_crawl", self._emergency_crawl(url, homepage_doc, depth=2), default=[]
+                )
+                # The crawl ranked the homepage's links along with the ones it found: its order goes first
+                crawled = set(emergency_links)
+                deep_links = emergency_links + [link for link in deep_links if link not in crawled]
+                print(f"Emergency Crawl found {len(emergency_links)} links (total: {len(deep_links)})")
+
+            # Embedded postings fill the deep scrape's quota, and their own pages are never fetched
+            planned = min(len(deep_links), DEEP_SCRAPE_LIMIT)
+            embedded_urls = {canonical_url(p.url) for p in embedded_postings if p.has_own_url}
+            deep_links = [link for link in deep_links if canonical_url(link) not in embedded_urls]
+            scrape_count = min(len(deep_links), max(0, DEEP_SCRAPE_LIMIT - len(embedded_postings)))
+            if embedded_postings:
+                scrape_run.record("deep_fetches_avoided", planned - scrape_count)
+                log_trace("Embedded job postings", {
+                    "postings": len(embedded_postings),
+                    "json_ld": sum(p.source == "json-ld" for p in embedded_postings),
+                    "next_data": sum(p.source == "next-data" for p in embedded_postings),
+                    "deep_fetches_avoided": planned - scrape_count,
+                })
+                print(f"Found {len(embedded_postings)} embedded job postings, {planned - scrape_count} deep fetches avoided")
+
+            if scrape_count:
                 print(f"Found {len(deep_links)} potential job links. Deep scraping top {scrape_count}...")
-                tasks = [self.scraper.scrape(link) for link in deep_links[:scrape_count]]
-                deep_results = await asyncio.gather(*tasks)
-
-                for i, dr in enumerate(deep_results):
-                        if dr.success and dr.extracted_text:
-                            source_type = detect_source_type(deep_links[i], dr.extracted_text)
-                            if source_type in text_segments:
-                                text_segments[source_type] += "\n" + dr.extracted_text
-                            else:
-                                text_segments[source_type] = dr.extracted_text
+
+                def on_deep_result(i: int, dr: ScraperResult) -> None:
+                    if dr.success:
+                        pipeline.add_result((4, i), deep_links[i], None, dr)
+
+                await self._scrape_stage(deadline, "deep_scrape", deep_links[:scrape_count], on_result=on_deep_result)
             
             # 5b. Inject Google search snippets as a signal source.
             # Discovery captures .title + .description from every Google query.
@@ -370,15 +752,16 @@ class ScoringService:
             # that may not appear on the pages we scrape.
             if discovery.collected_snippets:
                 snippet_text = "\n".join(discovery.collected_snippets)
-                text_segments["google_snippets"] = snippet_text
+                pipeline.add((5, 0), None, "google_snippets", snippet_text, datetime.now(timezone.utc))
                 log_trace("Google snippets collected", {
                     "count": len(discovery.collected_snippets),
                     "chars": len(snippet_text),
                 })
                 print(f"Collected {len(discovery.collected_snippets)} Google search snippets ({len(snippet_text)} chars)")
 
-            # 6. Extract & Calculate
-            signals = self._extract_signals_heuristically(text_segments)
+            # 6. Extract & Calculate (every page is analyzed already; this only aggregates)
+            segments, documents = await pipeline.finish()
+            signals = self._signals_from_features(segments)
 
             score_result = self.calculator.calculate(company_name, signals)
             
@@ -396,6 +779,20 @@ class ScoringService:
                 company = self._get_or_create_company(company_name, root_domain, url)
                 
                 # Story 4.5: Save trace
+                log_trace("Deadline budget", deadline.summary())
+                log_trace("URL deduplication", {
+                    "unique_urls": len(scrape_run.results),
+                    "coalesced_in_flight": scrape_run.stats["dedup_inflight"],
+                    "reused_in_run": scrape_run.stats["dedup_run"],
+                })
+                log_trace("Scrape stats", dict(scrape_run.stats))
+                if scrape_run.stats["text_bytes_full"]:
+                    full, main = scrape_run.stats["text_bytes_full"], scrape_run.stats["text_bytes_main"]
+                    log_trace("Main-content extraction", {
+                        "bytes_before": full,
+                        "bytes_after": main,
+                        "reduction_pct": round(100 * (1 - main / full), 1),
+                    })
                 log_trace("Scoring Complete", {"score": score_data["score"]})
                 company.discovery_trace = {"steps": trace_steps}
                 self.db.add(company)
@@ -403,19 +800,21 @@ class ScoringService:
                 # Save sources
                 for src in discovered_sources:
                     # Check duplicate? simplistic check
-                    exists = False
+                    source = None
                     for existing in company.sources:
                         if existing.url == src["url"]:
-                            exists = True
+                            source = existing
                             break
                     
-                    if not exists:
-                        new_source = CompanySource(
+                    if source is None:
+                        source = CompanySource(
                             company_id=company.id,
                             url=src["url"],
                             source_type=src["type"]
                         )
-                        self.db.add(new_source)
+                        self.db.add(source)
+                    if src["url"] in source_results:
+                        self._record_source_validators(source, source_results[src["url"]])
                 
                 score_record = Score(
                     company_id=company.id,
@@ -423,7 +822,8 @@ class ScoringService:
                     category=score_data["category"],
                     signals=score_data["signals"],
                     component_scores=score_data["component_scores"],
-                    evidence=score_data["evidence"]
+                    evidence=score_data["evidence"],
+                    snapshot_id=self._save_snapshots(documents),
                 )
                 self.db.add(score_record)
                 self.db.commit()
@@ -433,6 +833,7 @@ class ScoringService:
                     update_job(job_id, "completed", company_name=company_name)
 
         except Exception as e:
+            pipeline.cancel()
             print(f"Error in background scoring task for {url}: {e}", flush=True)
             if job_id:
                 update_job(job_id, "failed", error=str(e))
@@ -441,6 +842,8 @@ class ScoringService:
                     f.write(f"Error for {url}: {e}\n")
             except:
                 pass
+        finally:
+            finish_scrape_run(scrape_run_token)
 
 
     def _get_or_create_company(self, name: str, domain: str, url: str) -> Company:
@@ -503,7 +906,13 @@ class ScoringService:
         """
         Extract signals from segmented text sources to allow weighting and attribution.
         """
-        
+        return self._signals_from_features({
+            source_type: _analyze_document(source_type, text) for source_type, text in text_segments.items()
+        })
+
+    def _signals_from_features(self, segments: Dict[str, SegmentFeatures]) -> SignalData:
+        """Aggregate per-source-type features (see SegmentFeatures) into signals."""
+
         # Initialize tracking
         sources_map = {
             "ai_keywords": [],
@@ -511,8 +920,7 @@ class ScoringService:
             "agentic_signals": [],
             "non_eng_ai_roles": []
         }
-        
-        eng_keyword_sources = {"github", "engineering_blog", "job_posting", "job_posting_verified", "ats_link", "careers_fallback", "subdomain_engineering", "subdomain_dev"}
+
         non_eng_keywords = 0
         eng_ai_keywords = 0
         ai_success_points = 0
@@ -522,74 +930,17 @@ class ScoringService:
         agentic_count = 0
         non_eng_score = 0
         has_platform_team = False
+        # To handle max-weight per tool, we need to defer tool counting
+        tool_max_weights = {} # tool -> max_weight
 
-        # Comprehensive AI/ML tool detection — exact-match terms grouped by category.
-        # Defined here so both analyze_segment and weighted-tool calculation can use it.
-        known_tools = [
-            # Cloud ML Platforms
-            "sagemaker", "vertex ai", "bedrock", "azure ml", "azure openai",
-            "azure cognitive", "google cloud ai", "amazon q",
-            # Frameworks & Libraries
-            "pytorch", "tensorflow", "jax", "keras", "scikit-learn", "sklearn",
-            "xgboost", "lightgbm", "catboost", "onnx", "triton inference",
-            # LLM Providers & APIs
-            "openai", "anthropic", "cohere", "mistral", "groq",
-            "together ai", "fireworks ai", "replicate", "ollama", "perplexity",
-            # LLM Frameworks & Orchestration
-            "langchain", "langgraph", "langsmith", "llamaindex", "llama index",
-            "semantic kernel", "haystack", "dspy", "crewai", "autogen",
-            "model context protocol",
-            # Model Hubs & Pretrained
-            "huggingface", "hugging face", "transformers",
-            # MLOps & Experiment Tracking
-            "mlflow", "kubeflow", "wandb", "weights and biases", "weights & biases",
-            "neptune", "dvc", "dagshub", "prefect", "airflow",
-            "ray", "anyscale", "metaflow",
-            # Vector / AI Databases
-            "pinecone", "weaviate", "milvus", "qdrant", "chroma", "chromadb",
-            "pgvector", "faiss",
-            # Infrastructure & Cloud
-            "kubernetes", "aws", "gcp", "azure", "databricks", "snowflake",
-            "spark", "delta lake", "lakehouse",
-            # AI Dev Tools & Coding Assistants
-            "copilot", "cursor", "v0", "replit", "tabnine", "codeium",
-            "windsurf", "amazon codewhisperer",
-            # Specific Models & Products
-            "claude", "gemini", "llama", "stable diffusion",
-            "dall-e", "midjourney", "whisper",
-            # Observability & Evaluation
-            "langfuse", "helicone", "arize", "whylabs", "deepchecks",
-            # Code & Repo Hosting
-            "github",
-        ]
-        known_tools_set = set(known_tools)
-
-        # Regex patterns for versioned tool names (e.g., "GPT-4o", "Claude 3.5")
-        _tool_regexes = [
-            (r'\bgpt-?\d', "openai"),          # GPT-4, GPT-3.5, GPT4o
-            (r'\bclaude[ -]?\d', "anthropic"),  # Claude 3, Claude-3.5
-            (r'\bgemini[ -]?\d', "gemini"),     # Gemini 1.5, Gemini-Pro
-            (r'\bllama[ -]?\d', "llama"),       # Llama 2, Llama-3
-            (r'\bmistral[ -]?\d', "mistral"),   # Mistral 7B, Mistral-Large
-            (r'\bstable diffusion', "stable diffusion"),
-            (r'\bdall-?e', "dall-e"),
-        ]
-
-        # Helper to analyze a segment
-        def analyze_segment(source_type: str, text: str):
-            nonlocal non_eng_keywords, eng_ai_keywords, agentic_count, non_eng_score, has_platform_team
-            nonlocal ai_success_points, ai_plan_points, ai_generic_points
-            text_lower = text.lower()
-
+        for source_type, features in segments.items():
             # 1. AI Keywords — Tiered Analysis
             seg_success = 0
             seg_plan = 0
             seg_generic = 0
 
             for tier_name, tier_config in AI_KEYWORD_TIERS.items():
-                term_count = sum(text_lower.count(term) for term in tier_config["terms"])
-                regex_count = sum(len(re.findall(pat, text_lower)) for pat in tier_config.get("regexes", []))
-                tier_points = (term_count + regex_count) * tier_config["points_per_match"]
+                tier_points = features.tier_matches[tier_name] * tier_config["points_per_match"]
 
                 if tier_name == "success":
                     seg_success += tier_points
@@ -600,7 +951,7 @@ class ScoringService:
 
             # Recency multiplier for news-type sources
             if source_type in NEWS_SOURCE_TYPES:
-                multiplier = _estimate_recency_multiplier(text_lower)
+                multiplier = _recency_multiplier(features.latest_date)
                 seg_success = int(seg_success * multiplier)
                 seg_plan = int(seg_plan * multiplier)
                 seg_generic = int(seg_generic * multiplier)
@@ -610,7 +961,7 @@ class ScoringService:
                 sources_map["ai_keywords"].append(source_type)
 
             # Route keywords to engineering or non-engineering bucket
-            if source_type in eng_keyword_sources:
+            if source_type in ENG_KEYWORD_SOURCES:
                 eng_ai_keywords += segment_keywords
             else:
                 non_eng_keywords += segment_keywords
@@ -619,44 +970,27 @@ class ScoringService:
             ai_success_points += seg_success
             ai_plan_points += seg_plan
             ai_generic_points += seg_generic
-                
-            # 2. Tool Stack Detection
-            # Uses known_tools and _tool_regexes defined in parent scope.
 
-            # Exact-match detection
-            for tool in known_tools:
-                if tool in text_lower:
-                    if tool not in tools_found:
-                        tools_found.add(tool)
-                        sources_map["tool_stack"].append(source_type)
+            # 2. Tool Stack Detection (first source to mention a tool gets the attribution)
+            for tool in KNOWN_TOOLS:
+                if tool in features.exact_tools and tool not in tools_found:
+                    tools_found.add(tool)
+                    sources_map["tool_stack"].append(source_type)
 
             # Regex-based detection for versioned tool names
-            for pattern, canonical_name in _tool_regexes:
-                if canonical_name not in tools_found and re.search(pattern, text_lower):
+            for _, canonical_name in TOOL_REGEXES:
+                if canonical_name not in tools_found and canonical_name in features.regex_tools:
                     tools_found.add(canonical_name)
                     sources_map["tool_stack"].append(source_type)
 
+            # Weighted tool count: each tool at its best source's weight
+            w = SOURCE_WEIGHTS.get(source_type, 0.5)
+            for tool in features.exact_tools | features.regex_tools:
+                if w > tool_max_weights.get(tool, 0.0):
+                    tool_max_weights[tool] = w
+
             # 3. Agentic Signals
-            # Covers both infrastructure-level (chaos engineering, self-healing) and
-            # product-level (AI-powered automation, workflow, AI assistant) agentic patterns.
-            infra_agentic_terms = ["autonomous", "chaos monkey", "spinnaker", "self-healing", "chaos engineering"]
-            product_agentic_terms = ["ai-powered", "ai powered", "ai assistant", "ai copilot", "automate", "automation", "automated workflow"]
-            segment_agentic = sum(text_lower.count(t) for t in infra_agentic_terms)
-            segment_agentic += sum(text_lower.count(t) for t in product_agentic_terms)
-            # "agent" counted separately — common in both infra and product contexts
-            segment_agentic += text_lower.count("agent")
-
-            # Boost if context implies orchestration or AI-friendly documentation
-            if any(t in text_lower for t in [
-                "langchain", "autogen", "agentic", "orchestration",
-                "llm-ready", "llm ready", "ai-friendly documentation",
-                "agent-friendly", "machine-readable documentation",
-                "ai-optimized documentation", "llm-friendly",
-                "ai agent documentation", "documentation for ai",
-                "model context protocol", "mcp server",
-            ]):
-                segment_agentic += 2
-                
+            segment_agentic = features.agentic + (2 if features.agentic_boost else 0)
             agentic_count += segment_agentic
             if segment_agentic > 0:
                  sources_map["agentic_signals"].append(source_type)
@@ -667,39 +1001,12 @@ class ScoringService:
             # management, finance) should show AI competency as a baseline expectation
             # at AI-ready companies. No free points for just finding the role —
             # points come from AI appearing as a SKILL REQUIREMENT in the JD.
-            non_eng_role_types = [
-                "product_role", "marketing_role", "legal_role",
-                "operations_role", "design_role", "finance_role",
-                "hr_role", "sales_role",
-            ]
-            if source_type in non_eng_role_types or source_type == "careers_ai_keyword_hit":
-                # Tier 1: AI as competency/skill requirement (strong signal)
-                # Language that says "you will USE AI" not just "we talk about AI"
-                ai_competency_terms = [
-                    "proficiency with ai", "experience with ai", "familiarity with ai",
-                    "ai tools", "ai-assisted", "ai-augmented", "leverage ai",
-                    "prompt engineering", "ai literacy", "build prototypes",
-                    "use ai to", "using ai", "work with ai", "ai fluency",
-                    "llm", "copilot", "generative ai", "genai",
-                    "ai-powered workflow", "ai-driven", "ai skills",
-                    "chatgpt", "claude", "gemini",
-                ]
-                # Tier 2: AI mentioned in context (weaker signal)
-                # The JD references AI but not as a direct skill expectation
-                ai_mentioned_terms = [
-                    "artificial intelligence", "machine learning",
-                    "automation", "data-driven", "predictive",
-                    "agent", "orchestration", "nlp",
-                ]
-
-                has_competency = any(k in text_lower for k in ai_competency_terms)
-                has_mention = any(k in text_lower for k in ai_mentioned_terms)
-
-                if has_competency:
+            if source_type in NON_ENG_ROLE_TYPES or source_type == "careers_ai_keyword_hit":
+                if features.ai_competency:
                     # Strong: JD expects AI competency as baseline
                     non_eng_score += 7
                     sources_map["non_eng_ai_roles"].append(source_type)
-                elif has_mention:
+                elif features.ai_mention:
                     # Weak: AI is referenced but not as a skill requirement
                     non_eng_score += 2
                     sources_map["non_eng_ai_roles"].append(source_type)
@@ -708,14 +1015,10 @@ class ScoringService:
                 # Seniority boost: reward MIDDLE MANAGEMENT (manager, senior, lead)
                 # over executives (VP, C-suite) — middle management is where
                 # AI-as-competency shows organizational readiness
-                if has_competency or has_mention:
-                    mid_mgmt_terms = ["manager", "senior", "lead", "principal", "counsel", "analyst"]
-                    exec_terms = ["vice president", "vp ", "chief ", "cto", "cfo", "coo", "head of", "director"]
-                    is_mid_mgmt = any(t in text_lower for t in mid_mgmt_terms)
-                    is_exec = any(t in text_lower for t in exec_terms)
-                    if is_mid_mgmt and not is_exec:
+                if features.ai_competency or features.ai_mention:
+                    if features.mid_mgmt and not features.exec_role:
                         non_eng_score += 3  # Middle management bonus
-            
+
             # Conference Speaking (New Source)
             if source_type == "conference_speaking":
                 # High value
@@ -729,98 +1032,27 @@ class ScoringService:
             # Snippets are short (title + description from search results) so we
             # look for co-occurrence of non-eng role titles with AI terms —
             # e.g. "Generative AI Product Manager" or "AI guidelines for legal".
-            if source_type == "google_snippets":
-                non_eng_role_titles = [
-                    "product manager", "program manager", "project manager",
-                    "legal", "counsel", "compliance", "finance", "financial",
-                    "marketing", "design", "communications", "operations",
-                    "hr ", "human resources", "sales",
-                ]
-                ai_terms_for_roles = [
-                    "ai", "artificial intelligence", "machine learning",
-                    "generative ai", "genai", "llm", "ml ",
-                    "prompt engineering", "ai tools", "ai skills",
-                ]
-                # Check each sentence/snippet line for role+AI co-occurrence
-                for line in text_lower.split("\n"):
-                    has_role = any(r in line for r in non_eng_role_titles)
-                    has_ai = any(a in line for a in ai_terms_for_roles)
-                    if has_role and has_ai:
-                        non_eng_score += 3
-                        sources_map["non_eng_ai_roles"].append("google_snippets")
-                        break  # One strong signal per snippet batch is enough
+            if source_type == "google_snippets" and features.snippet_role_ai:
+                non_eng_score += 3
+                sources_map["non_eng_ai_roles"].append("google_snippets")  # One strong signal per snippet batch is enough
 
             # Platform Team
-            if "platform" in text_lower and "ai" in text_lower:
+            if features.mentions_platform and features.mentions_ai:
                 has_platform_team = True
 
-        # Process all segments
-        # To handle max-weight per tool, we need to defer tool counting
-        tool_max_weights = {} # tool -> max_weight
-        
-        known_tools_set = set(known_tools)
-        weights_map = {
-             "github": 2.0,
-             "engineering_blog": 1.5,
-             "job_posting": 2.0, # High - verified hiring intent (Story 4.3 AC3)
-             "homepage": 0.5,
-             "conference_speaking": 1.0,
-             "job_posting_verified": 2.0, # High (Story 4.3 ATS-detected)
-             "careers_fallback": 1.5, # Medium-High (Story 4.3)
-             "ats_link": 2.0,
-             "subdomain_ai": 2.0, # High (Story 4.4)
-             "subdomain_research": 2.0, # High
-             "subdomain_engineering": 1.5,
-             "subdomain_dev": 1.5,
-             "subdomain_cloud": 1.5,
-             "news_article": 0.75,
-             "press_release": 0.75,
-             "investor_relations": 1.0, # Public commitments to investors
-             "newsroom": 0.75,
-             "google_snippets": 0.75, # Search result titles + descriptions
-             # Non-eng role types (treat like job postings for tool weighting)
-             "product_role": 1.5,
-             "marketing_role": 1.0,
-             "legal_role": 1.0,
-             "operations_role": 1.0,
-             "design_role": 1.0,
-             "finance_role": 1.0,
-             "hr_role": 1.0,
-             "sales_role": 1.0,
-             "careers_ai_keyword_hit": 1.5, # Found via AI keyword search on careers
-        }
-
-        for src_type, txt in text_segments.items():
-            analyze_segment(src_type, txt)
-            
-            # Separate pass for efficient max-weight calc
-            txt_lower = txt.lower()
-            w = weights_map.get(src_type, 0.5)
-            for tool in known_tools_set:
-                if tool in txt_lower:
-                    current_max = tool_max_weights.get(tool, 0.0)
-                    if w > current_max:
-                        tool_max_weights[tool] = w
-            # Also check regex patterns for weighted calc
-            for pattern, canonical_name in _tool_regexes:
-                if re.search(pattern, txt_lower):
-                    current_max = tool_max_weights.get(canonical_name, 0.0)
-                    if w > current_max:
-                        tool_max_weights[canonical_name] = w
-        
         # Calculate Weighted Tool Count
         weighted_tool_count = sum(tool_max_weights.values())
 
         # Confidence Score Calculation (AC4)
         # Based on number of distinct sources provided
-        distinct_sources = len(text_segments.keys())
+        distinct_sources = len(segments.keys())
         if distinct_sources >= 3:
             confidence = 1.0 # High
         elif distinct_sources == 2:
             confidence = 0.8 # Medium
         elif distinct_sources == 1:
              # If strictly only homepage, low
-             if "homepage" in text_segments:
+             if "homepage" in segments:
                  confidence = 0.5
              else:
                  confidence = 0.7 # Maybe a blog post only
@@ -841,37 +1073,12 @@ class ScoringService:
              marketing_only = True
 
         # Count news-type sources analyzed
-        news_sources_found = sum(1 for st in text_segments.keys() if st in NEWS_SOURCE_TYPES)
-
-        # AI Platform Provider Detection
-        # Companies that BUILD and PROVIDE AI tools/platforms to others are
-        # benchmark transformational companies (e.g., Google, Anthropic, OpenAI).
-        # Detection: AI-focused sources contain provider-language content — signs
-        # the company ships AI products for external use, not just uses AI internally.
-        ai_provider_indicators = [
-            "our api", "our sdk", "our model", "our platform",
-            "api reference", "api documentation",
-            "developer documentation", "developer console",
-            "ai studio", "ai platform", "model api",
-            "inference api", "inference endpoint",
-            "fine-tune", "fine tuning", "model deployment",
-            "playground", "model serving", "deploy model",
-            "foundation model", "large language model",
-            "embed our", "build with our", "integrate with our",
-        ]
-        # Check AI-focused source types for provider language.
-        # subdomain_ai is the strongest signal; engineering_blog and homepage
-        # can also contain product descriptions for AI platform companies.
-        ai_focused_types = {"subdomain_ai", "subdomain_dev", "subdomain_cloud", "engineering_blog"}
-        is_ai_platform_provider = False
-
-        for st in ai_focused_types:
-            if st in text_segments:
-                content = text_segments[st].lower()
-                provider_hits = sum(1 for ind in ai_provider_indicators if ind in content)
-                if provider_hits >= 3:
-                    is_ai_platform_provider = True
-                    break
+        news_sources_found = sum(1 for st in segments.keys() if st in NEWS_SOURCE_TYPES)
+
+        # AI Platform Provider Detection: AI-focused sources with provider language
+        is_ai_platform_provider = any(
+            len(segments[st].provider_indicators) >= 3 for st in AI_FOCUSED_TYPES if st in segments
+        )
 
         return SignalData(
             ai_keywords=non_eng_keywords,
@@ -881,7 +1088,7 @@ class ScoringService:
             ai_in_it_signals=min(eng_ai_keywords, 15),
             has_ai_platform_team=has_platform_team,
             is_ai_platform_provider=is_ai_platform_provider,
-            jobs_analyzed=len(text_segments),
+            jobs_analyzed=len(segments),
             source_attribution=sources_map,
             marketing_only=marketing_only,
             weighted_tool_count=weighted_tool_count,
@@ -892,100 +1099,127 @@ class ScoringService:
             news_sources_found=news_sources_found,
         )
 
-    def _find_job_links(self, html: str, base_url: str) -> list[str]:
-        """Parse HTML to find likely job posting links, including ATS embeds."""
+    def _find_job_links(self, html: Union[str, ParsedDocument, None], base_url: str) -> list[str]:
+        """Likely job posting links, including ATS embeds, in a page (HTML or parsed), best first."""
         if not html:
             return []
 
-        ats_detector = ATSDetector()
-        soup = BeautifulSoup(html, "html.parser")
-        links = set()
-
-        # Story 4.3 AC1: Capture ATS links (external job boards)
-        ats_links = ats_detector.extract_ats_links(html)
-        links.update(ats_links)
-
-        # Heuristic: Links containing "job", "career", "role", "detail" in href
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            full_url = urljoin(base_url, href)
-
-            # Skip non-http
-            if not full_url.startswith("http"):
-                continue
-
-            # Skip same page anchors
-            if full_url.split("#")[0] == base_url.split("#")[0]:
-                continue
-
-            # Simple keyword matching in URL or text
-            lower_href = href.lower()
-            lower_text = a.get_text().lower()
-
-            keywords = ["job", "career", "position", "role", "detail", "apply"]
-            if any(k in lower_href for k in keywords) or "job" in lower_text:
-                links.add(full_url)
-
-        # Filter for job-specific structure
-        filtered_links = []
-        for link in links:
-            # ATS links always pass through
-            if ats_detector.is_ats_url(link):
-                filtered_links.append(link)
-            elif "/job/" in link or "/careers/" in link:
-                filtered_links.append(link)
-            elif len(link) > len(base_url) + 10:  # If distinct path
-                filtered_links.append(link)
-
-        return list(set(filtered_links))[:10]  # Up to 10 candidates
-
-    async def _emergency_crawl(self, base_url: str, homepage_html: str, depth: int = 2) -> list[str]:
-        """
-        Story 4.3 AC2: Emergency Crawl when discovery search fails.
-
-        Follows internal links from the homepage looking for /jobs, /careers,
-        /apply paths, then extracts job links from those subpages.
-        """
-        if not homepage_html:
-            return []
-
-        parsed_base = urlparse(base_url)
-        base_domain = parsed_base.netloc
+        document = html if isinstance(html, ParsedDocument) else ParsedDocument.from_html(html)
+        frontier = CrawlFrontier(base_url, max_depth=1)  # Rank only, nothing to fetch
+        frontier.add_links(document, base_url, depth=1)
+        return frontier.ranked(limit=10)  # Up to 10 candidates
+
+    @staticmethod
+    def _save_snapshots(documents: list[Snapshot]) -> Optional[str]:
+        """Keep the scored texts for later re-extraction; a failure costs the snapshot, not the score."""
+        store = get_snapshot_store()
+        if store is None or not documents:
+            return None
+        try:
+            return store.save_set(documents)
+        except Exception as e:
+            print(f"Could not save scrape snapshots: {e}")
+            return None
 
-        soup = BeautifulSoup(homepage_html, "html.parser")
-        career_subpages = set()
+    def _snapshot_texts(self, company_id: int) -> dict[str, str]:
+        """URL -> text from the company's latest snapshot set; empty if there is none or it can't be read."""
+        try:
+            snapshots = load_latest_snapshots(self.db, company_id) or []
+        except Exception as e:
+            print(f"Could not load scrape snapshots: {e}")
+            return {}
+        return {s.url: s.text for s in snapshots if s.url}
+
+    @staticmethod
+    def _deadline_skipped(url: str, stage: str) -> ScraperResult:
+        """Failed result for a URL the scoring deadline cut off."""
+        return ScraperResult(
+            url=url,
+            success=False,
+            strategy_used=ScraperStrategy.GENERIC_HTML,
+            error_message="Skipped: scoring deadline reached",
+            metadata={"deadline": stage},
+        )
 
-        # Find internal links that look like career/job listing pages
-        career_patterns = ["career", "job", "opening", "position", "team", "work-with-us", "join"]
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            full_url = urljoin(base_url, href)
-            parsed = urlparse(full_url)
+    async def _scrape_stage(
+        self,
+        deadline: Deadline,
+        stage: str,
+        urls: list[str],
+        on_result: Optional[Callable[[int, ScraperResult], None]] = None,
+    ) -> list[ScraperResult]:
+        """
+        Scrape `urls` within the stage's share of the deadline, results in input order.
 
-            # Only follow same-domain links
-            if parsed.netloc and parsed.netloc != base_domain:
-                # But allow known subdomains (careers.company.com)
-                if not parsed.netloc.endswith(base_domain.replace("www.", "")):
-                    continue
+        Results that finished in time are kept; scrapes still running when the
+        budget runs out are cancelled and come back as failed results.
+        `on_result(index, result)` is called as each scrape finishes.
+        """
+        results: list[Optional[ScraperResult]] = [None] * len(urls)
+
+        async def collect() -> None:
+            async for index, result in self.scraper.scrape_stream(urls):
+                results[index] = result
+                if on_result is not None:
+                    on_result(index, result)
+
+        await deadline.run(stage, collect())
+        return [
+            result if result is not None else self._deadline_skipped(url, stage)
+            for url, result in zip(urls, results)
+        ]
 
-            lower_path = parsed.path.lower()
-            if any(p in lower_path for p in career_patterns):
-                career_subpages.add(full_url)
+    async def _emergency_crawl(
+        self,
+        base_url: str,
+        homepage_html: Union[str, ParsedDocument, None],
+        depth: int = 2,
+        max_pages: int = 5,
+    ) -> list[str]:
+        """
+        Story 4.3 AC2: Emergency Crawl when discovery search fails.
 
-        if not career_subpages:
+        Crawls the site best-first from the homepage's links (see
+        scrapers/frontier.py): likely postings and career listings are
+        fetched first, at most `max_pages` pages, `depth` links deep.
+        Returns up to 10 job links, best first.
+        """
+        if not homepage_html:
             return []
 
-        # Depth 2: Scrape those subpages and extract job links from them
-        all_job_links = []
-        subpage_tasks = [self.scraper.scrape(sp) for sp in list(career_subpages)[:5]]
-        subpage_results = await asyncio.gather(*subpage_tasks)
-
-        for result in subpage_results:
-            if result.success and result.raw_html:
-                links = self._find_job_links(result.raw_html, result.url)
-                all_job_links.extend(links)
-
-        return list(set(all_job_links))[:10]
+        if isinstance(homepage_html, ParsedDocument):
+            homepage = homepage_html
+        else:
+            homepage = ParsedDocument.from_html(homepage_html)
+
+        frontier = CrawlFrontier(base_url, max_depth=depth, max_pages=max_pages)
+        frontier.add_links(homepage, base_url, depth=1)
+        links = await crawl(self.scraper, frontier, want=10)
+        print(f"Crawl frontier: {frontier.pages_fetched} pages fetched, {frontier.queued} left in queue")
+        return links
+
+    @staticmethod
+    def _source_unchanged(source, result) -> bool:
+        """True if `result` shows the saved source's page hasn't changed since its last scrape."""
+        if not result.success:
+            return False
+        if result.not_modified:
+            return True
+        return source.content_hash is not None and result.content_hash() == source.content_hash
+
+    @staticmethod
+    def _record_source_validators(source, result) -> None:
+        """Store a scrape's ETag / Last-Modified and text hash on its CompanySource."""
+        if not result.success:
+            return
+        if not result.not_modified:  # A 304 may omit validators; keep the stored ones
+            # Values too long for their column are dropped: the page is just refetched in full
+            for column in ("etag", "last_modified"):
+                value = result.metadata.get(column)
+                fits = value is None or len(value) <= getattr(CompanySource, column).type.length
+                setattr(source, column, value if fits else None)
+            source.content_hash = result.content_hash()
+        source.last_scraped_at = datetime.now(timezone.utc)
 
     async def manual_rescore(
         self,
@@ -1024,6 +1258,7 @@ class ScoringService:
         results = self.db.execute(stmt).scalars().all()
         company = results[0] if results else None
 
+        existing_sources = []
         if company:
             # Load existing sources
             source_stmt = select(CompanySource).where(
@@ -1055,11 +1290,44 @@ class ScoringService:
         from app.utils.source_detection import detect_source_type
         
         text_segments = {}
+        documents = []  # Scored texts, kept in the snapshot store
         scrape_results = []
 
+        # Saved sources send their stored validators: unchanged pages come back as 304s
+        sources_by_url = {s.url: s for s in existing_sources}
+        validators = {url: s.validators() for url, s in sources_by_url.items() if s.validators()}
+
+        scrape_run, scrape_run_token = start_scrape_run()
+        try:
+            fetched = {}
+            async for index, result in self.scraper.scrape_stream(all_urls, validators=validators):
+                fetched[all_urls[index]] = result
+
+            # Unchanged: a 304, or the same extracted text as the last scrape
+            unchanged = {
+                url for url, result in fetched.items()
+                if url in sources_by_url and self._source_unchanged(sources_by_url[url], result)
+            }
+
+            # Extraction always reruns, so lexicon and weight changes apply. 304s without a
+            # cached body take the text they were last scored with; only pages missing from
+            # that snapshot are refetched.
+            bodiless = [url for url, result in fetched.items() if result.not_modified]
+            if bodiless and company is not None:
+                stored = self._snapshot_texts(company.id)
+                for url in bodiless:
+                    if url in stored:
+                        fetched[url] = dataclasses.replace(fetched[url], extracted_text=stored[url])
+                bodiless = [url for url in bodiless if url not in stored]
+            if bodiless:
+                for url, result in zip(bodiless, await self.scraper.scrape_batch(bodiless)):
+                    fetched[url] = result
+        finally:
+            finish_scrape_run(scrape_run_token)
+
         for url in all_urls:
+            result = fetched[url]
             try:
-                result = await self.scraper.scrape(url)
                 if result.success:
                     text = result.extracted_text or ""
                     source_type = detect_source_type(url, text)
@@ -1069,8 +1337,10 @@ class ScoringService:
                         text_segments[source_type] += "\n" + text
                     else:
                         text_segments[source_type] = text
+                    documents.append(Snapshot(url, source_type, result.scraped_at, text))
                     
-                    scrape_results.append({"url": url, "status": "success", "source_type": source_type, "chars": len(text)})
+                    status = "unchanged" if url in unchanged else "success"
+                    scrape_results.append({"url": url, "status": status, "source_type": source_type, "chars": len(text)})
                 else:
                     scrape_results.append({"url": url, "status": "failed", "error": result.error_message})
             except Exception as e:
@@ -1094,7 +1364,8 @@ class ScoringService:
             category=score_result.category,
             signals=score_result.signals.to_dict(),
             component_scores=score_result.component_scores,
-            evidence=score_result.evidence + all_urls
+            evidence=score_result.evidence + all_urls,
+            snapshot_id=self._save_snapshots(documents),
         )
         self.db.add(new_score)
 
@@ -1120,6 +1391,9 @@ class ScoringService:
                 )
                 self.db.add(new_source)
                 saved_sources += 1
+                existing = new_source
+
+            self._record_source_validators(existing, fetched[url])
 
         self.db.commit()
 
@@ -1130,6 +1404,8 @@ class ScoringService:
             "component_scores": score_result.component_scores,
             "sources_scraped": len(all_urls),
             "sources_saved": saved_sources,
-            "scrape_results": scrape_results
+            "sources_unchanged": len(unchanged),
+            "scrape_results": scrape_results,
+            "scrape_stats": dict(scrape_run.stats),
         }
 
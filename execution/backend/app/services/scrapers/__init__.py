@@ -1,19 +1,47 @@
 """Scrapers package - Strategy-based web scraping."""
 
 from app.services.scrapers.types import ScraperResult, ScraperConfig, ScraperStrategy
-from app.services.scrapers.orchestrator import ScraperOrchestrator
+from app.services.scrapers.document import ParsedDocument
+from app.services.scrapers.render_profile import RenderProfile
+from app.services.scrapers.orchestrator import (
+    ScraperOrchestrator,
+    get_shared_orchestrator,
+    close_shared_orchestrator,
+)
+from app.services.scrapers.http_client import SharedHttpClient
+from app.services.scrapers.cache import ScrapeCache
+from app.services.scrapers.run import ScrapeRun, start_scrape_run, finish_scrape_run
 from app.services.scrapers.base import BaseScraper
 from app.services.scrapers.generic_html import GenericHtmlScraper
 from app.services.scrapers.selenium_scraper import SeleniumScraper
 from app.services.scrapers.ats_detector import ATSDetector
+from app.services.scrapers.ats_api import (
+    AtsApiScraper,
+    GreenhouseScraper,
+    LeverScraper,
+    AshbyScraper,
+)
 
 __all__ = [
     "ScraperResult",
     "ScraperConfig",
     "ScraperStrategy",
+    "ParsedDocument",
+    "RenderProfile",
     "ScraperOrchestrator",
+    "get_shared_orchestrator",
+    "close_shared_orchestrator",
+    "SharedHttpClient",
+    "ScrapeCache",
+    "ScrapeRun",
+    "start_scrape_run",
+    "finish_scrape_run",
     "BaseScraper",
     "GenericHtmlScraper",
     "SeleniumScraper",
     "ATSDetector",
+    "AtsApiScraper",
+    "GreenhouseScraper",
+    "LeverScraper",
+    "AshbyScraper",
 ]
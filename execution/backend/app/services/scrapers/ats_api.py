@@ -0,0 +1,358 @@
+"""Native ATS job-board API scrapers (Greenhouse, Lever, Ashby).
+
+These ATS vendors publish public JSON job-board endpoints. Mapping a board
+URL to its API pulls every posting's description in one plain HTTP call,
+instead of rendering each page in a headless browser.
+"""
+
+import html as html_lib
+import json
+import logging
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+from app.services.scrapers.base import BaseScraper
+from app.services.scrapers.http_client import SharedHttpClient, build_http_client, read_capped
+from app.services.scrapers.types import ScraperResult, ScraperConfig, ScraperStrategy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BoardRef:
+    """An ATS board identified from a URL, optionally narrowed to one job."""
+
+    board: str
+    job_id: Optional[str] = None
+    api_base: Optional[str] = None  # Regional API host override (e.g. Lever EU)
+
+
+class AtsApiScraper(BaseScraper):
+    """
+    Base class for ATS JSON API strategies.
+
+    Subclasses map a board URL to an API endpoint (`parse_board`, `api_url`)
+    and convert the payload into one ScraperResult per posting
+    (`parse_postings`).
+
+    API responses are read up to `config.max_body_bytes`; a larger one fails
+    (truncated JSON can't be parsed). `scrape` keeps the first
+    `config.ats_max_postings` postings, up to `config.ats_max_text_bytes`
+    of text, so one big board can't swamp a company's keyword counts.
+    """
+
+    api_base: str = ""
+
+    def __init__(
+        self,
+        config: Optional[ScraperConfig] = None,
+        http: Optional[SharedHttpClient] = None,
+        api_base: Optional[str] = None,
+    ):
+        super().__init__(config)
+        self.http = http
+        self.api_base_override = api_base.rstrip("/") if api_base else None
+        if self.api_base_override:
+            self.api_base = self.api_base_override
+
+    def can_handle(self, url: str) -> bool:
+        """Handle URLs that map to a known board."""
+        return self.parse_board(url) is not None
+
+    @abstractmethod
+    def parse_board(self, url: str) -> Optional[BoardRef]:
+        """The board (and job) a URL points at, or None if it isn't this ATS."""
+
+    @abstractmethod
+    def api_url(self, ref: BoardRef) -> str:
+        """JSON endpoint for the board, or for the single job when the API has one."""
+
+    @abstractmethod
+    def parse_postings(self, payload, ref: BoardRef) -> list[ScraperResult]:
+        """One successful result per posting in the API payload."""
+
+    async def scrape_postings(self, url: str) -> list[ScraperResult]:
+        """
+        Fetch every posting on the board (or the single posting in `url`).
+
+        Raises httpx errors; `scrape` converts them into a failed result.
+        """
+        ref = self.parse_board(url)
+        if ref is None:
+            raise ValueError(f"Not a {self.strategy.value} board URL: {url}")
+
+        payload = await self._get_json(self.api_url(ref))
+        postings = self.parse_postings(payload, ref)
+        if ref.job_id:
+            postings = [p for p in postings if p.metadata.get("job_id") == ref.job_id] or postings
+        return postings
+
+    async def scrape(self, url: str) -> ScraperResult:
+        """
+        Return the board's postings as a single combined result.
+
+        The postings themselves are kept in `result.postings`, so callers can
+        classify and weigh each job on its own.
+        """
+        try:
+            postings = await self.scrape_postings(url)
+        except httpx.TimeoutException:
+            return self._failed(url, f"Timeout after {self.config.timeout_seconds}s", error_kind="timeout")
+        except httpx.HTTPStatusError as e:
+            return self._failed(
+                url,
+                f"HTTP {e.response.status_code}: {e.response.reason_phrase}",
+                error_kind="http_status",
+                status_code=e.response.status_code,
+            )
+        except httpx.TransportError as e:
+            return self._failed(url, f"Connection failed: {str(e) or type(e).__name__}", error_kind="connect")
+        except Exception as e:
+            return self._failed(url, f"ATS API error: {str(e)}")
+
+        if not postings:
+            return self._failed(url, "ATS board has no postings")
+
+        ref = self.parse_board(url)
+        total = len(postings)
+        kept, texts, size = [], [], 0
+        for p in postings[:self.config.ats_max_postings]:
+            text = f"{p.title}\n{p.extracted_text}" if p.title else (p.extracted_text or "")
+            size += len(text.encode("utf-8"))
+            if kept and size > self.config.ats_max_text_bytes:
+                break
+            kept.append(p)
+            texts.append(text)
+        postings = kept
+        if len(postings) < total:
+            logger.info(f"Kept {len(postings)} of {total} postings from {url}")
+
+        return ScraperResult(
+            url=url,
+            success=True,
+            strategy_used=self.strategy,
+            extracted_text="\n\n".join(texts),
+            title=postings[0].title if ref.job_id else f"{ref.board} jobs",
+            postings=postings,
+            metadata={
+                "api_url": self.api_url(ref),
+                "postings": len(postings),
+                "postings_total": total,
+                "jobs": [
+                    {
+                        "title": p.title,
+                        "url": p.url,
+                        "department": p.metadata.get("department"),
+                    }
+                    for p in postings
+                ],
+            },
+        )
+
+    async def _get_json(self, api_url: str):
+        if self.http is not None:
+            async with self.http.host_slot(api_url):
+                return await self._read_json(self.http.client, api_url)
+        async with build_http_client(self.config) as client:
+            return await self._read_json(client, api_url)
+
+    async def _read_json(self, client: httpx.AsyncClient, api_url: str):
+        async with client.stream("GET", api_url, headers={"Accept": "application/json"}) as response:
+            response.raise_for_status()
+            body, truncated = await read_capped(response, self.config.max_body_bytes)
+        if truncated:
+            raise ValueError(f"response larger than {self.config.max_body_bytes} bytes")
+        return json.loads(body)
+
+    def _posting(
+        self,
+        url: str,
+        title: Optional[str],
+        text: str,
+        job_id: Optional[str],
+        department: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> ScraperResult:
+        return ScraperResult(
+            url=url,
+            success=True,
+            strategy_used=self.strategy,
+            extracted_text=text,
+            title=title,
+            metadata={
+                "job_id": job_id,
+                "department": department,
+                "location": location,
+            },
+        )
+
+    def _html_to_text(self, content: Optional[str]) -> str:
+        if not content:
+            return ""
+        return self._extract_text_from_html(content)
+
+    def _failed(self, url: str, message: str, **metadata) -> ScraperResult:
+        return ScraperResult(
+            url=url,
+            success=False,
+            strategy_used=self.strategy,
+            error_message=message,
+            metadata=metadata,
+        )
+
+
+class GreenhouseScraper(AtsApiScraper):
+    """
+    Greenhouse Job Board API.
+
+    Handles boards.greenhouse.io/{token}, job-boards.greenhouse.io/{token},
+    .../jobs/{id} and embed URLs (?for={token}).
+    """
+
+    strategy = ScraperStrategy.GREENHOUSE
+    api_base = "https://boards-api.greenhouse.io"
+
+    HOSTS = ("boards.greenhouse.io", "job-boards.greenhouse.io", "boards-api.greenhouse.io")
+
+    def parse_board(self, url: str) -> Optional[BoardRef]:
+        parsed = urlparse(url)
+        if (parsed.hostname or "").lower() not in self.HOSTS:
+            return None
+
+        parts = [p for p in parsed.path.split("/") if p]
+        query = parse_qs(parsed.query)
+
+        # Embeds: /embed/job_board?for=acme, /embed/job_app?for=acme&token=123
+        if parts and parts[0] == "embed":
+            board = query.get("for", [None])[0]
+            job_id = query.get("token", [None])[0]
+            return BoardRef(board=board, job_id=job_id) if board else None
+
+        # API URLs: /v1/boards/acme/jobs[/123]
+        if parts[:2] == ["v1", "boards"]:
+            parts = parts[2:]
+
+        if not parts:
+            return None
+        job_id = parts[2] if len(parts) >= 3 and parts[1] == "jobs" else None
+        return BoardRef(board=parts[0], job_id=job_id)
+
+    def api_url(self, ref: BoardRef) -> str:
+        if ref.job_id:
+            return f"{self.api_base}/v1/boards/{ref.board}/jobs/{ref.job_id}"
+        return f"{self.api_base}/v1/boards/{ref.board}/jobs?content=true"
+
+    def parse_postings(self, payload, ref: BoardRef) -> list[ScraperResult]:
+        jobs = payload.get("jobs", []) if "jobs" in payload else [payload]
+        postings = []
+        for job in jobs:
+            departments = job.get("departments") or []
+            # Greenhouse returns `content` as HTML-escaped HTML
+            content = html_lib.unescape(job.get("content") or "")
+            postings.append(self._posting(
+                url=job.get("absolute_url") or f"https://boards.greenhouse.io/{ref.board}/jobs/{job.get('id')}",
+                title=job.get("title"),
+                text=self._html_to_text(content),
+                job_id=str(job.get("id")),
+                department=departments[0].get("name") if departments else None,
+                location=(job.get("location") or {}).get("name"),
+            ))
+        return postings
+
+
+class LeverScraper(AtsApiScraper):
+    """
+    Lever Postings API.
+
+    Handles jobs.lever.co/{company}[/{posting_id}] and the EU-hosted
+    jobs.eu.lever.co equivalent.
+    """
+
+    strategy = ScraperStrategy.LEVER
+    api_base = "https://api.lever.co"
+
+    REGIONAL_API = {
+        "jobs.lever.co": None,
+        "jobs.eu.lever.co": "https://api.eu.lever.co",
+    }
+
+    def parse_board(self, url: str) -> Optional[BoardRef]:
+        parsed = urlparse(url)
+        host = (parsed.hostname or "").lower()
+        if host not in self.REGIONAL_API:
+            return None
+        parts = [p for p in parsed.path.split("/") if p]
+        if not parts:
+            return None
+        job_id = parts[1] if len(parts) >= 2 and parts[1] != "apply" else None
+        return BoardRef(board=parts[0], job_id=job_id, api_base=self.REGIONAL_API[host])
+
+    def api_url(self, ref: BoardRef) -> str:
+        base = self.api_base_override or ref.api_base or self.api_base
+        if ref.job_id:
+            return f"{base}/v0/postings/{ref.board}/{ref.job_id}"
+        return f"{base}/v0/postings/{ref.board}?mode=json"
+
+    def parse_postings(self, payload, ref: BoardRef) -> list[ScraperResult]:
+        jobs = payload if isinstance(payload, list) else [payload]
+        postings = []
+        for job in jobs:
+            sections = [job.get("descriptionPlain") or self._html_to_text(job.get("description"))]
+            for block in job.get("lists") or []:
+                sections.append(block.get("text") or "")
+                sections.append(self._html_to_text(block.get("content")))
+            sections.append(job.get("additionalPlain") or self._html_to_text(job.get("additional")))
+
+            categories = job.get("categories") or {}
+            postings.append(self._posting(
+                url=job.get("hostedUrl") or f"https://jobs.lever.co/{ref.board}/{job.get('id')}",
+                title=job.get("text"),
+                text=" ".join(s.strip() for s in sections if s and s.strip()),
+                job_id=job.get("id"),
+                department=categories.get("department") or categories.get("team"),
+                location=categories.get("location"),
+            ))
+        return postings
+
+
+class AshbyScraper(AtsApiScraper):
+    """
+    Ashby public Job Board API.
+
+    Handles jobs.ashbyhq.com/{org}[/{job_id}]. Ashby has no single-posting
+    endpoint, so posting URLs are served by filtering the board response.
+    """
+
+    strategy = ScraperStrategy.ASHBY
+    api_base = "https://api.ashbyhq.com"
+
+    def parse_board(self, url: str) -> Optional[BoardRef]:
+        parsed = urlparse(url)
+        if (parsed.hostname or "").lower() != "jobs.ashbyhq.com":
+            return None
+        parts = [p for p in parsed.path.split("/") if p]
+        if not parts:
+            return None
+        return BoardRef(board=parts[0], job_id=parts[1] if len(parts) >= 2 else None)
+
+    def api_url(self, ref: BoardRef) -> str:
+        return f"{self.api_base}/posting-api/job-board/{ref.board}?includeCompensation=false"
+
+    def parse_postings(self, payload, ref: BoardRef) -> list[ScraperResult]:
+        postings = []
+        for job in payload.get("jobs", []):
+            if job.get("isListed") is False:
+                continue
+            postings.append(self._posting(
+                url=job.get("jobUrl") or f"https://jobs.ashbyhq.com/{ref.board}/{job.get('id')}",
+                title=job.get("title"),
+                text=job.get("descriptionPlain") or self._html_to_text(job.get("descriptionHtml")),
+                job_id=job.get("id"),
+                department=job.get("department") or job.get("team"),
+                location=job.get("location"),
+            ))
+        return postings
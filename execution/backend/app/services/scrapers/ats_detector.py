@@ -4,8 +4,9 @@ Story 4.3 AC1: Detect common ATS platforms embedded in career pages.
 These are treated as "High Confidence" sources for scoring.
 """
 
-from typing import List
-from bs4 import BeautifulSoup
+from typing import List, Union
+
+from app.services.scrapers.document import ParsedDocument
 
 
 # ATS domain patterns to detect in URLs and iframes
@@ -19,6 +20,7 @@ ATS_PATTERNS = [
     "workday.com",
     "jobs.ashby.io",
     "ashby.io",
+    "ashbyhq.com",
     "icims.com",
     "smartrecruiters.com",
 ]
@@ -27,29 +29,23 @@ ATS_PATTERNS = [
 class ATSDetector:
     """Detects ATS (Applicant Tracking System) links in HTML content."""
 
-    def extract_ats_links(self, html: str) -> List[str]:
+    def extract_ats_links(self, html: Union[str, ParsedDocument]) -> List[str]:
         """
         Scan HTML for ATS platform links and iframes.
 
+        Accepts raw HTML or an already-parsed document (preferred: no re-parse).
         Returns deduplicated list of ATS URLs found.
         """
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        document = html if isinstance(html, ParsedDocument) else ParsedDocument.from_html(html)
         found = set()
 
-        # Check anchor tags
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            if self.is_ats_url(href):
-                found.add(href)
-
-        # Check iframes (common for Greenhouse embeds)
-        for iframe in soup.find_all("iframe", src=True):
-            src = iframe["src"]
-            if self.is_ats_url(src):
-                found.add(src)
+        # Check anchor tags, then iframes (common for Greenhouse embeds)
+        for link in document.link_urls:
+            if self.is_ats_url(link):
+                found.add(link)
 
         return list(found)
 
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from app.services.scrapers.document import ParsedDocument
 from app.services.scrapers.types import ScraperResult, ScraperConfig, ScraperStrategy
 
 
@@ -40,30 +41,25 @@ class BaseScraper(ABC):
         """
         pass
     
+    async def aclose(self) -> None:
+        """Release long-lived resources (browsers, pools). No-op by default."""
+        return None
+    
+    def _parse(self, html: str) -> ParsedDocument:
+        """Parse a page once; the result feeds text, title and link extraction."""
+        return ParsedDocument.from_html(html, self.config.html_parser, self.config.text_mode)
+    
+    def _text_metadata(self, document: ParsedDocument) -> dict:
+        """Text mode and extracted size; "main" mode also reports the full text's size."""
+        metadata = {"text_mode": self.config.text_mode, "text_bytes": document.text_bytes}
+        if document.full_text_bytes is not None:
+            metadata["full_text_bytes"] = document.full_text_bytes
+        return metadata
+    
     def _extract_text_from_html(self, html: str) -> str:
         """Extract readable text from HTML content."""
-        from bs4 import BeautifulSoup
-        
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # Remove script and style elements
-        for element in soup(["script", "style", "nav", "footer", "header"]):
-            element.decompose()
-        
-        # Get text and clean whitespace
-        text = soup.get_text(separator=" ", strip=True)
-        
-        # Normalize whitespace
-        import re
-        text = re.sub(r"\s+", " ", text)
-        
-        return text.strip()
+        return self._parse(html).text
     
     def _extract_title(self, html: str) -> Optional[str]:
         """Extract page title from HTML."""
-        from bs4 import BeautifulSoup
-        
-        soup = BeautifulSoup(html, "html.parser")
-        title_tag = soup.find("title")
-        
-        return title_tag.get_text(strip=True) if title_tag else None
+        return self._parse(html).title
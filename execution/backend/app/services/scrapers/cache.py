@@ -0,0 +1,267 @@
+"""On-disk scrape cache.
+
+Entries are keyed by canonical URL (sha256) and stored as one
+zlib-compressed JSON file each, holding the page body, extracted text
+(plus each job's text for ATS boards) and the HTTP validators (ETag /
+Last-Modified) needed to revalidate it.
+
+- Fresh entries (younger than `cache_duration_hours`) are served without
+  any network I/O.
+- Stale entries are kept until `cache_max_age_hours` so the orchestrator
+  can revalidate them with a conditional GET (304 → reuse the body).
+- The cache is trimmed to `cache_max_bytes` by deleting the least
+  recently validated entries first.
+
+All methods do blocking file I/O; async callers run them in a thread.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from app.services.scrapers.document import DEFAULT_HTML_PARSER
+from app.services.scrapers.types import ScraperConfig, ScraperResult, ScraperStrategy
+from app.services.scrapers.urls import canonical_url
+
+logger = logging.getLogger(__name__)
+
+ENTRY_SUFFIX = ".json.z"
+EVICT_EVERY_N_WRITES = 50
+
+
+def conditional_headers(etag: Optional[str] = None, last_modified: Optional[str] = None) -> dict:
+    """If-None-Match / If-Modified-Since headers for the given validators."""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+@dataclass
+class CacheEntry:
+    """A cached successful scrape."""
+
+    url: str
+    strategy: str
+    stored_at: float  # Epoch seconds of the last fetch or successful revalidation
+    raw_html: Optional[str] = None
+    extracted_text: Optional[str] = None
+    title: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    metadata: dict = field(default_factory=dict)
+    postings: list[dict] = field(default_factory=list)  # ATS boards: url, title, extracted_text per job
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.stored_at
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict:
+        """Request headers for a conditional GET against this entry."""
+        return conditional_headers(self.etag, self.last_modified)
+
+    def to_result(
+        self, url: str, cache_status: str, html_parser: str = DEFAULT_HTML_PARSER, text_mode: str = "full",
+    ) -> ScraperResult:
+        return ScraperResult(
+            url=url,
+            success=True,
+            strategy_used=ScraperStrategy(self.strategy),
+            raw_html=self.raw_html,
+            extracted_text=self.extracted_text,
+            title=self.title,
+            scraped_at=datetime.utcfromtimestamp(self.stored_at),
+            metadata={**self.metadata, "cache": cache_status},
+            html_parser=html_parser,
+            text_mode=text_mode,
+            postings=[
+                ScraperResult(
+                    url=p["url"],
+                    success=True,
+                    strategy_used=ScraperStrategy(self.strategy),
+                    extracted_text=p["extracted_text"],
+                    title=p["title"],
+                    scraped_at=datetime.utcfromtimestamp(self.stored_at),
+                )
+                for p in self.postings
+            ],
+        )
+
+
+class ScrapeCache:
+    """
+    Content cache for scrape results, one compressed file per URL.
+
+    Usage:
+        cache = ScrapeCache.from_config(config)
+        entry = cache.get(url)
+        if entry and cache.is_fresh(entry):
+            return entry.to_result(url, "hit")
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ttl_hours: float = 24,
+        max_age_hours: float = 24 * 7,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_age_seconds = max(max_age_hours * 3600, self.ttl_seconds)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._evicted_once = False
+
+    @classmethod
+    def from_config(cls, config: ScraperConfig) -> Optional["ScrapeCache"]:
+        """Build the cache described by `config`, or None if caching is disabled."""
+        if not config.cache_dir:
+            return None
+        return cls(
+            config.cache_dir,
+            ttl_hours=config.cache_duration_hours,
+            max_age_hours=config.cache_max_age_hours,
+            max_bytes=config.cache_max_bytes,
+        )
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(canonical_url(url).encode("utf-8")).hexdigest()
+
+    def _path(self, url: str) -> Path:
+        key = self.key(url)
+        return self.directory / key[:2] / f"{key}{ENTRY_SUFFIX}"
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.age_seconds < self.ttl_seconds
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Load the entry for `url`; expired or unreadable entries are dropped."""
+        path = self._path(url)
+        try:
+            data = json.loads(zlib.decompress(path.read_bytes()))
+            entry = CacheEntry(**data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        if entry.age_seconds > self.max_age_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def put(self, result: ScraperResult) -> Optional[CacheEntry]:
+        """Store a successful result; failed results are never cached."""
+        if not result.success:
+            return None
+
+        metadata = dict(result.metadata)
+        metadata.pop("cache", None)
+        entry = CacheEntry(
+            url=canonical_url(result.url),
+            strategy=result.strategy_used.value,
+            stored_at=time.time(),
+            raw_html=result.raw_html,
+            extracted_text=result.extracted_text,
+            title=result.title,
+            etag=metadata.get("etag"),
+            last_modified=metadata.get("last_modified"),
+            metadata=metadata,
+            postings=[
+                {"url": p.url, "title": p.title, "extracted_text": p.extracted_text}
+                for p in result.postings
+            ],
+        )
+        self._write(result.url, entry)
+        return entry
+
+    def touch(self, url: str, entry: CacheEntry) -> CacheEntry:
+        """Mark a stale entry fresh again after a 304 Not Modified."""
+        entry.stored_at = time.time()
+        self._write(url, entry)
+        return entry
+
+    def _write(self, url: str, entry: CacheEntry) -> None:
+        path = self._path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            payload = zlib.compress(json.dumps(asdict(entry), default=str).encode("utf-8"))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Not caching {url}: {e}")
+            return
+
+        # Atomic replace so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._writes += 1
+            due = not self._evicted_once or self._writes % EVICT_EVERY_N_WRITES == 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Delete entries past max age, then the oldest until under max_bytes."""
+        with self._lock:
+            self._evicted_once = True
+
+        now = time.time()
+        files = []
+        for path in self.directory.glob(f"*/*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        removed = 0
+        kept = []
+        for mtime, size, path in files:
+            if now - mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                kept.append((mtime, size, path))
+
+        total = sum(size for _, size, _ in kept)
+        for mtime, size, path in sorted(kept):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"Scrape cache evicted {removed} entries ({total} bytes kept)")
+        return removed
+
+    def stats(self) -> dict:
+        """Entry count and on-disk size."""
+        sizes = [p.stat().st_size for p in self.directory.glob(f"*/*{ENTRY_SUFFIX}")]
+        return {"entries": len(sizes), "bytes": sum(sizes)}
@@ -0,0 +1,108 @@
+"""Charset decoding for fetched page bodies.
+
+Statistical detection over a whole body is slow on big pages, and almost
+never needed: most pages say what they are. Decoding tries, in order:
+
+1. a byte-order mark
+2. the charset declared in Content-Type
+3. `<meta charset>` / `<meta http-equiv="Content-Type">` in the first
+   `SNIFF_BYTES` of the body
+4. strict UTF-8 (fails fast on the first invalid byte)
+5. charset_normalizer, if installed, over the first `DETECT_SAMPLE_BYTES`
+6. windows-1252, the web's legacy default
+
+Labels are resolved as browsers do: "iso-8859-1", "latin1" and "ascii"
+all mean windows-1252, and a meta tag claiming UTF-16 means UTF-8.
+"""
+
+import codecs
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    from charset_normalizer import from_bytes as _detect
+except ImportError:  # Optional; without it undeclared non-UTF-8 pages decode as windows-1252
+    _detect = None
+
+SNIFF_BYTES = 4096  # Browsers look for <meta charset> in the first 1024; pages often put it later
+DETECT_SAMPLE_BYTES = 64 * 1024
+FALLBACK_ENCODING = "cp1252"
+
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+# Python codec names browsers decode as windows-1252
+WINDOWS_1252_ALIASES = {"iso8859-1", "latin-1", "ascii"}
+
+# Matches both <meta charset="x"> and <meta http-equiv=... content="text/html; charset=x">
+META_CHARSET = re.compile(rb"""<meta\b[^>]*?charset\s*=\s*["']?\s*([a-zA-Z0-9_:.+-]+)""", re.IGNORECASE)
+
+
+@dataclass
+class DecodedBody:
+    text: str
+    encoding: str  # Python codec name
+    source: str  # "bom", "header", "meta", "utf-8", "detected" or "fallback"
+
+
+def normalize_charset(label: Optional[str]) -> Optional[str]:
+    """Python codec name for a charset label, or None if unknown."""
+    if not label:
+        return None
+    try:
+        name = codecs.lookup(label.strip().strip("\"'")).name
+    except LookupError:
+        return None
+    return FALLBACK_ENCODING if name in WINDOWS_1252_ALIASES else name
+
+
+def sniff_meta_charset(head: bytes) -> Optional[str]:
+    """Charset declared by a <meta> tag in `head`, normalized."""
+    match = META_CHARSET.search(head)
+    if match is None:
+        return None
+    encoding = normalize_charset(match.group(1).decode("ascii", "ignore"))
+    if encoding and encoding.startswith("utf-16"):
+        return "utf-8"  # An ASCII-readable meta tag can't be UTF-16
+    return encoding
+
+
+def _decode_utf8(body: bytes) -> Optional[str]:
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # A body cut off at max_body_bytes may end mid-character
+        if e.reason == "unexpected end of data" and e.start >= len(body) - 3:
+            return body.decode("utf-8", errors="replace")
+        return None
+
+
+def decode_body(body: bytes, declared: Optional[str] = None) -> DecodedBody:
+    """Decode a page body, detecting the charset only when nothing declares one."""
+    for bom, encoding in BOMS:
+        if body.startswith(bom):
+            return DecodedBody(body[len(bom):].decode(encoding, errors="replace"), encoding, "bom")
+
+    encoding = normalize_charset(declared)
+    if encoding:
+        return DecodedBody(body.decode(encoding, errors="replace"), encoding, "header")
+
+    encoding = sniff_meta_charset(body[:SNIFF_BYTES])
+    if encoding:
+        return DecodedBody(body.decode(encoding, errors="replace"), encoding, "meta")
+
+    text = _decode_utf8(body)
+    if text is not None:
+        return DecodedBody(text, "utf-8", "utf-8")
+
+    if _detect is not None:
+        best = _detect(body[:DETECT_SAMPLE_BYTES]).best()
+        encoding = normalize_charset(best.encoding) if best is not None else None
+        if encoding:
+            return DecodedBody(body.decode(encoding, errors="replace"), encoding, "detected")
+
+    return DecodedBody(body.decode(FALLBACK_ENCODING, errors="replace"), FALLBACK_ENCODING, "fallback")
@@ -0,0 +1,170 @@
+"""Per-host circuit breaker.
+
+A host that keeps timing out, refusing connections or answering
+403/429/5xx is skipped for a cooldown instead of costing a full timeout on
+every probe, satellite and deep link:
+
+- closed: requests flow; `circuit_failure_threshold` consecutive host
+  failures open the circuit
+- open: requests fail fast until `circuit_cooldown_seconds` have passed
+- half-open: one probe request is let through; success closes the
+  circuit, failure re-opens it for another cooldown
+
+While a circuit is open, outcomes of requests that were already in flight
+are ignored; only the half-open probe's outcome changes its state.
+
+With `config.circuit_persist` and a `config.cache_dir`, open circuits are
+persisted to `<cache_dir>/circuits.json` so a restart doesn't re-learn
+dead hosts.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from app.services.scrapers.types import ScraperConfig, ScraperResult
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Responses that say "this host is down or refusing us", not "this page is missing"
+HOST_FAILURE_STATUSES = {403, 429, 500, 502, 503, 504}
+
+
+def is_host_failure(result: ScraperResult) -> bool:
+    """True if a failed result blames the host (timeout, connection, 403/429/5xx)."""
+    if result.success:
+        return False
+    if result.metadata.get("error_kind") in ("timeout", "connect"):
+        return True
+    return result.metadata.get("status_code") in HOST_FAILURE_STATUSES
+
+
+@dataclass
+class Circuit:
+    """Breaker state for one host."""
+
+    state: str = CLOSED
+    failures: int = 0  # Consecutive host failures
+    opened_at: float = 0.0  # Epoch seconds (persisted across restarts)
+    probe_started: float = 0.0  # Half-open probe in flight since (0 = none)
+
+
+class CircuitBreaker:
+    """
+    Host-keyed circuit breakers.
+
+    Usage:
+        if not breaker.allow(url):
+            ...  # fail fast
+        if skipped_without_fetching:
+            breaker.release(url)
+        result = await fetch(url)
+        breaker.record(url, result)
+    """
+
+    def __init__(self, config: ScraperConfig):
+        self.threshold = config.circuit_failure_threshold
+        self.cooldown_seconds = config.circuit_cooldown_seconds
+        # A probe that never reports back (cancelled, crashed) stops blocking after this
+        self.probe_timeout_seconds = config.timeout_seconds * 2
+        persist = config.circuit_persist and config.cache_dir
+        self.path = Path(config.cache_dir) / "circuits.json" if persist else None
+        self._circuits: dict[str, Circuit] = {}
+        self._load()
+
+    @staticmethod
+    def host(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    def state(self, url: str) -> str:
+        circuit = self._circuits.get(self.host(url))
+        return circuit.state if circuit else CLOSED
+
+    def allow(self, url: str) -> bool:
+        """Whether a request to `url`'s host may go out now."""
+        circuit = self._circuits.get(self.host(url))
+        if circuit is None or circuit.state == CLOSED:
+            return True
+        now = time.time()
+        if circuit.state == OPEN:
+            if now - circuit.opened_at < self.cooldown_seconds:
+                return False
+            circuit.state = HALF_OPEN
+            circuit.probe_started = 0.0
+        if circuit.probe_started and now - circuit.probe_started < self.probe_timeout_seconds:
+            return False  # One probe at a time while half-open
+        circuit.probe_started = now
+        return True
+
+    def record(self, url: str, result: ScraperResult) -> None:
+        """Feed a fetch outcome back into the host's circuit."""
+        host = self.host(url)
+        circuit = self._circuits.setdefault(host, Circuit())
+        previous = circuit.state
+        if previous == OPEN or (previous == HALF_OPEN and not circuit.probe_started):
+            # Requests sent before the circuit opened: only the half-open probe decides
+            return
+        circuit.probe_started = 0.0
+
+        if not is_host_failure(result):
+            if previous != CLOSED or circuit.failures:
+                self._circuits[host] = Circuit()
+                if previous != CLOSED:
+                    logger.info(f"Circuit closed for {host}")
+                    self._save()
+            return
+
+        circuit.failures += 1
+        if previous == HALF_OPEN or circuit.failures >= self.threshold:
+            circuit.state = OPEN
+            circuit.opened_at = time.time()
+            logger.warning(
+                f"Circuit open for {host} after {circuit.failures} failures "
+                f"({result.error_message}); skipping it for {self.cooldown_seconds:.0f}s"
+            )
+            self._save()
+
+    def release(self, url: str) -> None:
+        """Give back a half-open probe slot that `allow` granted but no request used."""
+        circuit = self._circuits.get(self.host(url))
+        if circuit is not None and circuit.state == HALF_OPEN:
+            circuit.probe_started = 0.0
+
+    def open_hosts(self) -> list[str]:
+        return sorted(host for host, c in self._circuits.items() if c.state != CLOSED)
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable circuit state {self.path}: {e}")
+            return
+        for host, fields in data.items():
+            # A half-open probe from the previous process never finished: start from open
+            self._circuits[host] = Circuit(state=OPEN, failures=fields["failures"], opened_at=fields["opened_at"])
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = {host: asdict(c) for host, c in self._circuits.items() if c.state != CLOSED}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist circuit state: {e}")
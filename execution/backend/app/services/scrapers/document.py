@@ -0,0 +1,171 @@
+"""Parsed HTML document shared by every consumer of a scraped page.
+
+A page is parsed once at scrape time into a ParsedDocument carrying the
+readable text, title, anchors, iframes and embedded structured data. Link finders, ATS detection and
+the emergency crawl read from it instead of re-parsing the raw HTML.
+
+Parser backends (ScraperConfig.html_parser):
+- "html.parser": BeautifulSoup with the stdlib parser (default, always available)
+- "lxml": BeautifulSoup with lxml (optional "lxml" package)
+- "selectolax": selectolax's lexbor engine, no BeautifulSoup tree at all
+  (optional "selectolax" package; fastest)
+
+All backends produce the same text normalization and link lists; a missing
+optional package falls back to "html.parser" with a warning.
+
+Text modes (ScraperConfig.text_mode): "full" keeps all text outside
+NON_CONTENT_TAGS; "main" keeps only the main content block (see
+main_content.py) and records the full text's size in full_text_bytes.
+"""
+
+import importlib.util
+import logging
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+from app.services.scrapers.main_content import TEXT_MODES, LexborTree, SoupTree, extract_main_text
+
+logger = logging.getLogger(__name__)
+
+HTML_PARSERS = ("html.parser", "lxml", "selectolax")
+DEFAULT_HTML_PARSER = "html.parser"
+
+# Boilerplate removed before text extraction (links inside are still collected)
+NON_CONTENT_TAGS = ["script", "style", "nav", "footer", "header"]
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def available_parsers() -> list[str]:
+    """Backends whose packages are installed."""
+    optional = {"lxml": "lxml", "selectolax": "selectolax"}
+    return [
+        name for name in HTML_PARSERS
+        if name not in optional or importlib.util.find_spec(optional[name]) is not None
+    ]
+
+
+@lru_cache(maxsize=None)
+def resolve_parser(name: str) -> str:
+    """Validate a backend name, falling back to html.parser if it isn't installed."""
+    if name not in HTML_PARSERS:
+        raise ValueError(f"Unknown HTML parser {name!r}; expected one of {HTML_PARSERS}")
+    if name not in available_parsers():
+        logger.warning(f"HTML parser {name!r} is not installed, falling back to {DEFAULT_HTML_PARSER!r}")
+        return DEFAULT_HTML_PARSER
+    return name
+
+
+def _normalize_text(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _is_structured_data(script_type: Optional[str], script_id: Optional[str]) -> bool:
+    """<script type="application/ld+json"> or Next.js's <script id="__NEXT_DATA__">."""
+    return (script_type or "").strip().lower() == "application/ld+json" or script_id == "__NEXT_DATA__"
+
+
+@dataclass(frozen=True)
+class Anchor:
+    """An <a href> as written in the page (href is not resolved)."""
+
+    href: str
+    text: str
+
+
+@dataclass
+class ParsedDocument:
+    """Everything the pipeline reads from one HTML page."""
+
+    text: str
+    title: Optional[str] = None
+    anchors: list[Anchor] = field(default_factory=list)
+    iframes: list[str] = field(default_factory=list)  # iframe src values
+    structured_data: list[str] = field(default_factory=list)  # JSON-LD and __NEXT_DATA__ script bodies
+    full_text_bytes: Optional[int] = None  # UTF-8 size of the full text, set in "main" mode
+
+    @property
+    def text_bytes(self) -> int:
+        return len(self.text.encode("utf-8"))
+
+    @classmethod
+    def from_html(cls, html: str, parser: str = DEFAULT_HTML_PARSER, text_mode: str = "full") -> "ParsedDocument":
+        """Parse `html` once and extract text, title, anchors and iframes."""
+        if text_mode not in TEXT_MODES:
+            raise ValueError(f"Unknown text mode {text_mode!r}; expected one of {TEXT_MODES}")
+        if not html:
+            return cls(text="")
+
+        backend = resolve_parser(parser)
+        if backend == "selectolax":
+            return cls._from_selectolax(html, text_mode)
+        return cls._from_soup(html, backend, text_mode)
+
+    @classmethod
+    def _from_soup(cls, html: str, backend: str, text_mode: str) -> "ParsedDocument":
+        soup = BeautifulSoup(html, backend)
+
+        title_tag = soup.find("title")
+        title = title_tag.get_text(strip=True) if title_tag else None
+
+        # Collect links before boilerplate removal: nav/header links matter for crawling
+        anchors = [Anchor(href=a["href"], text=a.get_text()) for a in soup.find_all("a", href=True)]
+        iframes = [iframe["src"] for iframe in soup.find_all("iframe", src=True)]
+        structured_data = [
+            script.get_text() for script in soup.find_all("script")
+            if _is_structured_data(script.get("type"), script.get("id"))
+        ]
+
+        for element in soup(NON_CONTENT_TAGS):
+            element.decompose()
+        text = _normalize_text(soup.get_text(separator=" ", strip=True))
+
+        document = cls(text=text, title=title, anchors=anchors, iframes=iframes, structured_data=structured_data)
+        if text_mode == "main":
+            document._keep_main_text(SoupTree(soup))
+        return document
+
+    @classmethod
+    def _from_selectolax(cls, html: str, text_mode: str) -> "ParsedDocument":
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(html)
+
+        title_node = tree.css_first("title")
+        title = title_node.text(strip=True) if title_node else None
+
+        # Valueless attributes come back as None; BeautifulSoup reports ""
+        anchors = [
+            Anchor(href=node.attributes.get("href") or "", text=node.text(deep=True, separator="", strip=False))
+            for node in tree.css("a[href]")
+        ]
+        iframes = [node.attributes.get("src") or "" for node in tree.css("iframe[src]")]
+        structured_data = [
+            node.text(deep=True) for node in tree.css("script")
+            if _is_structured_data(node.attributes.get("type"), node.attributes.get("id"))
+        ]
+
+        tree.strip_tags(NON_CONTENT_TAGS)
+        root = tree.root
+        text = _normalize_text(root.text(separator=" ", strip=True)) if root is not None else ""
+
+        document = cls(text=text, title=title, anchors=anchors, iframes=iframes, structured_data=structured_data)
+        if text_mode == "main" and root is not None:
+            document._keep_main_text(LexborTree(tree))
+        return document
+
+    def _keep_main_text(self, tree) -> None:
+        """Replace the full text with the main-content block, if the page has one."""
+        self.full_text_bytes = self.text_bytes
+        main = extract_main_text(tree, _normalize_text)
+        if main is not None:
+            self.text = main
+
+    @property
+    def link_urls(self) -> list[str]:
+        """Anchor hrefs followed by iframe srcs, in document order."""
+        return [a.href for a in self.anchors] + self.iframes
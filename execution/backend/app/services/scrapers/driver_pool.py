@@ -0,0 +1,280 @@
+"""Bounded pool of warm, reusable Selenium WebDrivers.
+
+Starting Chrome dominates the cost of a JS render, so drivers are launched
+once and leased out page by page; the first lease launches the rest of the
+pool in the background. A driver is recycled after a configurable
+number of pages (to cap memory growth) or as soon as it looks crashed.
+
+Selenium is synchronous and runs in executor threads, so the pool is
+thread-safe rather than asyncio-based.
+"""
+
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+from app.services.scrapers.types import ScraperConfig
+
+logger = logging.getLogger(__name__)
+
+
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_chromedriver_path() -> str:
+    """
+    Resolve the ChromeDriver binary once per process.
+
+    ChromeDriverManager().install() checks versions (and may hit the network)
+    on every call, so the result is cached after the first lookup.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            _driver_path = ChromeDriverManager().install()
+            logger.info(f"Resolved ChromeDriver at {_driver_path}")
+        return _driver_path
+
+
+class DriverPoolTimeoutError(Exception):
+    """Raised when no driver becomes available within the acquire timeout."""
+
+
+@dataclass
+class _PooledDriver:
+    driver: Any
+    pages: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class DriverLease:
+    """A driver checked out of the pool for one page."""
+
+    driver: Any
+    wait_seconds: float
+    pages_served: int  # Pages this driver rendered before this lease
+    broken: bool = False
+    _pooled: Optional[_PooledDriver] = field(default=None, repr=False)
+
+    def mark_broken(self) -> None:
+        """Flag the driver so it is quit instead of returned to the pool."""
+        self.broken = True
+
+
+class WebDriverPool:
+    """
+    Bounded pool of reusable WebDrivers.
+
+    Usage:
+        pool = WebDriverPool(config, driver_factory=create_driver)
+        with pool.lease() as lease:
+            lease.driver.get(url)
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        config: Optional[ScraperConfig] = None,
+        driver_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.config = config or ScraperConfig()
+        self.size = max(1, self.config.selenium_pool_size)
+        self.max_pages = self.config.selenium_max_pages_per_driver
+        self.acquire_timeout = self.config.selenium_acquire_timeout_seconds
+        self.driver_factory = driver_factory
+
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._idle: "queue.LifoQueue[_PooledDriver]" = queue.LifoQueue()  # Hottest driver first
+        self._lock = threading.Lock()
+        self._closed = False
+        self._warm_started = False
+
+        # Metrics
+        self._live = 0
+        self._in_use = 0
+        self._created = 0
+        self._recycled = 0
+        self._crashed = 0
+        self._leases = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def warm(self, count: Optional[int] = None) -> int:
+        """Pre-launch drivers so the first renders don't pay Chrome startup."""
+        count = min(count or self.size, self.size)
+        launched = 0
+        # Each launch holds a slot, so warming never pushes live drivers past `size`
+        while launched < count and not self._closed and self._slots.acquire(blocking=False):
+            try:
+                if self._live >= self.size:
+                    break
+                self._idle.put(self._create())
+                launched += 1
+            finally:
+                self._slots.release()
+        return launched
+
+    def _warm_in_background(self) -> None:
+        """On the first lease, launch the remaining drivers while that page renders."""
+        with self._lock:
+            if self._warm_started or self.size < 2:
+                return
+            self._warm_started = True
+
+        def run():
+            try:
+                launched = self.warm(self.size - 1)
+                logger.info(f"Warmed {launched} WebDriver(s)")
+            except Exception as e:
+                logger.warning(f"WebDriver pool warm-up failed: {e}")
+
+        threading.Thread(target=run, name="webdriver-pool-warm", daemon=True).start()
+
+    @contextmanager
+    def lease(self) -> Iterator[DriverLease]:
+        """
+        Check out a driver for one page.
+
+        Any exception raised inside the block marks the driver as broken so
+        the next lease gets a fresh one.
+        """
+        lease = self._acquire()
+        self._warm_in_background()
+        try:
+            yield lease
+        except Exception:
+            lease.mark_broken()
+            raise
+        finally:
+            self._release(lease)
+
+    def close(self) -> None:
+        """Quit all idle drivers and refuse new leases."""
+        self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(pooled)
+
+    def stats(self) -> dict:
+        """Pool sizing metrics (for tuning pool size on worker hosts)."""
+        with self._lock:
+            return {
+                "size": self.size,
+                "live": self._live,
+                "in_use": self._in_use,
+                "idle": self._idle.qsize(),
+                "created": self._created,
+                "recycled": self._recycled,
+                "crashed": self._crashed,
+                "leases": self._leases,
+                "total_wait_seconds": round(self._total_wait, 3),
+                "avg_wait_seconds": round(self._total_wait / self._leases, 3) if self._leases else 0.0,
+                "max_wait_seconds": round(self._max_wait, 3),
+            }
+
+    def _acquire(self) -> DriverLease:
+        if self._closed:
+            raise RuntimeError("WebDriverPool is closed")
+
+        start = time.monotonic()
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise DriverPoolTimeoutError(f"No WebDriver available after {self.acquire_timeout}s")
+        wait = time.monotonic() - start
+
+        try:
+            pooled = self._checkout_idle() or self._create()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._in_use += 1
+            self._leases += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+        return DriverLease(
+            driver=pooled.driver,
+            wait_seconds=wait,
+            pages_served=pooled.pages,
+            _pooled=pooled,
+        )
+
+    def _release(self, lease: DriverLease) -> None:
+        pooled = lease._pooled
+        pooled.pages += 1
+        with self._lock:
+            self._in_use -= 1
+
+        try:
+            if lease.broken:
+                with self._lock:
+                    self._crashed += 1
+                self._quit(pooled)
+            elif self._closed or (self.max_pages and pooled.pages >= self.max_pages):
+                with self._lock:
+                    self._recycled += 1
+                self._quit(pooled)
+            else:
+                self._reset(pooled)
+                self._idle.put(pooled)
+        finally:
+            self._slots.release()
+
+    def _checkout_idle(self) -> Optional[_PooledDriver]:
+        """Take an idle driver, discarding any that died while parked."""
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if self._is_alive(pooled):
+                return pooled
+            with self._lock:
+                self._crashed += 1
+            self._quit(pooled)
+
+    def _create(self) -> _PooledDriver:
+        if self.driver_factory is None:
+            raise RuntimeError("WebDriverPool has no driver_factory")
+        driver = self.driver_factory()
+        with self._lock:
+            self._live += 1
+            self._created += 1
+        return _PooledDriver(driver=driver)
+
+    def _quit(self, pooled: _PooledDriver) -> None:
+        with self._lock:
+            self._live -= 1
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"Ignoring error while quitting WebDriver: {e}")
+
+    @staticmethod
+    def _is_alive(pooled: _PooledDriver) -> bool:
+        try:
+            pooled.driver.current_url  # Round-trip to chromedriver
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(pooled: _PooledDriver) -> None:
+        """Clear per-site state so companies don't leak into each other."""
+        try:
+            pooled.driver.delete_all_cookies()
+            pooled.driver.get("about:blank")
+        except Exception:
+            # Reset failure means the driver is unhealthy; _checkout_idle will drop it
+            pass
@@ -0,0 +1,89 @@
+"""Adaptive httpx → browser escalation.
+
+With `config.adaptive_escalation`, pages that would go to Selenium or the
+generic scraper are fetched with plain HTTP first. Only responses that look
+like an unrendered SPA shell are re-fetched in a browser:
+
+- "empty_root": an empty framework mount point (<div id="root"></div>,
+  #app, #__next, #__nuxt, <app-root>) and almost no visible text
+- "next_data_only": a __NEXT_DATA__ payload with almost no visible text
+- "tiny_text": almost no visible text on a page that loads scripts
+
+TierMemory remembers which tier worked for each host, so later visits go
+straight to the browser (or skip it) without probing again.
+"""
+
+import re
+import time
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import urlsplit
+
+from app.services.scrapers.types import ScraperStrategy
+
+_EMPTY_MOUNT = re.compile(
+    r"<(div|main|section)\b[^>]*\bid\s*=\s*[\"']?(?:root|app|__next|__nuxt|svelte)(?=[\"'\s>])[\"']?[^>]*>\s*</\1\s*>"
+    r"|<app-root\b[^>]*>\s*</app-root\s*>",
+    re.IGNORECASE,
+)
+_NEXT_DATA = re.compile(r"<script\b[^>]*\bid\s*=\s*[\"']__NEXT_DATA__[\"']", re.IGNORECASE)
+_SCRIPT_SRC = re.compile(r"<script\b[^>]*\bsrc\s*=", re.IGNORECASE)
+
+
+def spa_shell_reason(html: Optional[str], text: Optional[str], min_text_chars: int) -> Optional[str]:
+    """Why an HTTP response looks like an unrendered SPA shell, or None if it doesn't."""
+    if not html:
+        return None
+    if len(text or "") >= min_text_chars:
+        return None  # Server-rendered content beside an empty mount (e.g. a portal root) is enough
+    if _EMPTY_MOUNT.search(html):
+        return "empty_root"
+    if _NEXT_DATA.search(html):
+        return "next_data_only"
+    if _SCRIPT_SRC.search(html):
+        return "tiny_text"
+    return None
+
+
+class TierMemory:
+    """
+    Which strategy (HTTP or browser) last produced usable content per host.
+
+    An in-memory LRU of `max_entries` hosts; entries expire after `ttl_hours`
+    so sites that add server-side rendering are re-probed eventually.
+    """
+
+    def __init__(self, max_entries: int = 2048, ttl_hours: float = 24):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_hours * 3600
+        self._hosts: OrderedDict[str, tuple[ScraperStrategy, float]] = OrderedDict()
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    def get(self, url: str) -> Optional[ScraperStrategy]:
+        host = self._host(url)
+        entry = self._hosts.get(host)
+        if entry is None:
+            return None
+        strategy, remembered_at = entry
+        if time.time() - remembered_at > self.ttl_seconds:
+            del self._hosts[host]
+            return None
+        self._hosts.move_to_end(host)
+        return strategy
+
+    def remember(self, url: str, strategy: ScraperStrategy) -> None:
+        host = self._host(url)
+        self._hosts[host] = (strategy, time.time())
+        self._hosts.move_to_end(host)
+        while len(self._hosts) > self.max_entries:
+            self._hosts.popitem(last=False)
+
+    def forget(self, url: str) -> None:
+        self._hosts.pop(self._host(url), None)
+
+    def snapshot(self) -> dict[str, str]:
+        """Host → remembered strategy, for logging and tests."""
+        return {host: strategy.value for host, (strategy, _) in self._hosts.items()}
@@ -0,0 +1,185 @@
+"""Priority crawl frontier for finding job postings on a company site.
+
+Links are scored by how likely they are to lead to a job posting (see
+`score_link`): ATS job URLs and /jobs/<slug> pages first, then career
+listing pages, then anything else with a careers keyword in its path or
+anchor text. Blog, legal, login and media links score 0 and are dropped.
+
+`CrawlFrontier` keeps a priority queue ordered by that score (ties go to
+the shallower, earlier link), a seen-set of canonical URLs for the run,
+and the crawl's budgets:
+- max_depth: links found at this depth are kept as results but not fetched
+- max_pages: pages fetched in total
+- same-site: only the root's host and its subdomains are fetched;
+  off-site ATS links are kept as results, other off-site links are dropped
+
+`crawl` pops the best pages a batch at a time, fetches them through the
+orchestrator and feeds their links back into the frontier, stopping once
+enough postings are known or a budget runs out.
+
+Usage:
+    frontier = CrawlFrontier("https://acme.com/", max_depth=2, max_pages=5)
+    frontier.add_links(homepage_doc, "https://acme.com/", depth=1)
+    links = await crawl(orchestrator, frontier, want=10)
+"""
+
+import heapq
+import itertools
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urljoin, urlsplit
+
+from app.services.scrapers.ats_detector import ATSDetector
+from app.services.scrapers.document import ParsedDocument
+from app.services.scrapers.urls import canonical_url
+
+# Scores at or above this are postings (or ATS boards), not listing pages
+POSTING_SCORE = 7.0
+
+AVOID_PATH = re.compile(
+    r"/(blog|news|press|events?|privacy|terms|legal|cookies?|login|sign-?in|sign-?up|cart|search|tags?|category)(/|$)"
+    r"|\.(pdf|jpe?g|png|gif|svg|webp|zip|mp4|css|js)$",
+    re.IGNORECASE,
+)
+JOB_ID_QUERY = re.compile(r"(^|&)(gh_jid|jobid|job_id|jid|posting_id|req(uisition)?_?id)=", re.IGNORECASE)
+JOB_SECTION = r"(jobs?|careers?|positions?|openings?|vacanc(y|ies)|roles?|postings?)"
+POSTING_PATH = re.compile(rf"/{JOB_SECTION}/(.+/)?[^/]*[a-z0-9][^/]*/?$", re.IGNORECASE)  # Something after the section
+LISTING_PATH = re.compile(rf"/({JOB_SECTION}|join(-us)?|work-with-us|hiring)/?$", re.IGNORECASE)
+PATH_KEYWORDS = ("career", "job", "opening", "position", "vacanc", "work-with-us", "join", "team", "hiring")
+ROLE_WORDS = re.compile(
+    r"\b(engineer|developer|scientist|manager|designer|analyst|architect|researcher|intern|specialist|head of)\b",
+    re.IGNORECASE,
+)
+TEXT_KEYWORDS = re.compile(r"\b(jobs?|careers?|apply|openings?|positions?|vacanc(y|ies)|join us|we're hiring)\b", re.IGNORECASE)
+
+_ats = ATSDetector()
+
+
+def score_link(url: str, anchor_text: str = "") -> float:
+    """How likely `url` (absolute) leads to a job posting; 0 means not job-related."""
+    parts = urlsplit(url)
+    path = parts.path
+    if AVOID_PATH.search(path):
+        return 0.0
+
+    if _ats.is_ats_url(url):
+        score = 10.0 if re.search(r"\d{3,}|/jobs?/.", path) else 8.0
+    elif JOB_ID_QUERY.search(parts.query):
+        score = 9.0
+    elif POSTING_PATH.search(path):
+        score = POSTING_SCORE
+    elif LISTING_PATH.search(path):
+        score = 5.0
+    elif any(keyword in path.lower() for keyword in PATH_KEYWORDS):
+        score = 3.0
+    elif TEXT_KEYWORDS.search(anchor_text):
+        score = 1.0
+    else:
+        return 0.0
+
+    if ROLE_WORDS.search(anchor_text) or ROLE_WORDS.search(path.replace("-", " ")):
+        score += 2.0
+    elif TEXT_KEYWORDS.search(anchor_text):
+        score += 1.0
+    return score
+
+
+def _host(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def same_site(url: str, root_url: str) -> bool:
+    """True if `url` is on the root's host or one of its subdomains."""
+    host, root = _host(url), _host(root_url)
+    return host == root or host.endswith("." + root)
+
+
+@dataclass(order=True)
+class FrontierItem:
+    sort_key: tuple = field(repr=False)  # (-score, depth, sequence)
+    url: str = field(compare=False)
+    score: float = field(compare=False)
+    depth: int = field(compare=False)
+
+
+class CrawlFrontier:
+    """Priority queue of pages to fetch, plus every scored link seen in the run."""
+
+    def __init__(self, root_url: str, max_depth: int = 2, max_pages: int = 5):
+        self.root_url = root_url
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.pages_fetched = 0
+        self._queue: list[FrontierItem] = []
+        self._seen: dict[str, FrontierItem] = {}  # Canonical URL -> item, fetched or not
+        self._sequence = itertools.count()
+        self._seen.setdefault(canonical_url(root_url), self._item(root_url, 0.0, 0))
+
+    def _item(self, url: str, score: float, depth: int) -> FrontierItem:
+        return FrontierItem((-score, depth, next(self._sequence)), url, score, depth)
+
+    def add(self, url: str, anchor_text: str = "", depth: int = 1) -> bool:
+        """Score and record a link; queue it for fetching if within the budgets. False if dropped."""
+        if not url.startswith(("http://", "https://")):
+            return False
+        key = canonical_url(url)
+        if key in self._seen:
+            return False
+        score = score_link(url, anchor_text)
+        if score <= 0:
+            return False
+        on_site = same_site(url, self.root_url)
+        if not on_site and not _ats.is_ats_url(url):
+            return False
+
+        item = self._item(url, score, depth)
+        self._seen[key] = item
+        if on_site and depth < self.max_depth:
+            heapq.heappush(self._queue, item)
+        return True
+
+    def add_links(self, document: Optional[ParsedDocument], page_url: str, depth: int) -> int:
+        """Add every anchor and iframe of a fetched page; returns how many were new."""
+        if document is None:
+            return 0
+        added = sum(self.add(urljoin(page_url, a.href), a.text, depth) for a in document.anchors)
+        added += sum(self.add(urljoin(page_url, src), "", depth) for src in document.iframes)
+        return added
+
+    def pop_batch(self, size: int) -> list[FrontierItem]:
+        """Best queued pages, at most `size` and never past the page budget."""
+        size = min(size, self.max_pages - self.pages_fetched)
+        batch = [heapq.heappop(self._queue) for _ in range(min(size, len(self._queue)))]
+        self.pages_fetched += len(batch)
+        return batch
+
+    def ranked(self, min_score: float = 0.0, limit: Optional[int] = None) -> list[str]:
+        """Links seen so far scoring at least `min_score`, best first."""
+        items = sorted(item for item in self._seen.values() if item.score > 0 and item.score >= min_score)
+        return [item.url for item in items[:limit]]
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    @property
+    def exhausted(self) -> bool:
+        return not self._queue or self.pages_fetched >= self.max_pages
+
+
+async def crawl(scraper, frontier: CrawlFrontier, want: int = 10, batch_size: int = 3) -> list[str]:
+    """
+    Fetch frontier pages best-first until `want` postings are known or a budget
+    runs out; returns up to `want` job links, best first.
+
+    `scraper` is a ScraperOrchestrator (anything with `scrape_batch`).
+    """
+    while not frontier.exhausted and len(frontier.ranked(POSTING_SCORE)) < want:
+        batch = frontier.pop_batch(batch_size)
+        results = await scraper.scrape_batch([item.url for item in batch])
+        for item, result in zip(batch, results):
+            if result.success:
+                frontier.add_links(result.parsed_document(), result.url, item.depth + 1)
+    return frontier.ranked(limit=want)
@@ -1,9 +1,17 @@
 """Generic HTML scraper using BeautifulSoup - lightweight fallback."""
 
 import httpx
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 from app.services.scrapers.base import BaseScraper
+from app.services.scrapers.charset import decode_body
+from app.services.scrapers.http_client import (
+    SharedHttpClient,
+    build_http_client,
+    is_html_content_type,
+    read_capped,
+)
 from app.services.scrapers.types import ScraperResult, ScraperConfig, ScraperStrategy
 
 
@@ -15,42 +23,115 @@ class GenericHtmlScraper(BaseScraper):
     - Static HTML pages
     - Simple career pages without heavy JS
     - Fast, lightweight scraping
+    
+    When given a SharedHttpClient (the orchestrator passes its own), requests
+    reuse pooled keep-alive connections. Standalone instances fall back to a
+    short-lived client per request.
+    
+    Response validators (ETag / Last-Modified) are returned in metadata; pass
+    them back as conditional `headers` to get a cheap 304 when unchanged.
+    
+    Bodies are streamed: non-HTML responses are rejected from their headers
+    and pages are cut off at `config.max_body_bytes` (metadata["truncated"]).
+    Bodies are decoded by charset.py: declared and <meta> charsets first,
+    statistical detection only as a last resort (metadata["charset_source"]).
     """
     
     strategy = ScraperStrategy.GENERIC_HTML
     
+    def __init__(
+        self,
+        config: Optional[ScraperConfig] = None,
+        http: Optional[SharedHttpClient] = None,
+    ):
+        super().__init__(config)
+        self.http = http
+    
     def can_handle(self, url: str) -> bool:
         """Generic scraper can handle any URL as fallback."""
         return True
     
-    async def scrape(self, url: str) -> ScraperResult:
-        """Scrape using httpx for simple HTTP requests."""
+    @asynccontextmanager
+    async def _stream(self, url: str, headers: Optional[dict]) -> AsyncIterator[httpx.Response]:
+        """Open a streamed GET (headers only until the body is iterated)."""
+        if self.http is not None:
+            async with self.http.host_slot(url):
+                async with self.http.client.stream("GET", url, headers=headers) as response:
+                    yield response
+        else:
+            async with build_http_client(self.config) as client:
+                async with client.stream("GET", url, headers=headers) as response:
+                    yield response
+    
+    async def scrape(self, url: str, headers: Optional[dict] = None) -> ScraperResult:
+        """
+        Scrape using httpx for simple HTTP requests.
+        
+        Args:
+            url: The URL to scrape
+            headers: Extra request headers (e.g. If-None-Match for revalidation)
+        """
         try:
-            async with httpx.AsyncClient(
-                timeout=self.config.timeout_seconds,
-                follow_redirects=True,
-                verify=False,  # Bypass SSL errors for scraping resilience
-            ) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": self.config.user_agent},
-                )
+            async with self._stream(url, headers) as response:
+                validators = {
+                    "etag": response.headers.get("etag"),
+                    "last_modified": response.headers.get("last-modified"),
+                }
+                
+                if response.status_code == 304:
+                    # Conditional request: caller's copy is still current, no body sent
+                    return ScraperResult(
+                        url=url,
+                        success=True,
+                        strategy_used=self.strategy,
+                        metadata={"status_code": 304, "not_modified": True, **validators},
+                    )
                 response.raise_for_status()
                 
-                html = response.text
+                # Reject PDFs, media and bundles from the headers, before any body is read
+                content_type = response.headers.get("content-type", "")
+                if not is_html_content_type(content_type):
+                    return ScraperResult(
+                        url=url,
+                        success=False,
+                        strategy_used=self.strategy,
+                        error_message=f"Unsupported content type: {content_type}",
+                        metadata={"status_code": response.status_code, "content_type": content_type},
+                    )
                 
-                return ScraperResult(
-                    url=url,
-                    success=True,
-                    strategy_used=self.strategy,
-                    raw_html=html,
-                    extracted_text=self._extract_text_from_html(html),
-                    title=self._extract_title(html),
-                    metadata={
-                        "status_code": response.status_code,
-                        "content_type": response.headers.get("content-type", ""),
-                    },
-                )
+                body, truncated = await read_capped(response, self.config.max_body_bytes)
+                declared_charset = response.charset_encoding
+                http_version = response.http_version
+                status_code = response.status_code
+                declared_length = response.headers.get("content-length")
+            
+            decoded = decode_body(body, declared_charset)
+            html = decoded.text
+            document = self._parse(html)
+            
+            return ScraperResult(
+                url=url,
+                success=True,
+                strategy_used=self.strategy,
+                raw_html=html,
+                extracted_text=document.text,
+                title=document.title,
+                document=document,
+                html_parser=self.config.html_parser,
+                text_mode=self.config.text_mode,
+                metadata={
+                    "status_code": status_code,
+                    "content_type": content_type,
+                    "http_version": http_version,
+                    "body_bytes": len(body),
+                    "charset": decoded.encoding,
+                    "charset_source": decoded.source,
+                    **self._text_metadata(document),
+                    "truncated": truncated,
+                    "content_length": int(declared_length) if declared_length and declared_length.isdigit() else None,
+                    **validators,
+                },
+            )
                 
         except httpx.TimeoutException:
             return ScraperResult(
@@ -58,6 +139,7 @@ class GenericHtmlScraper(BaseScraper):
                 success=False,
                 strategy_used=self.strategy,
                 error_message=f"Timeout after {self.config.timeout_seconds}s",
+                metadata={"error_kind": "timeout"},
             )
         except httpx.HTTPStatusError as e:
             return ScraperResult(
@@ -65,6 +147,15 @@ class GenericHtmlScraper(BaseScraper):
                 success=False,
                 strategy_used=self.strategy,
                 error_message=f"HTTP {e.response.status_code}: {e.response.reason_phrase}",
+                metadata={"error_kind": "http_status", "status_code": e.response.status_code},
+            )
+        except httpx.TransportError as e:
+            return ScraperResult(
+                url=url,
+                success=False,
+                strategy_used=self.strategy,
+                error_message=f"Connection failed: {str(e) or type(e).__name__}",
+                metadata={"error_kind": "connect"},
             )
         except Exception as e:
             return ScraperResult(
@@ -0,0 +1,255 @@
+"""Record/replay archive for outbound HTTP and search traffic.
+
+Profiling `score_company` against live Google, live company sites and
+Chrome gives noisy, unrepeatable timings. An HttpArchive captures every
+exchange once and serves it back later, so the whole pipeline can run
+offline and runs can be compared between commits:
+
+- record: requests go out as usual and each exchange is appended to a
+  gzip archive (one gzip member per entry, so a crash loses at most the
+  entry being written)
+- replay: nothing goes out; responses come from the archive, and a
+  request that was never recorded fails like an unreachable host
+
+Two paths are covered: httpx clients (`ArchiveTransport`, used by the
+scrapers' shared client and the discovery probes) and the search client
+(`archived_search`). Repeated requests for the same key are
+replayed in recorded order; once exhausted the last one is repeated.
+Browser renders can't be archived, so archive runs stay on the HTTP tier.
+"""
+
+import base64
+import gzip
+import json
+import logging
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import httpx
+
+from app.services.scrapers.http_client import read_capped
+
+logger = logging.getLogger(__name__)
+
+OFF = "off"
+RECORD = "record"
+REPLAY = "replay"
+
+# Stored bodies are already decoded, so these no longer describe them
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+@dataclass
+class SearchHit:
+    """Replayed search result; same attributes as googlesearch's advanced results."""
+
+    url: str
+    title: str
+    description: str
+
+
+class HttpArchive:
+    """
+    Gzip archive of HTTP exchanges and search results, in record or replay mode.
+
+    Recording starts a fresh archive at `path`. Thread-safe: discovery
+    records from a worker thread while scrapers record on the event loop.
+    """
+
+    def __init__(self, path: str, mode: str):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown HTTP archive mode {mode!r}; expected {RECORD!r} or {REPLAY!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.misses = 0  # Replay lookups with no recorded entry
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, list[dict]] = defaultdict(list)
+        self._served: Counter = Counter()
+
+        if mode == RECORD:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.unlink(missing_ok=True)
+        else:
+            self._load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    @staticmethod
+    def _key(entry: dict) -> tuple:
+        if entry["kind"] == "search":
+            return ("search", entry["query"], entry["num_results"])
+        return ("http", entry["method"], entry["url"])
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[self._key(entry)].append(entry)
+        logger.info(f"Replaying {sum(map(len, self._entries.values()))} archived exchanges from {self.path}")
+
+    def rewind(self) -> None:
+        """Replay from the first recorded entry of every key again."""
+        with self._lock:
+            self._served.clear()
+            self.misses = 0
+
+    def record(self, entry: dict) -> None:
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line)
+
+    def lookup(self, key: tuple) -> Optional[dict]:
+        """Next recorded entry for `key` (the last one once exhausted), or None."""
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses += 1
+                logger.warning(f"Not in HTTP archive: {' '.join(map(str, key[1:]))}")
+                return None
+            index = min(self._served[key], len(entries) - 1)
+            self._served[key] += 1
+            return entries[index]
+
+    def record_http(
+        self,
+        method: str,
+        url: str,
+        status: Optional[int] = None,
+        headers: Iterable[tuple[str, str]] = (),
+        body: bytes = b"",
+        error: Optional[str] = None,
+    ) -> None:
+        self.record({
+            "kind": "http",
+            "method": method,
+            "url": url,
+            "status": status,
+            "headers": [[k, v] for k, v in headers if k.lower() not in DROPPED_HEADERS],
+            "body": base64.b64encode(body).decode("ascii"),
+            "error": error,  # "timeout" / "connect" when no response came back
+        })
+
+
+_archives: dict[tuple[str, str], HttpArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def open_archive(path: Optional[str], mode: str) -> Optional[HttpArchive]:
+    """Process-wide archive for (path, mode); None when archiving is off."""
+    if mode == OFF or not path:
+        return None
+    key = (str(Path(path).resolve()), mode)
+    with _archives_lock:
+        if key not in _archives:
+            _archives[key] = HttpArchive(path, mode)
+        return _archives[key]
+
+
+def shared_archive() -> Optional[HttpArchive]:
+    """The archive configured by HTTP_ARCHIVE_MODE / HTTP_ARCHIVE_PATH, if any."""
+    from app.core.config import settings
+    return open_archive(settings.HTTP_ARCHIVE_PATH, settings.HTTP_ARCHIVE_MODE)
+
+
+class ArchiveTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that records through `inner` or replays from the archive.
+
+    Recorded bodies are read in full (up to `max_body_bytes`) so they can be
+    stored; the caller then streams them from memory.
+    """
+
+    def __init__(
+        self,
+        archive: HttpArchive,
+        inner: Optional[httpx.AsyncBaseTransport] = None,
+        max_body_bytes: int = 5 * 1024 * 1024,
+    ):
+        self.archive = archive
+        self.inner = inner
+        self.max_body_bytes = max_body_bytes
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        method, url = request.method, str(request.url)
+        if self.archive.replaying:
+            return self._replay(request)
+
+        try:
+            response = await self.inner.handle_async_request(request)
+        except httpx.TimeoutException:
+            self.archive.record_http(method, url, error="timeout")
+            raise
+        except httpx.TransportError:
+            self.archive.record_http(method, url, error="connect")
+            raise
+        try:
+            body, _ = await read_capped(response, self.max_body_bytes)
+        finally:
+            await response.aclose()
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in DROPPED_HEADERS]
+        self.archive.record_http(method, url, response.status_code, headers, body)
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    def _replay(self, request: httpx.Request) -> httpx.Response:
+        entry = self.archive.lookup(("http", request.method, str(request.url)))
+        if entry is None:
+            raise httpx.ConnectError(f"Not in HTTP archive: {request.url}", request=request)
+        if entry["error"] == "timeout":
+            raise httpx.ReadTimeout("Archived timeout", request=request)
+        if entry["error"]:
+            raise httpx.ConnectError("Archived connection failure", request=request)
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=base64.b64decode(entry["body"]),
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        if self.inner is not None:
+            await self.inner.aclose()
+
+
+def archived_search(
+    archive: Optional[HttpArchive],
+    query: str,
+    num_results: int,
+    search: Callable[[], Iterable],
+) -> list:
+    """
+    Search results for `query`, through the archive.
+
+    `search` runs the live query. Recorded errors (rate limits etc.) are
+    re-raised on replay with the same message; a query that was never
+    recorded returns no results.
+    """
+    if archive is None:
+        return list(search())
+    key = ("search", query, num_results)
+    if archive.replaying:
+        entry = archive.lookup(key)
+        if entry is None:
+            return []
+        if entry["error"]:
+            raise RuntimeError(entry["error"])
+        return [SearchHit(**hit) for hit in entry["results"]]
+    try:
+        results = list(search())
+    except Exception as e:
+        archive.record({"kind": "search", "query": query, "num_results": num_results, "results": [], "error": str(e)})
+        raise
+    archive.record({
+        "kind": "search",
+        "query": query,
+        "num_results": num_results,
+        "results": [{"url": r.url, "title": r.title, "description": r.description} for r in results],
+        "error": None,
+    })
+    return results
@@ -0,0 +1,165 @@
+"""Shared, long-lived HTTP client for scraping.
+
+One pooled httpx.AsyncClient is reused for every fetch in a scoring run, so
+satellite, deep-link and subdomain requests to the same host share TCP+TLS
+connections instead of paying a fresh handshake each time.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.services.scrapers.types import ScraperConfig
+
+logger = logging.getLogger(__name__)
+
+
+def http2_available() -> bool:
+    """Check if the optional HTTP/2 dependency (h2) is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Content types parsed as pages; anything else (PDF, video, images, JS bundles) is rejected
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+
+def is_html_content_type(content_type: str) -> bool:
+    """True for HTML-like media types. A missing Content-Type is given the benefit of the doubt."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return not media_type or media_type in HTML_CONTENT_TYPES
+
+
+async def read_capped(response: httpx.Response, max_bytes: int) -> tuple[bytes, bool]:
+    """
+    Read a streamed response body, stopping after `max_bytes`.
+
+    Returns (body, truncated). The rest of the body is never downloaded;
+    closing the stream drops the connection instead of draining it.
+    """
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        remaining = max_bytes - len(body)
+        if len(chunk) > remaining:
+            body.extend(chunk[:remaining])
+            return bytes(body), True
+        body.extend(chunk)
+    return bytes(body), False
+
+
+def build_http_client(
+    config: ScraperConfig,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> httpx.AsyncClient:
+    """Create an AsyncClient configured from ScraperConfig."""
+    http2 = config.http2 and http2_available()
+    if config.http2 and not http2:
+        logger.warning("HTTP/2 requested but 'h2' is not installed. Run: pip install httpx[http2]")
+
+    limits = httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry_seconds,
+    )
+
+    if transport is None and config.http_archive_mode != "off":
+        from app.services.scrapers.http_archive import ArchiveTransport, open_archive
+        archive = open_archive(config.http_archive_path, config.http_archive_mode)
+        if archive is not None:
+            # A custom transport replaces the client's own, so it carries verify/http2/limits
+            inner = None if archive.replaying else httpx.AsyncHTTPTransport(verify=False, http2=http2, limits=limits)
+            transport = ArchiveTransport(archive, inner, config.max_body_bytes)
+
+    return httpx.AsyncClient(
+        timeout=config.timeout_seconds,
+        follow_redirects=True,
+        verify=False,  # Bypass SSL errors for scraping resilience
+        http2=http2,
+        limits=limits,
+        headers={"User-Agent": config.user_agent},
+        transport=transport,
+    )
+
+
+class HostLimiter:
+    """
+    Caps concurrent requests per host.
+
+    httpx.Limits only bounds the pool as a whole, so without this a single
+    slow host could take every connection in the pool.
+    """
+
+    def __init__(self, per_host: int):
+        self.per_host = max(1, per_host)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def slot(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore guarding the host of `url` (use with `async with`)."""
+        host = (urlparse(url).hostname or "").lower()
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host)
+            self._semaphores[host] = semaphore
+        return semaphore
+
+
+class SharedHttpClient:
+    """
+    Lazily-created pooled client plus per-host limiter, owned by the orchestrator.
+
+    The client is bound to the event loop it was created on. If it is used from
+    a different loop (e.g. successive asyncio.run() calls in scripts), a fresh
+    client is created rather than reusing connections from a dead loop.
+
+    Usage:
+        http = SharedHttpClient(config)
+        async with http.host_slot(url):
+            response = await http.client.get(url)
+        await http.aclose()
+    """
+
+    def __init__(
+        self,
+        config: Optional[ScraperConfig] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.config = config or ScraperConfig()
+        self.transport = transport  # Override for tests / offline runs
+        self._client: Optional[httpx.AsyncClient] = None
+        self._limiter: Optional[HostLimiter] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the pooled client, creating it for the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = build_http_client(self.config, self.transport)
+            self._limiter = HostLimiter(self.config.max_connections_per_host)
+            self._loop = loop
+        return self._client
+
+    def host_slot(self, url: str) -> asyncio.Semaphore:
+        """Per-host concurrency slot for `url`."""
+        self.client  # Ensure limiter exists for the running loop
+        return self._limiter.slot(url)
+
+    async def aclose(self) -> None:
+        """Close pooled connections. Safe to call multiple times."""
+        client, self._client = self._client, None
+        self._limiter = None
+        if client is None or client.is_closed:
+            return
+        try:
+            if self._loop is asyncio.get_running_loop():
+                await client.aclose()
+        except RuntimeError:
+            # Loop that owned the client is gone; connections die with it
+            pass
+        self._loop = None
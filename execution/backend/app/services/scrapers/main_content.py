@@ -0,0 +1,266 @@
+"""Readability-style main-content extraction.
+
+The "full" text mode keeps everything outside script/style/nav/footer/header,
+so cookie banners, div-based mega-menus and footers, and repeated boilerplate
+are counted by signal extraction as if they were page content. The "main"
+mode (ScraperConfig.text_mode) keeps just the page's main content block:
+
+1. elements whose class/id look like boilerplate (cookie, consent, menu,
+   footer, sidebar, share, ...) are dropped, unless they also look like
+   content (article, main, job, description, ...)
+2. every text block of 25+ chars scores 1 + its commas + 1 per 100 chars
+   (max 3), credited in full to its parent, half to its grandparent and a
+   third to the next ancestor
+3. each candidate's score is adjusted by tag and class/id hints, then
+   scaled by (1 - link density), so link lists and menus lose to prose
+4. the best candidate wins, together with any sibling scoring at least
+   a fifth of it (or a prose paragraph), so split layouts aren't cut in half;
+   if it sits inside <main>, <article> or role="main", the page said where
+   its content is and that whole landmark is kept instead
+
+If the winner holds too little text the page has no clear main block and
+the full text is kept. The tree walk is backend-neutral: SoupTree and
+LexborTree adapt BeautifulSoup and selectolax trees.
+"""
+
+import re
+from typing import Callable, Iterator, Optional
+
+TEXT_MODES = ("full", "main")
+
+# Removed outright in main mode (NON_CONTENT_TAGS are already gone)
+NOISE_TAGS = {"aside", "form", "noscript", "svg", "button", "select", "dialog", "template", "iframe"}
+
+POSITIVE = re.compile(
+    r"article|body|content|entry|main|post|text|story|job|posting|description|career|opening|position|role",
+    re.IGNORECASE,
+)
+NEGATIVE = re.compile(
+    r"banner|breadcrumb|comment|consent|cookie|disclaimer|footer|gdpr|header|masthead|menu|modal|"
+    r"nav|newsletter|overlay|popup|promo|related|share|sidebar|social|sponsor|subscribe|widget",
+    re.IGNORECASE,
+)
+
+BLOCK_TAGS = {
+    "address", "article", "blockquote", "dd", "div", "dl", "dt", "figure", "h1", "h2", "h3", "h4",
+    "h5", "h6", "li", "main", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul",
+}
+PARAGRAPH_TAGS = {"p", "pre", "td", "li", "blockquote", "dd", "dt"}
+CONTAINER_TAGS = {"div", "section", "article", "main", "span"}  # Text blocks when they hold no blocks
+KEEP_TAGS = {"html", "body", "main", "article"}  # Never dropped as boilerplate
+
+TAG_WEIGHTS = {
+    "main": 10, "article": 10, "div": 5, "section": 5,
+    "pre": 3, "td": 3, "blockquote": 3,
+    "ol": -3, "ul": -3, "dl": -3, "dd": -3, "dt": -3, "li": -3,
+    "h1": -5, "h2": -5, "h3": -5, "h4": -5, "h5": -5, "h6": -5, "th": -5,
+}
+
+MIN_BLOCK_CHARS = 25
+MIN_MAIN_CHARS = 200  # Less than this in the winner: no clear main block, keep the full text
+SIBLING_SHARE = 0.2
+
+
+class SoupTree:
+    """BeautifulSoup adapter."""
+
+    def __init__(self, soup):
+        self.root = soup.body or soup
+
+    def elements(self) -> Iterator:
+        return iter(self.root.find_all(True))
+
+    key = staticmethod(id)
+
+    @staticmethod
+    def tag(node) -> str:
+        return node.name
+
+    @staticmethod
+    def hints(node) -> tuple[str, str, str]:
+        """(class, id, role) attribute strings."""
+        classes = node.get("class") or []
+        return " ".join(classes) if isinstance(classes, list) else classes, node.get("id") or "", node.get("role") or ""
+
+    @staticmethod
+    def parent(node):
+        parent = node.parent
+        return parent if parent is not None and parent.name != "[document]" else None
+
+    @staticmethod
+    def children(node) -> list:
+        return node.find_all(True, recursive=False)
+
+    @staticmethod
+    def text(node) -> str:
+        return node.get_text(separator=" ", strip=True)
+
+    @staticmethod
+    def link_text(node) -> int:
+        return sum(len(a.get_text(separator=" ", strip=True)) for a in node.find_all("a"))
+
+    @staticmethod
+    def remove(node) -> None:
+        node.decompose()
+
+
+def _is_element(node) -> bool:
+    return bool(node.tag) and not node.tag.startswith(("-", "_"))  # Not "-text" or "_comment"
+
+
+class LexborTree:
+    """selectolax (lexbor) adapter."""
+
+    def __init__(self, tree):
+        self.root = tree.body or tree.root
+
+    def elements(self) -> Iterator:
+        return (node for node in self.root.traverse(include_text=False) if _is_element(node))
+
+    @staticmethod
+    def key(node) -> int:
+        return node.mem_id
+
+    @staticmethod
+    def tag(node) -> str:
+        return node.tag
+
+    @staticmethod
+    def hints(node) -> tuple[str, str, str]:
+        attributes = node.attributes
+        return attributes.get("class") or "", attributes.get("id") or "", attributes.get("role") or ""
+
+    @staticmethod
+    def parent(node):
+        return node.parent
+
+    @staticmethod
+    def children(node) -> list:
+        return [child for child in node.iter(include_text=False) if _is_element(child)]
+
+    @staticmethod
+    def text(node) -> str:
+        return node.text(separator=" ", strip=True)
+
+    @staticmethod
+    def link_text(node) -> int:
+        return sum(len(a.text(separator=" ", strip=True)) for a in node.css("a"))
+
+    @staticmethod
+    def remove(node) -> None:
+        node.decompose()
+
+
+def _class_weight(tree, node) -> int:
+    classes, node_id, role = tree.hints(node)
+    weight = 25 if role == "main" else 0
+    for hint in (classes, node_id):
+        if not hint:
+            continue
+        if NEGATIVE.search(hint):
+            weight -= 25
+        if POSITIVE.search(hint):
+            weight += 25
+    return weight
+
+
+def _is_boilerplate(tree, node) -> bool:
+    if tree.tag(node) in KEEP_TAGS:
+        return False
+    classes, node_id, role = tree.hints(node)
+    if role in ("navigation", "banner", "contentinfo", "dialog", "alertdialog", "complementary"):
+        return True
+    hint = f"{classes} {node_id}"
+    return bool(NEGATIVE.search(hint)) and not POSITIVE.search(hint)
+
+
+def _strip_boilerplate(tree) -> None:
+    targets = [node for node in tree.elements() if tree.tag(node) in NOISE_TAGS or _is_boilerplate(tree, node)]
+    removed = {tree.key(node) for node in targets}
+    for node in targets:
+        # Removing an ancestor already removed this node
+        ancestor = tree.parent(node)
+        while ancestor is not None and tree.key(ancestor) not in removed:
+            ancestor = tree.parent(ancestor)
+        if ancestor is None:
+            tree.remove(node)
+
+
+def _is_text_block(tree, node) -> bool:
+    tag = tree.tag(node)
+    if tag in PARAGRAPH_TAGS:
+        return True
+    return tag in CONTAINER_TAGS and not any(tree.tag(child) in BLOCK_TAGS for child in tree.children(node))
+
+
+def _landmark(tree, node):
+    """Nearest <main>/<article>/role="main" element containing `node`, if any."""
+    while node is not None:
+        if tree.tag(node) in ("main", "article") or tree.hints(node)[2] == "main":
+            return node
+        node = tree.parent(node)
+    return None
+
+
+def _link_density(tree, node, text: str) -> float:
+    return min(1.0, tree.link_text(node) / len(text)) if text else 1.0
+
+
+def extract_main_text(tree, normalize: Callable[[str], str]) -> Optional[str]:
+    """
+    Main-content text of `tree` (a SoupTree or LexborTree), or None if the
+    page has no clear main block. Mutates the tree.
+    """
+    _strip_boilerplate(tree)
+
+    nodes: dict[int, object] = {}
+    scores: dict[int, float] = {}
+    for node in list(tree.elements()):
+        if not _is_text_block(tree, node):
+            continue
+        text = tree.text(node)
+        if len(text) < MIN_BLOCK_CHARS:
+            continue
+        score = 1 + text.count(",") + min(len(text) / 100, 3)
+        ancestor, level = tree.parent(node), 0
+        while ancestor is not None and level < 3:
+            key = tree.key(ancestor)
+            if key not in scores:
+                nodes[key] = ancestor
+                scores[key] = TAG_WEIGHTS.get(tree.tag(ancestor), 0) + _class_weight(tree, ancestor)
+            scores[key] += score / (1 if level == 0 else level * 2)
+            ancestor, level = tree.parent(ancestor), level + 1
+
+    if not scores:
+        return None
+    texts = {key: tree.text(node) for key, node in nodes.items()}
+    final = {key: score * (1 - _link_density(tree, nodes[key], texts[key])) for key, score in scores.items()}
+    top_key = max(final, key=final.get)
+    top = nodes[top_key]
+
+    landmark = _landmark(tree, top)
+    if landmark is not None:
+        main = normalize(tree.text(landmark))
+        return main if len(main) >= MIN_MAIN_CHARS else None
+
+    parent = tree.parent(top)
+    siblings = tree.children(parent) if parent is not None else [top]
+    threshold = max(10.0, final[top_key] * SIBLING_SHARE)
+    parts = []
+    for sibling in siblings:
+        key = tree.key(sibling)
+        if key == top_key:
+            parts.append(texts[top_key])
+            continue
+        if key in final and final[key] >= threshold:
+            parts.append(texts[key])
+            continue
+        if tree.tag(sibling) == "p":
+            text = tree.text(sibling)
+            if len(text) > 80 and _link_density(tree, sibling, text) < 0.25:
+                parts.append(text)
+
+    main = normalize(" ".join(parts))
+    if len(main) < MIN_MAIN_CHARS:
+        return None
+    return main
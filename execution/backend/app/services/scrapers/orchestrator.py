@@ -1,44 +1,178 @@
 """Scraper Orchestrator - dispatches to appropriate strategy."""
 
+import asyncio
+import dataclasses
 import logging
-from typing import Optional
+from collections import Counter
+from typing import AsyncIterator, Iterable, Optional
 from urllib.parse import urlparse
 
 from app.services.scrapers.types import ScraperResult, ScraperConfig, ScraperStrategy
 from app.services.scrapers.base import BaseScraper
+from app.services.scrapers.ats_api import (
+    AshbyScraper,
+    AtsApiScraper,
+    GreenhouseScraper,
+    LeverScraper,
+)
+from app.services.scrapers.cache import CacheEntry, ScrapeCache, conditional_headers
+from app.services.scrapers.circuit import CircuitBreaker
+from app.services.scrapers.escalation import TierMemory, spa_shell_reason
+from app.services.scrapers.render_profile import RenderProfile
 from app.services.scrapers.generic_html import GenericHtmlScraper
+from app.services.scrapers.http_client import HostLimiter, SharedHttpClient
+from app.services.scrapers.robots import HostPacer, RobotsCache
+from app.services.scrapers.run import current_run
 from app.services.scrapers.selenium_scraper import SeleniumScraper
+from app.services.scrapers.urls import canonical_url
 
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass
+class _Flight:
+    """A fetch shared by every caller that wants the same URL."""
+
+    task: asyncio.Task
+    waiters: int = 0
+
+
 class ScraperOrchestrator:
     """
     Orchestrates scraping by selecting the appropriate strategy.
     
     Strategy Selection Priority:
     1. Explicit strategy override (if provided)
-    2. URL pattern matching (Greenhouse, Lever, etc. → Selenium)
-    3. Fallback to Generic HTML
+    2. ATS board URLs with a public JSON API (Greenhouse, Lever, Ashby)
+    3. URL pattern matching (Workday, iCIMS, etc. → Selenium)
+    4. Fallback to Generic HTML
+    
+    If an ATS API strategy fails, the next strategy that can handle the URL
+    is tried (e.g. an unknown board token or API outage falls back to Selenium).
+    
+    With `config.adaptive_escalation`, steps 3-4 become tiered: pages are
+    fetched over plain HTTP first and only SPA shells are re-rendered in a
+    browser (see escalation.py). The tier that worked is remembered per
+    host, so the next visit goes straight to it.
+    
+    The orchestrator owns one pooled HTTP client shared by all HTTP-based
+    strategies; call `aclose()` (or use it as an async context manager)
+    when done.
+    
+    With `config.cache_dir` set, successful scrapes are cached on disk:
+    fresh entries are returned without network I/O and stale HTML entries
+    are revalidated with a conditional GET. Counters (cache_hit, cache_miss,
+    cache_revalidated) accumulate in `self.stats` and the active ScrapeRun.
+    
+    Callers that stored a page's validators elsewhere (e.g. CompanySource)
+    can pass them as `validators`; if the server answers 304 and there is
+    no cached body, the result is a bodiless success with `not_modified`
+    set, meaning "unchanged since you last saw it".
+    
+    With `config.lean_results`, returned results carry the ParsedDocument
+    (text, title, anchors, iframes) but not raw_html, so callers holding many
+    results don't keep every page body alive.
+    
+    With `config.respect_robots_txt`, URLs disallowed by robots.txt are
+    skipped before any fetch and each host is paced by its Crawl-delay.
+    
+    A per-host circuit breaker (circuit.py) fails fast for hosts that keep
+    timing out or refusing us (counter: circuit_open).
+    
+    With `config.http_archive_mode` set to "record" or "replay", all HTTP
+    goes through an archive (http_archive.py) and Selenium is left out,
+    since browser renders can't be archived.
+    
+    Requests are coalesced by canonical URL (see urls.py): a URL already being
+    fetched is awaited rather than fetched again, and inside a ScrapeRun each
+    URL is fetched at most once per job. Counters: dedup_inflight, dedup_run.
+    The shared fetch runs as its own task: a caller that is cancelled (e.g.
+    by its job's deadline) stops waiting without cancelling it for the
+    others, and it is only cancelled once nobody is waiting any more.
+    
+    Fetches are capped at `max_concurrent_scrapes` across the orchestrator.
+    Use `scrape_batch` / `scrape_stream` rather than gathering `scrape()`
+    calls: they also cap parallelism per host and apply backpressure.
     
     Usage:
         orchestrator = ScraperOrchestrator()
         result = await orchestrator.scrape("https://stripe.com/jobs")
+        await orchestrator.aclose()
     """
     
-    def __init__(self, config: Optional[ScraperConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ScraperConfig] = None,
+        http: Optional[SharedHttpClient] = None,
+        cache: Optional[ScrapeCache] = None,
+    ):
         self.config = config or ScraperConfig()
+        self.http = http or SharedHttpClient(self.config)
+        self.cache = cache or ScrapeCache.from_config(self.config)
+        self.stats: Counter = Counter()
+        
+        # robots.txt rules and Crawl-delay pacing (shared across batches)
+        self.robots = RobotsCache(self.config, http=self.http) if self.config.respect_robots_txt else None
+        self.pacer = HostPacer()
+        
+        # Hosts that keep failing are skipped for a cooldown
+        self.breaker = CircuitBreaker(self.config) if self.config.circuit_failure_threshold > 0 else None
+        
+        # Browser renders can't be recorded/replayed: archive runs stay on HTTP
+        archived = self.config.http_archive_mode != "off"
+        
+        # Per-host HTTP/browser tier for adaptive escalation
+        self.tiers = (
+            TierMemory(self.config.tier_memory_entries, self.config.tier_memory_hours)
+            if self.config.adaptive_escalation and not archived else None
+        )
+        
+        # Batch concurrency limits, bound to the running event loop (see _batch_limits)
+        self._limits_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._global_slots: Optional[asyncio.Semaphore] = None
+        self._host_slots: Optional[HostLimiter] = None
+        
+        # Single-flight: coalescing key -> the fetch in progress
+        self._inflight: dict[tuple, _Flight] = {}
         
         # Initialize available strategies (order matters for pattern matching)
         self.strategies: list[BaseScraper] = [
-            SeleniumScraper(self.config),  # Check JS-heavy patterns first
-            GenericHtmlScraper(self.config),  # Fallback
+            GreenhouseScraper(self.config, http=self.http),  # One JSON call per board
+            LeverScraper(self.config, http=self.http),
+            AshbyScraper(self.config, http=self.http),
+            SeleniumScraper(self.config),  # Check JS-heavy patterns next
+            GenericHtmlScraper(self.config, http=self.http),  # Fallback
         ]
+        if archived:
+            self.strategies = [s for s in self.strategies if not isinstance(s, SeleniumScraper)]
+    
+    async def __aenter__(self) -> "ScraperOrchestrator":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Release pooled connections and browsers held by the strategies."""
+        pool_stats = self.pool_stats()
+        if pool_stats.get("leases"):
+            logger.info(f"WebDriver pool stats: {pool_stats}")
+        for strategy in self.strategies:
+            await strategy.aclose()
+        await self.http.aclose()
+    
+    def pool_stats(self) -> dict:
+        """WebDriver pool metrics (size, in use, wait times) for capacity tuning."""
+        for strategy in self.strategies:
+            if isinstance(strategy, SeleniumScraper):
+                return strategy.pool.stats()
+        return {}
     
     async def scrape(
         self,
         url: str,
         force_strategy: Optional[ScraperStrategy] = None,
+        validators: Optional[dict] = None,
     ) -> ScraperResult:
         """
         Scrape a URL using the best available strategy.
@@ -46,10 +180,81 @@ class ScraperOrchestrator:
         Args:
             url: The URL to scrape
             force_strategy: Optional strategy override
+            validators: Caller's stored {"etag", "last_modified"} for a conditional GET
             
         Returns:
             ScraperResult with content or error details
         """
+        key = self._coalescing_key(url, force_strategy, validators)
+        run = current_run()
+        if run is not None and key in run.results:
+            self._record("dedup_run")
+            return self._coalesced(run.results[key], url, "run")
+        
+        retried = False
+        while True:
+            flight = self._inflight.get(key)
+            joined = flight is not None and not flight.task.cancelled()
+            if joined:
+                self._record("dedup_inflight")
+            else:
+                flight = _Flight(asyncio.create_task(self._scrape(url, force_strategy, validators)))
+                self._inflight[key] = flight
+                flight.task.add_done_callback(lambda _, key=key, flight=flight: self._land(key, flight))
+            
+            flight.waiters += 1
+            try:
+                result = await asyncio.shield(flight.task)
+                break
+            except asyncio.CancelledError:
+                if not flight.task.cancelled():
+                    # This caller was cancelled; the fetch goes on for the others
+                    flight.waiters -= 1
+                    if flight.waiters == 0:
+                        flight.task.cancel()
+                    raise
+                # The fetch was cancelled after every earlier waiter left: fetch it again.
+                # Once only: a fetch that cancels itself would otherwise loop.
+                self._land(key, flight)
+                if retried:
+                    raise
+                retried = True
+        
+        if joined:
+            result = self._coalesced(result, url, "in_flight")
+        if run is not None:
+            run.results[key] = result
+        return result
+    
+    def _land(self, key: tuple, flight: _Flight) -> None:
+        """Forget a finished fetch (unless a newer one already took its key)."""
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+    
+    @staticmethod
+    def _coalescing_key(
+        url: str,
+        force_strategy: Optional[ScraperStrategy],
+        validators: Optional[dict],
+    ) -> tuple:
+        try:
+            canonical = canonical_url(url)
+        except ValueError:  # Malformed (e.g. bad port): _scrape reports it
+            canonical = url
+        return canonical, force_strategy, tuple(sorted((validators or {}).items()))
+    
+    @staticmethod
+    def _coalesced(result: ScraperResult, url: str, how: str) -> ScraperResult:
+        """A shared result re-addressed to this caller's spelling of the URL."""
+        return dataclasses.replace(result, url=url, metadata={**result.metadata, "coalesced": how})
+    
+    async def _scrape(
+        self,
+        url: str,
+        force_strategy: Optional[ScraperStrategy],
+        validators: Optional[dict],
+    ) -> ScraperResult:
+        """One uncoalesced scrape: cache, robots, fetch, escalation."""
         logger.info(f"Scraping URL: {url}")
         
         # Validate URL
@@ -72,10 +277,50 @@ class ScraperOrchestrator:
         
         # Select strategy
         scraper = self._select_strategy(url, force_strategy)
+        if self.tiers is not None and not force_strategy:
+            scraper = self._initial_tier(url, scraper)
         logger.info(f"Selected strategy: {scraper.strategy.value}")
         
-        # Execute scrape
-        result = await scraper.scrape(url)
+        # Serve from cache when fresh; otherwise prepare a conditional GET
+        cached = await self._cache_lookup(url, force_strategy)
+        if cached is not None and self.cache.is_fresh(cached):
+            self._record("cache_hit")
+            logger.info(f"Cache hit for {url}")
+            return self._finish(cached.to_result(url, "hit", self.config.html_parser, self.config.text_mode))
+        
+        # Dead hosts fail fast, before their robots.txt costs a timeout of its own
+        if self.breaker is not None and not self.breaker.allow(url):
+            self._record("circuit_open")
+            logger.info(f"Skipping {url}: circuit open for {self.breaker.host(url)}")
+            return ScraperResult(
+                url=url,
+                success=False,
+                strategy_used=scraper.strategy,
+                error_message="Host circuit open after repeated failures",
+                metadata={"circuit": "open"},
+            )
+        
+        # robots.txt: skip disallowed URLs before any fetch, pace by Crawl-delay
+        if self.robots is not None:
+            blocked = await self._apply_robots(url, scraper)
+            if blocked is not None:
+                if self.breaker is not None:
+                    self.breaker.release(url)
+                return blocked
+        
+        # Execute scrape (cache hits and robots waits don't hold a global slot)
+        global_slots, _ = self._batch_limits()
+        async with global_slots:
+            result = await self._fetch(url, scraper, cached, force_strategy, validators)
+        if self.breaker is not None:
+            self.breaker.record(url, result)
+        if result.metadata.get("cache") == "revalidated" or result.not_modified:
+            return self._finish(result)
+        
+        if self.cache is not None:
+            self._record("cache_miss")
+            if result.success:
+                await self._cache_store(result)
         
         # Log outcome
         if result.success:
@@ -83,8 +328,159 @@ class ScraperOrchestrator:
         else:
             logger.warning(f"Failed to scrape {url}: {result.error_message}")
         
+        return self._finish(result)
+    
+    def _finish(self, result: ScraperResult) -> ScraperResult:
+        """Count extracted text, then apply lean mode: links are extracted now, the raw HTML is released."""
+        if result.success and "full_text_bytes" in result.metadata:
+            self._record("text_bytes_full", result.metadata["full_text_bytes"])
+            self._record("text_bytes_main", result.metadata["text_bytes"])
+        if self.config.lean_results and result.success:
+            result.release_html(keep_compressed=self.config.lean_keep_compressed_html)
+        return result
+    
+    async def _fetch(
+        self,
+        url: str,
+        scraper: BaseScraper,
+        cached: Optional[CacheEntry],
+        force_strategy: Optional[ScraperStrategy],
+        validators: Optional[dict] = None,
+    ) -> ScraperResult:
+        """Run the strategy (conditionally if validators are known), with ATS fallback."""
+        headers = None
+        if isinstance(scraper, GenericHtmlScraper):
+            if cached is not None and cached.has_validators:
+                headers = cached.conditional_headers()
+            elif validators:
+                headers = conditional_headers(validators.get("etag"), validators.get("last_modified"))
+        
+        if headers:
+            result = await scraper.scrape(url, headers=headers)
+            if result.success and result.not_modified:
+                if cached is not None:
+                    await asyncio.to_thread(self.cache.touch, url, cached)
+                    self._record("cache_revalidated")
+                    logger.info(f"Cache revalidated for {url} (304)")
+                    return cached.to_result(url, "revalidated", self.config.html_parser, self.config.text_mode)
+                self._record("not_modified")
+                logger.info(f"{url} not modified since the caller's copy (304)")
+                return result
+        else:
+            result = await scraper.scrape(url)
+        
+        # ATS API miss: fall back to the next capable strategy (not for forced strategies)
+        if not result.success and not force_strategy and isinstance(scraper, AtsApiScraper):
+            fallback = self._fallback_strategy(url, scraper)
+            if fallback is not None:
+                logger.info(
+                    f"{scraper.strategy.value} failed ({result.error_message}), "
+                    f"falling back to {fallback.strategy.value}"
+                )
+                result = await fallback.scrape(url)
+        
+        if self.tiers is not None and not force_strategy:
+            result = await self._escalate(url, scraper, result)
+        return result
+    
+    def _initial_tier(self, url: str, selected: BaseScraper) -> BaseScraper:
+        """HTTP first for browser/generic URLs, unless this host is known to need a browser."""
+        if isinstance(selected, AtsApiScraper):
+            return selected
+        if self.tiers.get(url) == ScraperStrategy.SELENIUM:
+            self._record("tier_browser")
+            return self._strategy(SeleniumScraper)
+        self._record("tier_http")
+        return self._strategy(GenericHtmlScraper)
+    
+    async def _escalate(self, url: str, scraper: BaseScraper, result: ScraperResult) -> ScraperResult:
+        """Re-render SPA shells in a browser and remember which tier worked for the host."""
+        if isinstance(scraper, SeleniumScraper):
+            if result.success:
+                self.tiers.remember(url, ScraperStrategy.SELENIUM)
+            else:
+                self.tiers.forget(url)  # Probe over HTTP again next time
+            return result
+        if not isinstance(scraper, GenericHtmlScraper) or not result.success or result.not_modified:
+            return result
+        
+        reason = spa_shell_reason(result.raw_html, result.extracted_text, self.config.spa_min_text_chars)
+        if reason is None:
+            self.tiers.remember(url, ScraperStrategy.GENERIC_HTML)
+            return result
+        
+        self._record("escalated")
+        logger.info(f"{url} looks like an SPA shell ({reason}), rendering in a browser")
+        rendered = await self._strategy(SeleniumScraper).scrape(url)
+        if rendered.success and len(rendered.extracted_text or "") > len(result.extracted_text or ""):
+            self.tiers.remember(url, ScraperStrategy.SELENIUM)
+            rendered.metadata["escalated_from"] = ScraperStrategy.GENERIC_HTML.value
+            rendered.metadata["spa_shell"] = reason
+            return rendered
+        
+        # Browser unavailable or no better: keep the HTTP result and stop trying for this host
+        self._record("escalation_failed")
+        self.tiers.remember(url, ScraperStrategy.GENERIC_HTML)
+        result.metadata["spa_shell"] = reason
         return result
     
+    async def _apply_robots(self, url: str, scraper: BaseScraper) -> Optional[ScraperResult]:
+        """Return a failed result if robots.txt disallows `url`, else wait out the Crawl-delay."""
+        user_agent = self.config.user_agent
+        rules = await self.robots.rules_for(url)
+        if not rules.allows(url, user_agent):
+            self._record("robots_disallowed")
+            logger.info(f"Skipping {url}: disallowed by robots.txt")
+            return ScraperResult(
+                url=url,
+                success=False,
+                strategy_used=scraper.strategy,
+                error_message="Disallowed by robots.txt",
+                metadata={"robots": "disallowed"},
+            )
+        
+        delay = rules.crawl_delay(user_agent)
+        if delay is None:
+            delay = self.config.default_crawl_delay_seconds
+        waited = await self.pacer.wait(url, min(delay, self.config.max_crawl_delay_seconds))
+        if waited > 0:
+            self._record("robots_paced")
+            self._record("robots_wait_ms", int(waited * 1000))
+        return None
+    
+    def _record(self, key: str, count: int = 1) -> None:
+        self.stats[key] += count
+        run = current_run()
+        if run is not None:
+            run.record(key, count)
+    
+    async def _cache_lookup(
+        self,
+        url: str,
+        force_strategy: Optional[ScraperStrategy],
+    ) -> Optional[CacheEntry]:
+        if self.cache is None:
+            return None
+        try:
+            entry = await asyncio.to_thread(self.cache.get, url)
+        except OSError as e:
+            logger.warning(f"Scrape cache read failed for {url}: {e}")
+            return None
+        if entry is not None and force_strategy and entry.strategy != force_strategy.value:
+            return None
+        if entry is not None and entry.metadata.get("text_mode", self.config.text_mode) != self.config.text_mode:
+            return None  # Extracted in the other text mode
+        return entry
+    
+    async def _cache_store(self, result: ScraperResult) -> None:
+        try:
+            await asyncio.to_thread(self.cache.put, result)
+        except OSError as e:
+            logger.warning(f"Scrape cache write failed for {result.url}: {e}")
+    
+    def _strategy(self, kind: type) -> BaseScraper:
+        return next(strategy for strategy in self.strategies if isinstance(strategy, kind))
+    
     def _select_strategy(
         self,
         url: str,
@@ -106,19 +502,146 @@ class ScraperOrchestrator:
         # Fallback to generic (should always exist)
         return self.strategies[-1]
     
-    async def scrape_batch(
+    def _fallback_strategy(self, url: str, failed: BaseScraper) -> Optional[BaseScraper]:
+        """Next strategy after `failed` (in priority order) that can handle the URL."""
+        if failed not in self.strategies:
+            return None
+        for strategy in self.strategies[self.strategies.index(failed) + 1:]:
+            if strategy.can_handle(url):
+                return strategy
+        return None
+    
+    async def scrape_stream(
         self,
-        urls: list[str],
+        urls: Iterable[str],
         force_strategy: Optional[ScraperStrategy] = None,
-    ) -> list[ScraperResult]:
+        validators: Optional[dict[str, dict]] = None,
+    ) -> AsyncIterator[tuple[int, ScraperResult]]:
         """
-        Scrape multiple URLs.
+        Scrape URLs concurrently, yielding `(index, result)` as each finishes.
+        
+        At most `max_concurrent_scrapes` scrapes run at once across every
+        batch on this orchestrator, and at most `max_concurrent_scrapes_per_host`
+        per host. URLs are pulled from `urls` lazily through a bounded queue and
+        finished results wait in a bounded queue, so a slow consumer pauses the
+        workers instead of buffering everything.
         
-        Note: Runs sequentially to respect rate limiting.
-        For parallel scraping, implement proper rate limiting first.
+        Scrape errors are returned as failed results; the stream never raises
+        for a single URL. `validators` maps URLs to stored validators (see `scrape`).
         """
-        results = []
-        for url in urls:
-            result = await self.scrape(url, force_strategy)
-            results.append(result)
+        validators = validators or {}
+        workers = max(1, self.config.max_concurrent_scrapes)
+        pending: asyncio.Queue = asyncio.Queue(maxsize=self.config.batch_queue_size)
+        finished: asyncio.Queue = asyncio.Queue(maxsize=self.config.batch_queue_size)
+        
+        async def produce() -> None:
+            for item in enumerate(urls):
+                await pending.put(item)
+            for _ in range(workers):
+                await pending.put(None)
+        
+        closing = False
+        
+        async def work() -> None:
+            try:
+                while (item := await pending.get()) is not None:
+                    index, url = item
+                    result = await self._scrape_bounded(url, force_strategy, validators.get(url))
+                    await finished.put((index, result))
+            finally:
+                # Even a worker that died (e.g. cancelled mid-scrape) counts as done,
+                # or the stream would wait for it forever
+                if not closing:
+                    await finished.put(None)
+        
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(work()) for _ in range(workers)]
+        try:
+            done_workers = 0
+            while done_workers < workers:
+                item = await finished.get()
+                if item is None:
+                    done_workers += 1
+                else:
+                    yield item
+        finally:
+            closing = True  # Nobody reads `finished` any more
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def scrape_batch(
+        self,
+        urls: Iterable[str],
+        force_strategy: Optional[ScraperStrategy] = None,
+        validators: Optional[dict[str, dict]] = None,
+    ) -> list[ScraperResult]:
+        """Scrape URLs concurrently (see `scrape_stream`); results in input order."""
+        urls = list(urls)
+        results: list[Optional[ScraperResult]] = [None] * len(urls)
+        async for index, result in self.scrape_stream(urls, force_strategy, validators):
+            results[index] = result
         return results
+    
+    async def _scrape_bounded(
+        self,
+        url: str,
+        force_strategy: Optional[ScraperStrategy],
+        validators: Optional[dict] = None,
+    ) -> ScraperResult:
+        _, host_slots = self._batch_limits()
+        try:
+            # scrape() takes the global slot itself, only around the network fetch
+            async with host_slots.slot(url):
+                if validators:
+                    return await self.scrape(url, force_strategy, validators=validators)
+                return await self.scrape(url, force_strategy)
+        except Exception as e:
+            logger.warning(f"Batch scrape of {url} raised: {e}")
+            return ScraperResult(
+                url=url,
+                success=False,
+                strategy_used=force_strategy or ScraperStrategy.GENERIC_HTML,
+                error_message=f"Unexpected error: {str(e)}",
+            )
+    
+    def _batch_limits(self) -> tuple[asyncio.Semaphore, HostLimiter]:
+        """Global/per-host semaphores, recreated if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._limits_loop is not loop:
+            self._global_slots = asyncio.Semaphore(max(1, self.config.max_concurrent_scrapes))
+            self._host_slots = HostLimiter(self.config.max_concurrent_scrapes_per_host)
+            self._limits_loop = loop
+        return self._global_slots, self._host_slots
+
+# Process-wide orchestrator so every scoring job shares one connection pool.
+# Closed from the FastAPI lifespan hook on shutdown.
+_shared_orchestrator: Optional[ScraperOrchestrator] = None
+
+
+def get_shared_orchestrator() -> ScraperOrchestrator:
+    """Return the process-wide orchestrator, creating it on first use."""
+    global _shared_orchestrator
+    if _shared_orchestrator is None:
+        from app.core.config import settings
+        archived = settings.HTTP_ARCHIVE_MODE != "off"
+        _shared_orchestrator = ScraperOrchestrator(ScraperConfig(
+            # Archive runs bypass the scrape cache so every fetch is recorded / replayed
+            cache_dir=None if archived else settings.SCRAPE_CACHE_DIR,
+            html_parser=settings.HTML_PARSER,
+            text_mode=settings.TEXT_EXTRACTION_MODE,
+            lean_results=settings.LEAN_SCRAPE_RESULTS,
+            adaptive_escalation=settings.ADAPTIVE_ESCALATION,
+            render_profile=RenderProfile.named(settings.RENDER_PROFILE),
+            http_archive_mode=settings.HTTP_ARCHIVE_MODE,
+            http_archive_path=settings.HTTP_ARCHIVE_PATH,
+        ))
+    return _shared_orchestrator
+
+
+async def close_shared_orchestrator() -> None:
+    """Close the process-wide orchestrator's connections (app shutdown)."""
+    global _shared_orchestrator
+    if _shared_orchestrator is not None:
+        await _shared_orchestrator.aclose()
+        _shared_orchestrator = None
@@ -0,0 +1,107 @@
+"""Resource blocking profiles for headless Chrome.
+
+Scoring only reads `page_source`, so images, fonts, media, stylesheets and
+third-party trackers are pure render time and bandwidth. A RenderProfile
+says what to block; SeleniumScraper applies it in two layers:
+
+- Chrome content-settings prefs (images, plugins), honoured
+  before any request is made
+- DevTools `Network.setBlockedURLs` patterns for everything prefs can't
+  express (fonts, media, CSS, tracker hosts)
+
+"scoring" (the default) blocks all of it; "debug" blocks nothing so a
+headed browser shows the page as a user would see it.
+"""
+
+from dataclasses import dataclass, field
+
+IMAGE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp"]
+FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+MEDIA_PATTERNS = ["*.mp4", "*.webm", "*.mov", "*.m3u8", "*.mp3", "*.wav", "*.ogg"]
+STYLESHEET_PATTERNS = ["*.css"]
+
+TRACKER_HOSTS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "cdn.segment.com",
+    "fullstory.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "intercom.io",
+    "hs-analytics.net",
+    "hs-scripts.com",
+    "clarity.ms",
+    "bat.bing.com",
+    "linkedin.com/px",
+    "snap.licdn.com",
+    "ads-twitter.com",
+    "optimizely.com",
+    "newrelic.com",
+    "nr-data.net",
+]
+
+
+@dataclass
+class RenderProfile:
+    """What a headless render may skip downloading."""
+
+    name: str = "scoring"
+    block_images: bool = True
+    block_fonts: bool = True
+    block_media: bool = True
+    block_stylesheets: bool = True
+    blocked_hosts: list[str] = field(default_factory=lambda: list(TRACKER_HOSTS))
+
+    @classmethod
+    def scoring(cls) -> "RenderProfile":
+        return cls()
+
+    @classmethod
+    def debug(cls) -> "RenderProfile":
+        return cls(
+            name="debug",
+            block_images=False,
+            block_fonts=False,
+            block_media=False,
+            block_stylesheets=False,
+            blocked_hosts=[],
+        )
+
+    @classmethod
+    def named(cls, name: str) -> "RenderProfile":
+        """Profile by name ("scoring" or "debug")."""
+        profiles = {"scoring": cls.scoring, "debug": cls.debug}
+        if name not in profiles:
+            raise ValueError(f"Unknown render profile {name!r}; expected one of {sorted(profiles)}")
+        return profiles[name]()
+
+    def chrome_prefs(self) -> dict:
+        """ChromeOptions "prefs" for what content settings can block (2 = block)."""
+        prefs = {}
+        if self.block_images:
+            prefs["profile.managed_default_content_settings.images"] = 2
+        if self.block_media:
+            prefs["profile.managed_default_content_settings.plugins"] = 2
+        return prefs
+
+    def blocked_url_patterns(self) -> list[str]:
+        """URL patterns for DevTools Network.setBlockedURLs."""
+        extensions: list[str] = []
+        if self.block_images:
+            extensions += IMAGE_PATTERNS
+        if self.block_fonts:
+            extensions += FONT_PATTERNS
+        if self.block_media:
+            extensions += MEDIA_PATTERNS
+        if self.block_stylesheets:
+            extensions += STYLESHEET_PATTERNS
+        # Patterns match the whole URL, so versioned assets (app.css?v=3) need their own
+        patterns = [variant for pattern in extensions for variant in (pattern, f"{pattern}?*")]
+        patterns += [f"*{host}*" for host in self.blocked_hosts]
+        return patterns
@@ -0,0 +1,113 @@
+"""Readiness wait for Selenium renders.
+
+Replaces a fixed post-load sleep with the first of:
+- "selector": a per-ATS "content is here" CSS selector matched
+- "stable": the DOM hasn't mutated for `render_quiet_ms` (tracked by a
+  MutationObserver installed after navigation) and the document is loaded
+- "timeout": `render_max_wait_ms` elapsed
+
+Everything goes through `driver.execute_script`, so the engine has no
+Selenium imports of its own and is easy to drive with a fake in tests.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from app.services.scrapers.types import ScraperConfig
+
+logger = logging.getLogger(__name__)
+
+# URL substring → selectors that only match once job content has rendered
+READY_SELECTORS: dict[str, list[str]] = {
+    "myworkdayjobs.com": ['[data-automation-id="jobTitle"]', '[data-automation-id="jobPostingHeader"]'],
+    "workday.com": ['[data-automation-id="jobTitle"]', '[data-automation-id="jobPostingHeader"]'],
+    "icims.com": [".iCIMS_JobsTable", ".iCIMS_JobContent", ".iCIMS_JobListingRow"],
+    "smartrecruiters.com": [".opening-job", ".job-title", "[itemprop=title]"],
+    "greenhouse.io": ["#app_body .opening", "#content .opening", ".job-post"],
+    "lever.co": [".posting", ".posting-headline"],
+    "ashbyhq.com": ["[class*=ashby-job-posting]", "a[href*='/jobs/']"],
+    "ashby.io": ["[class*=ashby-job-posting]", "a[href*='/jobs/']"],
+}
+
+_INSTALL_OBSERVER = """
+if (!window.__signalscoreObserver) {
+    window.__signalscoreLastMutation = performance.now();
+    window.__signalscoreObserver = new MutationObserver(function () {
+        window.__signalscoreLastMutation = performance.now();
+    });
+    window.__signalscoreObserver.observe(document, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+}
+"""
+
+_POLL = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    if (document.querySelector(selectors[i])) { return ["selector", 0, document.readyState]; }
+}
+var last = window.__signalscoreLastMutation;
+return ["poll", last === undefined ? -1 : performance.now() - last, document.readyState];
+"""
+
+
+@dataclass
+class RenderWait:
+    """How long a render was waited on and why the wait ended."""
+
+    waited_ms: int
+    outcome: str  # "selector", "stable" or "timeout"
+
+
+def ready_selectors_for(url: str, config: ScraperConfig) -> list[str]:
+    """Ready selectors for `url`: built-in ATS patterns plus config overrides."""
+    url_lower = url.lower()
+    selectors: list[str] = []
+    for table in (READY_SELECTORS, config.render_ready_selectors):
+        for pattern, pattern_selectors in table.items():
+            if pattern in url_lower:
+                selectors.extend(pattern_selectors)
+    return selectors
+
+
+def wait_until_rendered(
+    driver: Any,
+    url: str,
+    config: ScraperConfig,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> RenderWait:
+    """Block until the page is ready (see module docstring); never raises."""
+    selectors = ready_selectors_for(url, config)
+    quiet_ms = config.render_quiet_ms
+    max_wait = config.render_max_wait_ms / 1000
+    poll = config.render_poll_ms / 1000
+    start = clock()
+
+    def elapsed_ms() -> int:
+        return round((clock() - start) * 1000)
+
+    try:
+        driver.execute_script(_INSTALL_OBSERVER)
+    except Exception as e:
+        logger.debug(f"Could not install mutation observer on {url}: {e}")
+
+    while True:
+        state: Optional[list] = None
+        try:
+            state = driver.execute_script(_POLL, selectors)
+        except Exception as e:
+            logger.debug(f"Render poll failed on {url}: {e}")
+
+        if state:
+            kind, quiet_for, ready_state = state
+            if kind == "selector":
+                return RenderWait(elapsed_ms(), "selector")
+            if ready_state == "complete" and quiet_for >= quiet_ms:
+                return RenderWait(elapsed_ms(), "stable")
+
+        if clock() - start >= max_wait:
+            return RenderWait(elapsed_ms(), "timeout")
+        sleep(poll)
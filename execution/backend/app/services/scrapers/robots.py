@@ -0,0 +1,267 @@
+"""robots.txt enforcement and Crawl-delay pacing.
+
+RobotsCache fetches each origin's robots.txt once and keeps the parsed
+rules in an in-memory LRU, backed by an on-disk TTL cache when
+`config.cache_dir` is set (so bulk rescoring across processes doesn't
+refetch them). HostPacer turns each host's Crawl-delay into a token bucket
+that the orchestrator waits on before fetching.
+
+Fetch outcomes follow RFC 9309 loosely:
+- 2xx: parse the rules
+- 4xx (including 401/403): no usable rules, everything allowed
+- 5xx / network error / unreadable body: allowed, but only remembered in
+  memory briefly so the next scrape tries again
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import httpx
+
+from app.services.scrapers.http_client import SharedHttpClient, build_http_client
+from app.services.scrapers.types import ScraperConfig
+
+logger = logging.getLogger(__name__)
+
+ERROR_TTL_SECONDS = 600  # Retry unreachable robots.txt after 10 minutes
+MAX_ROBOTS_BYTES = 512 * 1024  # Google's documented parse limit
+
+
+@dataclass
+class RobotsRules:
+    """Parsed robots.txt for one origin."""
+
+    origin: str
+    fetched_at: float
+    status: int  # HTTP status, or 0 for network errors
+    body: str = ""
+
+    def __post_init__(self):
+        self._parser = RobotFileParser()
+        self._delays: dict[str, float] = {}
+        if 200 <= self.status < 300:
+            lines = self.body.splitlines()
+            self._parser.parse(lines)
+            self._delays = _parse_crawl_delays(lines)
+        else:
+            self._parser.allow_all = True
+
+    def allows(self, url: str, user_agent: str) -> bool:
+        return self._parser.can_fetch(user_agent, url)
+
+    def crawl_delay(self, user_agent: str) -> Optional[float]:
+        """Crawl-delay (or Request-rate equivalent) in seconds, if declared."""
+        # Same agent matching as RobotFileParser: product token, substring match
+        token = user_agent.split("/")[0].lower()
+        for agent, delay in self._delays.items():
+            if agent != "*" and agent in token:
+                return delay
+        if "*" in self._delays:
+            return self._delays["*"]
+        rate = self._parser.request_rate(user_agent)
+        if rate is not None and rate.requests:
+            return rate.seconds / rate.requests
+        return None
+
+
+def _parse_crawl_delays(lines: list[str]) -> dict[str, float]:
+    """
+    Crawl-delay per user-agent.
+
+    RobotFileParser only accepts integer delays; fractional values like
+    "Crawl-delay: 0.5" are common, so they're parsed here.
+    """
+    delays: dict[str, float] = {}
+    group: list[str] = []
+    in_agents = False
+    for raw in lines:
+        line = raw.split("#", 1)[0].strip()
+        if ":" not in line:
+            continue
+        field, value = (part.strip() for part in line.split(":", 1))
+        field = field.lower()
+        if field == "user-agent":
+            if not in_agents:
+                group = []
+            group.append(value.lower())
+            in_agents = True
+            continue
+        in_agents = False
+        if field == "crawl-delay":
+            try:
+                delay = float(value)
+            except ValueError:
+                continue
+            for agent in group:
+                delays.setdefault(agent, delay)
+    return delays
+
+
+def origin_of(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+class RobotsCache:
+    """
+    Per-origin robots.txt rules with an in-memory LRU and optional disk cache.
+
+    Concurrent lookups for the same origin share one fetch.
+    """
+
+    def __init__(self, config: ScraperConfig, http: Optional[SharedHttpClient] = None):
+        self.config = config
+        self.http = http
+        self.ttl_seconds = config.robots_cache_hours * 3600
+        self.max_entries = config.robots_memory_entries
+        self.directory = Path(config.cache_dir) / "robots" if config.cache_dir else None
+        self._memory: OrderedDict[str, RobotsRules] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def rules_for(self, url: str) -> RobotsRules:
+        origin = origin_of(url)
+
+        rules = self._memory.get(origin)
+        if rules is not None and self._is_fresh(rules):
+            self._memory.move_to_end(origin)
+            return rules
+
+        inflight = self._inflight.get(origin)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[origin] = future
+        try:
+            rules = await asyncio.to_thread(self._load, origin) if self.directory else None
+            if rules is None or not self._is_fresh(rules):
+                rules = await self._fetch(origin)
+                if self.directory and rules.status and rules.status < 500:
+                    await asyncio.to_thread(self._store, rules)
+            self._remember(rules)
+            future.set_result(rules)
+            return rules
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            del self._inflight[origin]
+
+    def _is_fresh(self, rules: RobotsRules) -> bool:
+        ttl = self.ttl_seconds if rules.status and rules.status < 500 else ERROR_TTL_SECONDS
+        return time.time() - rules.fetched_at < ttl
+
+    def _remember(self, rules: RobotsRules) -> None:
+        self._memory[rules.origin] = rules
+        self._memory.move_to_end(rules.origin)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def _fetch(self, origin: str) -> RobotsRules:
+        robots_url = f"{origin}/robots.txt"
+        try:
+            if self.http is not None:
+                async with self.http.host_slot(robots_url):
+                    response = await self.http.client.get(robots_url)
+            else:
+                async with build_http_client(self.config) as client:
+                    response = await client.get(robots_url)
+        except httpx.HTTPError as e:
+            logger.info(f"robots.txt unreachable for {origin}: {e}")
+            return RobotsRules(origin=origin, fetched_at=time.time(), status=0)
+        except Exception as e:
+            logger.warning(f"robots.txt fetch failed for {origin}: {e}")
+            return RobotsRules(origin=origin, fetched_at=time.time(), status=0)
+
+        try:
+            body = response.text[:MAX_ROBOTS_BYTES] if response.is_success else ""
+            return RobotsRules(origin=origin, fetched_at=time.time(), status=response.status_code, body=body)
+        except Exception as e:
+            # Undecodable or unparseable: treat like an unreachable file (allowed, retried soon)
+            logger.warning(f"Ignoring unreadable robots.txt for {origin}: {e}")
+            return RobotsRules(origin=origin, fetched_at=time.time(), status=0)
+
+    def _path(self, origin: str) -> Path:
+        return self.directory / f"{hashlib.sha256(origin.encode('utf-8')).hexdigest()}.json"
+
+    def _load(self, origin: str) -> Optional[RobotsRules]:
+        try:
+            data = json.loads(self._path(origin).read_text(encoding="utf-8"))
+            return RobotsRules(**data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable robots cache for {origin}: {e}")
+            return None
+
+    def _store(self, rules: RobotsRules) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._path(rules.origin).write_text(json.dumps({
+                "origin": rules.origin,
+                "fetched_at": rules.fetched_at,
+                "status": rules.status,
+                "body": rules.body,
+            }), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not persist robots.txt for {rules.origin}: {e}")
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens/second, holding at most `capacity`.
+
+    `reserve()` takes a token immediately and returns how long the caller
+    must wait before using it, so concurrent callers queue up in order
+    without a lock.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class HostPacer:
+    """Per-host token buckets keyed by the host's crawl delay."""
+
+    def __init__(self):
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def reserve(self, url: str, delay_seconds: float) -> float:
+        """Reserve the next request slot for the host; returns seconds to wait."""
+        if delay_seconds <= 0:
+            return 0.0
+        host = (urlsplit(url).hostname or "").lower()
+        bucket = self._buckets.get(host)
+        if bucket is None or bucket.rate != 1.0 / delay_seconds:
+            bucket = TokenBucket(rate=1.0 / delay_seconds)
+            self._buckets[host] = bucket
+        return bucket.reserve()
+
+    async def wait(self, url: str, delay_seconds: float) -> float:
+        wait = self.reserve(url, delay_seconds)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
@@ -0,0 +1,52 @@
+"""Per-job scrape context.
+
+A ScrapeRun collects counters (cache hits, skips, ...) for one scoring job,
+plus every result it fetched keyed by canonical URL, so the orchestrator
+can fetch each URL at most once per job.
+It is carried in a ContextVar so every `orchestrator.scrape()` call made
+while the run is active - including ones in tasks spawned by asyncio.gather -
+reports into it without threading it through every call site.
+
+Usage:
+    run, token = start_scrape_run()
+    try:
+        await orchestrator.scrape(url)
+    finally:
+        finish_scrape_run(token)
+    print(run.stats)
+"""
+
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class ScrapeRun:
+    """Counters and fetched results for one scoring job."""
+
+    stats: Counter = field(default_factory=Counter)
+    results: dict = field(default_factory=dict, repr=False)  # Coalescing key -> ScraperResult
+
+    def record(self, key: str, count: int = 1) -> None:
+        self.stats[key] += count
+
+
+_current_run: ContextVar[Optional[ScrapeRun]] = ContextVar("scrape_run", default=None)
+
+
+def current_run() -> Optional[ScrapeRun]:
+    """The ScrapeRun active in this context, if any."""
+    return _current_run.get()
+
+
+def start_scrape_run() -> tuple[ScrapeRun, Token]:
+    """Activate a new ScrapeRun; pass the token to finish_scrape_run()."""
+    run = ScrapeRun()
+    return run, _current_run.set(run)
+
+
+def finish_scrape_run(token: Token) -> None:
+    """Deactivate the ScrapeRun started with `token`."""
+    _current_run.reset(token)
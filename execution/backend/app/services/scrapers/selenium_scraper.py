@@ -5,12 +5,23 @@ Best for dynamic career pages, SPAs, and ATS embeds.
 """
 
 import asyncio
+import logging
 from typing import Optional
 from urllib.parse import urlparse
 
 from app.services.scrapers.base import BaseScraper
+from app.services.scrapers.driver_pool import WebDriverPool, resolve_chromedriver_path
+from app.services.scrapers.render_wait import wait_until_rendered
 from app.services.scrapers.types import ScraperResult, ScraperConfig, ScraperStrategy
 
+logger = logging.getLogger(__name__)
+
+# Bytes the page's subresources actually transferred (blocked requests count 0)
+_RESOURCE_BYTES = (
+    "return performance.getEntriesByType('resource')"
+    ".reduce(function (total, entry) { return total + (entry.transferSize || 0); }, 0);"
+)
+
 
 class SeleniumScraper(BaseScraper):
     """
@@ -22,6 +33,10 @@ class SeleniumScraper(BaseScraper):
     - Pages requiring JS execution
     - Dynamic content loading
     
+    Drivers come from a bounded WebDriverPool and are reused across pages;
+    see ScraperConfig.selenium_* for sizing. `config.render_profile` decides
+    which resources (images, fonts, CSS, trackers) the browser skips.
+    
     Note: Requires selenium and webdriver-manager in dependencies.
     """
     
@@ -38,8 +53,13 @@ class SeleniumScraper(BaseScraper):
         "smartrecruiters.com",
         "ashby.io",
         "jobs.ashby.io",
+        "ashbyhq.com",
     ]
     
+    def __init__(self, config: Optional[ScraperConfig] = None):
+        super().__init__(config)
+        self.pool = WebDriverPool(self.config, driver_factory=self._create_driver)
+    
     def can_handle(self, url: str) -> bool:
         """Check if URL matches known JS-heavy patterns."""
         url_lower = url.lower()
@@ -69,16 +89,62 @@ class SeleniumScraper(BaseScraper):
                 error_message=f"Selenium error: {str(e)}",
             )
     
+    async def aclose(self) -> None:
+        """Quit pooled browsers."""
+        await asyncio.to_thread(self.pool.close)
+    
+    def _create_driver(self):
+        """Launch a Chrome instance (called by the pool)."""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        
+        # Configure Chrome options
+        options = Options()
+        if self.config.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument(f"--user-agent={self.config.user_agent}")
+        
+        profile = self.config.render_profile
+        prefs = profile.chrome_prefs()
+        if prefs:
+            options.add_experimental_option("prefs", prefs)
+        
+        # Driver binary is resolved once per process, not per page
+        service = Service(resolve_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=options)
+        driver.set_page_load_timeout(self.config.timeout_seconds)
+        self._block_resources(driver, profile.blocked_url_patterns())
+        return driver
+    
+    @staticmethod
+    def _block_resources(driver, patterns: list[str]) -> None:
+        """Drop matching requests via DevTools; persists across navigations on this driver."""
+        if not patterns:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            # Non-Chromium drivers have no CDP; prefs still apply
+            logger.warning(f"Resource blocking unavailable: {e}")
+    
+    @staticmethod
+    def _resource_bytes(driver) -> Optional[int]:
+        try:
+            return int(driver.execute_script(_RESOURCE_BYTES))
+        except Exception:
+            return None
+    
     def _scrape_sync(self, url: str) -> ScraperResult:
         """Synchronous Selenium scraping logic."""
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.chrome.service import Service
             from selenium.webdriver.common.by import By
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
-            from webdriver_manager.chrome import ChromeDriverManager
         except ImportError:
             return ScraperResult(
                 url=url,
@@ -87,49 +153,48 @@ class SeleniumScraper(BaseScraper):
                 error_message="Selenium dependencies not installed. Run: pip install selenium webdriver-manager",
             )
         
-        driver = None
         try:
-            # Configure Chrome options
-            options = Options()
-            if self.config.headless:
-                options.add_argument("--headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument(f"--user-agent={self.config.user_agent}")
-            
-            # Initialize driver with auto-managed ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
-            driver.set_page_load_timeout(self.config.timeout_seconds)
-            
-            # Navigate to URL
-            driver.get(url)
-            
-            # Wait for body to be present (basic page load)
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Additional wait for JS content to render
-            # This is crucial for SPAs
-            import time
-            time.sleep(2)
-            
-            # Get page source after JS execution
-            html = driver.page_source
-            title = driver.title
+            with self.pool.lease() as lease:
+                driver = lease.driver
+                
+                # Navigate to URL
+                driver.get(url)
+                
+                # Wait for body to be present (basic page load)
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
+                
+                # Wait for JS content: ATS ready selector, DOM quiet, or the hard cap
+                render = wait_until_rendered(driver, url, self.config)
+                resource_bytes = self._resource_bytes(driver)
+                
+                # Get page source after JS execution
+                html = driver.page_source
+                title = driver.title
+                final_url = driver.current_url
             
+            document = self._parse(html)
             return ScraperResult(
                 url=url,
                 success=True,
                 strategy_used=self.strategy,
                 raw_html=html,
-                extracted_text=self._extract_text_from_html(html),
-                title=title,
+                extracted_text=document.text,
+                title=title or document.title,
+                document=document,
+                html_parser=self.config.html_parser,
+                text_mode=self.config.text_mode,
                 metadata={
-                    "final_url": driver.current_url,
+                    "final_url": final_url,
                     "js_rendered": True,
+                    "render_wait_ms": render.waited_ms,
+                    "render_ready": render.outcome,
+                    "render_profile": self.config.render_profile.name,
+                    **self._text_metadata(document),
+                    "resource_bytes": resource_bytes,
+                    "pool_wait_ms": round(lease.wait_seconds * 1000),
+                    "driver_pages_served": lease.pages_served,
                 },
             )
             
@@ -140,6 +205,3 @@ class SeleniumScraper(BaseScraper):
                 strategy_used=self.strategy,
                 error_message=f"Selenium scrape failed: {str(e)}",
             )
-        finally:
-            if driver:
-                driver.quit()
@@ -0,0 +1,179 @@
+"""Job postings embedded in a page as structured data.
+
+Careers pages often ship every opening twice: as the rendered list, and as
+machine-readable data carrying the full description:
+- schema.org JobPosting objects in <script type="application/ld+json">
+  (what Google for Jobs reads), possibly inside a list or an @graph
+- the page props of a Next.js site in <script id="__NEXT_DATA__">, where
+  ATS-backed careers pages keep their jobs as plain dicts
+
+`extract_job_postings` turns those into one EmbeddedPosting per job, so the
+descriptions can be scored without fetching each posting page. Next.js
+dicts count as jobs when they have a title, a description of at least
+MIN_DESCRIPTION_CHARS (anything shorter is a list entry, not a posting) and
+a job-only field such as a location, department or apply URL (so CMS blocks
+with a title and description don't qualify).
+
+The scripts were collected when the page was parsed (ParsedDocument.structured_data).
+"""
+
+import html
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urljoin
+
+from app.services.scrapers.document import ParsedDocument
+from app.services.scrapers.urls import canonical_url
+
+logger = logging.getLogger(__name__)
+
+MIN_DESCRIPTION_CHARS = 200
+MAX_POSTINGS_PER_PAGE = 50
+MAX_NODES = 200_000  # Walk limit per script: __NEXT_DATA__ can hold a whole CMS
+
+TITLE_KEYS = ("title", "jobTitle", "name", "text")  # Lever uses "text"
+DESCRIPTION_KEYS = ("description", "descriptionHtml", "descriptionPlain", "jobDescription", "content")
+URL_KEYS = ("url", "absolute_url", "hostedUrl", "applyUrl", "jobUrl", "applicationUrl")
+JOB_HINT_KEYS = {
+    "jobId", "job_id", "requisitionId", "requisition_id", "employmentType", "department", "departments",
+    "location", "locations", "jobLocation", "absolute_url", "hostedUrl", "applyUrl", "jobUrl", "applicationUrl",
+}
+
+_SLUG = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass
+class EmbeddedPosting:
+    """One job posting read from a page's structured data."""
+
+    url: str  # The posting's own URL, or the page URL with a #job-... fragment
+    title: str
+    text: str  # Title, facts line and plain-text description
+    source: str  # "json-ld" or "next-data"
+    page_url: str
+    fetched_at: Optional[datetime] = None
+
+    @property
+    def has_own_url(self) -> bool:
+        """False for postings addressed by their listing page's URL plus a fragment."""
+        return "#job-" not in self.url
+
+
+def _walk(node) -> Iterator[dict]:
+    """Every dict in a JSON value, depth-first, at most MAX_NODES nodes."""
+    stack, visited = [node], 0
+    while stack and visited < MAX_NODES:
+        node = stack.pop()
+        visited += 1
+        if isinstance(node, dict):
+            yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _is_job_posting(obj: dict) -> bool:
+    types = obj.get("@type")
+    return "JobPosting" in (types if isinstance(types, list) else [types])
+
+
+def _plain_text(value) -> str:
+    if not isinstance(value, str):
+        return ""
+    value = html.unescape(value)
+    if "<" in value:
+        return ParsedDocument.from_html(value).text
+    return re.sub(r"\s+", " ", value).strip()
+
+
+def _first(obj: dict, keys: Iterable[str]) -> Optional[str]:
+    for key in keys:
+        value = obj.get(key)
+        if isinstance(value, str) and value.strip():
+            return value
+    return None
+
+
+def _name(value) -> Optional[str]:
+    """A schema.org Thing's name, or the value itself if it's a string."""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        address = value.get("address")  # Place -> PostalAddress
+        value = value.get("name") or (address.get("addressLocality") if isinstance(address, dict) else address)
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+
+def _posting(obj: dict, source: str, page_url: str, index: int) -> Optional[EmbeddedPosting]:
+    title = _plain_text(_first(obj, TITLE_KEYS))
+    description = _plain_text(_first(obj, DESCRIPTION_KEYS))
+    if not title or not description:
+        return None
+    if source == "next-data" and len(description) < MIN_DESCRIPTION_CHARS:
+        return None
+
+    facts = [
+        _name(obj.get("hiringOrganization")),
+        _name(obj.get("jobLocation")) or _name(obj.get("location")),
+        _name(obj.get("employmentType")),
+    ]
+    facts_line = " · ".join(fact for fact in facts if fact)
+    text = "\n".join(part for part in (title, facts_line, description) if part)
+
+    url = _first(obj, URL_KEYS)
+    if url:
+        url = urljoin(page_url, url.strip())
+    else:
+        slug = _SLUG.sub("-", title.lower()).strip("-")[:60]
+        url = f"{page_url.split('#')[0]}#job-{index}-{slug}"
+    return EmbeddedPosting(url=url, title=title, text=text, source=source, page_url=page_url)
+
+
+def _load(script: str) -> Optional[object]:
+    try:
+        return json.loads(script.strip().rstrip(";"), strict=False)  # Raw newlines in strings are common
+    except ValueError:
+        return None
+
+
+def extract_job_postings(document: Optional[ParsedDocument], page_url: str) -> list[EmbeddedPosting]:
+    """Job postings embedded in a parsed page, at most MAX_POSTINGS_PER_PAGE."""
+    if document is None:
+        return []
+
+    postings: list[EmbeddedPosting] = []
+    for script in document.structured_data:
+        data = _load(script)
+        if data is None:
+            logger.debug(f"Unparseable structured data on {page_url}")
+            continue
+        is_next_data = isinstance(data, dict) and "props" in data and "buildId" in data
+        source = "next-data" if is_next_data else "json-ld"
+        for obj in _walk(data):
+            if not (_is_job_posting(obj) or (is_next_data and not JOB_HINT_KEYS.isdisjoint(obj))):
+                continue
+            posting = _posting(obj, source, page_url, len(postings))
+            if posting is not None:
+                postings.append(posting)
+            if len(postings) >= MAX_POSTINGS_PER_PAGE:
+                return postings
+    return postings
+
+
+def extract_from_pages(pages: Iterable[tuple[str, Optional[ParsedDocument], Optional[datetime]]]) -> list[EmbeddedPosting]:
+    """Postings from several `(url, document, fetched_at)` pages, each job once."""
+    postings: list[EmbeddedPosting] = []
+    seen: set[str] = set()
+    for page_url, document, fetched_at in pages:
+        for posting in extract_job_postings(document, page_url):
+            key = canonical_url(posting.url) if posting.has_own_url else posting.text[:500]
+            if key in seen:
+                continue
+            seen.add(key)
+            posting.fetched_at = fetched_at
+            postings.append(posting)
+    return postings
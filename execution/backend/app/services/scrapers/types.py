@@ -1,18 +1,24 @@
 """Scraper result and base types."""
 
+import hashlib
+import zlib
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from app.services.scrapers.document import DEFAULT_HTML_PARSER, ParsedDocument
+from app.services.scrapers.render_profile import RenderProfile
+
 
 class ScraperStrategy(str, Enum):
     """Available scraping strategies."""
     
     GENERIC_HTML = "generic_html"  # BeautifulSoup for simple HTML
     SELENIUM = "selenium"  # Selenium for JS-heavy sites
-    GREENHOUSE = "greenhouse"  # Greenhouse ATS-specific
-    LEVER = "lever"  # Lever ATS-specific
+    GREENHOUSE = "greenhouse"  # Greenhouse Job Board API
+    LEVER = "lever"  # Lever Postings API
+    ASHBY = "ashby"  # Ashby Job Board API
 
 
 @dataclass
@@ -28,11 +34,54 @@ class ScraperResult:
     error_message: Optional[str] = None
     scraped_at: datetime = field(default_factory=datetime.utcnow)
     metadata: dict = field(default_factory=dict)
+    document: Optional[ParsedDocument] = field(default=None, repr=False)  # Parsed raw_html
+    html_parser: str = field(default=DEFAULT_HTML_PARSER, repr=False)  # Backend for parsed_document()
+    text_mode: str = field(default="full", repr=False)  # Text mode for parsed_document()
+    raw_html_compressed: Optional[bytes] = field(default=None, repr=False)  # Lean mode copy
+    postings: list["ScraperResult"] = field(default_factory=list, repr=False)  # ATS boards: one result per job
     
     @property
     def is_failed(self) -> bool:
         """Check if scrape failed."""
         return not self.success
+    
+    @property
+    def not_modified(self) -> bool:
+        """Conditional request answered 304: no body, the caller's copy is current."""
+        return bool(self.metadata.get("not_modified"))
+    
+    def content_hash(self) -> Optional[str]:
+        """sha256 of the extracted text (markup-only changes don't alter it)."""
+        if not self.extracted_text:
+            return None
+        return hashlib.sha256(self.extracted_text.encode("utf-8")).hexdigest()
+    
+    def parsed_document(self) -> Optional[ParsedDocument]:
+        """The parsed page, built from raw_html on first use if the scraper didn't."""
+        if self.document is None:
+            html = self.html()
+            if html:
+                self.document = ParsedDocument.from_html(html, self.html_parser, self.text_mode)
+        return self.document
+    
+    def html(self) -> Optional[str]:
+        """raw_html, or the decompressed copy if the result was made lean."""
+        if self.raw_html is None and self.raw_html_compressed is not None:
+            return zlib.decompress(self.raw_html_compressed).decode("utf-8")
+        return self.raw_html
+    
+    def release_html(self, keep_compressed: bool = False) -> None:
+        """
+        Lean mode: parse the page now (text, title, links) and drop raw_html.
+        
+        With `keep_compressed`, a zlib copy is kept for `html()`.
+        """
+        if self.raw_html is None:
+            return
+        self.parsed_document()
+        if keep_compressed:
+            self.raw_html_compressed = zlib.compress(self.raw_html.encode("utf-8"))
+        self.raw_html = None
 
 
 @dataclass
@@ -41,6 +90,63 @@ class ScraperConfig:
     
     timeout_seconds: int = 30
     respect_robots_txt: bool = True
-    cache_duration_hours: int = 24
+    cache_duration_hours: int = 24  # Cached pages younger than this skip the network
     user_agent: str = "SignalScore/0.1 (AI Readiness Research)"
     headless: bool = True  # For Selenium
+    html_parser: str = DEFAULT_HTML_PARSER  # "html.parser", "lxml" or "selectolax" (see document.py)
+    text_mode: str = "full"  # "full" or "main": main-content block only (see main_content.py)
+    max_body_bytes: int = 5 * 1024 * 1024  # Page bodies are truncated past this size
+    ats_max_postings: int = 25  # Postings kept from one ATS board
+    ats_max_text_bytes: int = 256 * 1024  # Combined posting text kept from one ATS board
+    lean_results: bool = False  # Orchestrator parses pages then drops raw_html from results
+    lean_keep_compressed_html: bool = False  # In lean mode, keep a zlib copy instead of nothing
+
+    # Shared HTTP client (connection pooling / keep-alive)
+    max_connections: int = 50  # Total open connections across all hosts
+    max_keepalive_connections: int = 20  # Idle connections kept for reuse
+    max_connections_per_host: int = 4  # httpx has no per-host cap, enforced by HostLimiter
+    keepalive_expiry_seconds: float = 30.0
+    http2: bool = False  # Requires the optional "h2" package (httpx[http2])
+
+    # Selenium WebDriver pool
+    selenium_pool_size: int = 2  # Concurrent Chrome instances per process
+    selenium_max_pages_per_driver: int = 25  # Recycle a driver after N pages (0 = never)
+    selenium_acquire_timeout_seconds: float = 60.0  # Max wait for a free driver
+    render_profile: RenderProfile = field(default_factory=RenderProfile.scoring)  # Resources headless Chrome skips
+
+    # Render readiness after page load (see render_wait.py)
+    render_quiet_ms: int = 500  # DOM must stop mutating this long to count as rendered
+    render_max_wait_ms: int = 8000  # Hard cap on the readiness wait
+    render_poll_ms: int = 100
+    render_ready_selectors: dict[str, list[str]] = field(default_factory=dict)  # URL substring → CSS selectors
+
+    # On-disk scrape cache (see cache.py); None disables caching
+    cache_dir: Optional[str] = None
+    cache_max_age_hours: float = 24 * 7  # Stale entries kept this long for revalidation
+    cache_max_bytes: int = 512 * 1024 * 1024
+
+    # Batch scraping (scrape_stream / scrape_batch)
+    max_concurrent_scrapes: int = 8  # Shared by every batch running on one orchestrator
+    max_concurrent_scrapes_per_host: int = 2
+    batch_queue_size: int = 16  # Buffered URLs/results before producers block
+
+    # Adaptive httpx → browser escalation (see escalation.py)
+    adaptive_escalation: bool = False  # Try plain HTTP first, render only SPA shells
+    spa_min_text_chars: int = 250  # Less visible text than this (with scripts) looks unrendered
+    tier_memory_entries: int = 2048  # Hosts whose working tier is remembered
+    tier_memory_hours: float = 24
+
+    # Per-host circuit breaker (see circuit.py)
+    circuit_failure_threshold: int = 3  # Consecutive timeouts/refusals/403/429/5xx to open (0 = off)
+    circuit_cooldown_seconds: float = 300.0  # Open circuits fail fast this long, then probe once
+    circuit_persist: bool = True  # Keep open circuits in <cache_dir>/circuits.json across restarts
+
+    # Record/replay of outbound HTTP for offline runs (see http_archive.py)
+    http_archive_mode: str = "off"  # "off", "record" or "replay"
+    http_archive_path: Optional[str] = None  # Gzip archive file
+
+    # robots.txt (enforced when respect_robots_txt is set; see robots.py)
+    robots_cache_hours: float = 24
+    robots_memory_entries: int = 512  # Origins kept in the in-memory LRU
+    default_crawl_delay_seconds: float = 0.0  # Pacing for hosts without a Crawl-delay
+    max_crawl_delay_seconds: float = 10.0  # Larger Crawl-delay values are clamped to this
@@ -0,0 +1,46 @@
+"""URL normalization helpers shared by the scraping layer."""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Query parameters that only attribute traffic and never change the page
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "twclid", "li_fat_id",
+    "mc_cid", "mc_eid", "_hsenc", "_hsmi", "ref", "ref_src", "gh_src", "lever-source",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize a URL so trivially different spellings map to one key.
+
+    - lowercases scheme and host, drops a leading "www."
+    - drops default ports and the #fragment
+    - drops tracking parameters (utm_*, gclid, fbclid, ...) and sorts the rest
+    - uses "/" for an empty path and strips a trailing slash otherwise
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+
+    port = parts.port
+    netloc = host if port is None or DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+    if parts.username:
+        netloc = f"{parts.username}@{netloc}"
+
+    path = parts.path.rstrip("/") or "/"
+    params = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(params), ""))
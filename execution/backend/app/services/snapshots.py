@@ -0,0 +1,177 @@
+"""Content-addressed store for the scraped text behind each score.
+
+Extracted text used to be dropped once signals were extracted, so any
+lexicon or weight change meant re-scraping the whole portfolio. Every
+scored document is now kept:
+
+- text objects live at `<root>/objects/<sha256[:2]>/<sha256><ext>`,
+  compressed with zstd when available (Python 3.14's compression.zstd or
+  the `zstandard` package) and zlib otherwise; identical text is stored once
+- a snapshot set (one per Score) is a JSON manifest of
+  {url, source_type, fetched_at, text digest} entries, itself stored by
+  hash at `<root>/sets/<sha256>.json` and referenced from `Score.snapshot_id`
+
+`load_latest_snapshots` returns a company's most recent set, and
+`snapshot_segments` turns it back into the text segments
+`_extract_signals_heuristically` takes, so re-extraction is CPU only.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.company import Score
+
+logger = logging.getLogger(__name__)
+
+try:  # Python 3.14+
+    from compression import zstd as _zstd
+except ImportError:
+    try:
+        import zstandard as _zstandard
+    except ImportError:
+        _zstd = None
+    else:
+        # Same compress/decompress surface as compression.zstd
+        _zstd = SimpleNamespace(
+            compress=lambda data: _zstandard.ZstdCompressor(level=10).compress(data),
+            decompress=lambda data: _zstandard.ZstdDecompressor().decompress(data),
+        )
+
+
+def zstd_available() -> bool:
+    return _zstd is not None
+
+
+ZSTD_EXT = ".zst"
+ZLIB_EXT = ".zz"
+
+
+@dataclass
+class Snapshot:
+    """One scraped document as it was scored."""
+
+    url: Optional[str]  # None for text that isn't a page (e.g. search snippets)
+    source_type: str
+    fetched_at: datetime
+    text: str
+
+
+class SnapshotStore:
+    """
+    Content-addressed text objects plus per-score snapshot manifests.
+
+    Usage:
+        store = SnapshotStore("./data/snapshots")
+        snapshot_id = store.save_set([Snapshot(url, "careers", fetched_at, text)])
+        store.load_set(snapshot_id)  # -> list[Snapshot]
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def _object_path(self, digest: str, ext: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}{ext}"
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def put_text(self, text: str) -> str:
+        """Store `text` (once per distinct content); returns its sha256."""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if any(self._object_path(digest, ext).exists() for ext in (ZSTD_EXT, ZLIB_EXT)):
+            return digest
+        if _zstd is not None:
+            self._write(self._object_path(digest, ZSTD_EXT), _zstd.compress(data))
+        else:
+            self._write(self._object_path(digest, ZLIB_EXT), zlib.compress(data, 6))
+        return digest
+
+    def get_text(self, digest: str) -> str:
+        zst = self._object_path(digest, ZSTD_EXT)
+        if zst.exists():
+            if _zstd is None:
+                raise RuntimeError(f"Snapshot {digest} is zstd-compressed; install 'zstandard' to read it")
+            return _zstd.decompress(zst.read_bytes()).decode("utf-8")
+        return zlib.decompress(self._object_path(digest, ZLIB_EXT).read_bytes()).decode("utf-8")
+
+    def save_set(self, snapshots: Iterable[Snapshot]) -> str:
+        """Store the texts and a manifest listing them; returns the manifest's id."""
+        documents = [
+            {
+                "url": s.url,
+                "source_type": s.source_type,
+                "fetched_at": s.fetched_at.isoformat(),
+                "text": self.put_text(s.text),
+            }
+            for s in snapshots
+        ]
+        manifest = json.dumps({"documents": documents}, sort_keys=True).encode("utf-8")
+        snapshot_id = hashlib.sha256(manifest).hexdigest()
+        path = self.root / "sets" / f"{snapshot_id}.json"
+        if not path.exists():
+            self._write(path, manifest)
+        return snapshot_id
+
+    def load_set(self, snapshot_id: str) -> list[Snapshot]:
+        manifest = json.loads((self.root / "sets" / f"{snapshot_id}.json").read_text(encoding="utf-8"))
+        return [
+            Snapshot(
+                url=d["url"],
+                source_type=d["source_type"],
+                fetched_at=datetime.fromisoformat(d["fetched_at"]),
+                text=self.get_text(d["text"]),
+            )
+            for d in manifest["documents"]
+        ]
+
+
+def get_snapshot_store() -> Optional[SnapshotStore]:
+    """Store at SNAPSHOT_DIR, or None when snapshots are disabled."""
+    from app.core.config import settings
+    return SnapshotStore(settings.SNAPSHOT_DIR) if settings.SNAPSHOT_DIR else None
+
+
+def snapshot_segments(snapshots: Iterable[Snapshot]) -> dict[str, str]:
+    """Source type -> concatenated text, as scoring builds its text segments."""
+    segments: dict[str, str] = {}
+    for s in snapshots:
+        segments[s.source_type] = f"{segments[s.source_type]}\n{s.text}" if s.source_type in segments else s.text
+    return segments
+
+
+def load_latest_snapshots(
+    db: Session,
+    company_id: int,
+    store: Optional[SnapshotStore] = None,
+) -> Optional[list[Snapshot]]:
+    """Documents behind the company's most recent snapshotted score, or None if it has none."""
+    store = store or get_snapshot_store()
+    if store is None:
+        return None
+    snapshot_id = db.execute(
+        select(Score.snapshot_id)
+        .where(Score.company_id == company_id, Score.snapshot_id.is_not(None))
+        .order_by(Score.created_at.desc(), Score.id.desc())
+        .limit(1)
+    ).scalar()
+    if snapshot_id is None:
+        return None
+    return store.load_set(snapshot_id)
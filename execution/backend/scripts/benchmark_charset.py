@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark: whole-body charset detection vs declared-first decoding.
+
+Re-encodes every page of a saved corpus the ways servers send them, then
+decodes each body with:
+- detect:   charset_normalizer over the whole body (what a client falls
+            back to when the server declares no charset)
+- declared: charset.decode_body (header / <meta> / UTF-8 first, detection
+            on a bounded sample only as a last resort)
+
+Variants per page: UTF-8 with a Content-Type charset, UTF-8 undeclared,
+windows-1252 with <meta charset>, windows-1252 undeclared. Pages are
+repeated --inflate times to emulate large responses. Reports µs/page,
+MB/s and how many decodes reproduced the original text.
+
+Usage:
+    python scripts/benchmark_charset.py
+    python scripts/benchmark_charset.py --pages data/parser_corpus --inflate 50 --repeat 20
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from app.services.scrapers.charset import decode_body
+
+DEFAULT_CORPUS = Path(backend_dir) / "tests" / "fixtures" / "pages"
+ACCENTS = "<p>Équipe data à Zürich — «IA générative», café, naïve, señor.</p>"
+
+
+def variants(html: str) -> list[tuple[str, bytes, str | None, str]]:
+    """(label, body, declared charset, expected text) per way a server may send `html`."""
+    html = html.replace("</body>", ACCENTS + "</body>", 1)
+    legacy = html.encode("cp1252", errors="ignore").decode("cp1252")  # Text representable in cp1252
+    with_meta = legacy.replace("<head>", '<head><meta charset="windows-1252">', 1)
+    return [
+        ("utf-8 declared", html.encode("utf-8"), "utf-8", html),
+        ("utf-8 undeclared", html.encode("utf-8"), None, html),
+        ("cp1252 <meta>", with_meta.encode("cp1252"), None, with_meta),
+        ("cp1252 undeclared", legacy.encode("cp1252"), None, legacy),
+    ]
+
+
+def detect_whole_body(body: bytes, declared: str | None) -> str:
+    from charset_normalizer import from_bytes
+    if declared:
+        return body.decode(declared, errors="replace")
+    best = from_bytes(body).best()
+    return str(best) if best is not None else body.decode("utf-8", errors="replace")
+
+
+def declared_first(body: bytes, declared: str | None) -> str:
+    return decode_body(body, declared).text
+
+
+def measure(decode, cases, repeat: int) -> dict:
+    correct = sum(decode(body, declared) == expected for _, body, declared, expected in cases)
+    total_bytes = sum(len(body) for _, body, _, _ in cases) * repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, body, declared, _ in cases:
+            decode(body, declared)
+    elapsed = time.perf_counter() - start
+    return {
+        "us_per_page": elapsed / (len(cases) * repeat) * 1e6,
+        "mb_per_s": total_bytes / elapsed / 1e6 if elapsed else float("inf"),
+        "correct": correct,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=Path, default=DEFAULT_CORPUS, help="Directory of saved .html pages")
+    parser.add_argument("--inflate", type=int, default=20, help="Repeat each page's body this many times")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed passes over the corpus")
+    args = parser.parse_args()
+
+    pages = sorted(args.pages.glob("*.html"))
+    if not pages:
+        sys.exit(f"No .html pages in {args.pages}")
+
+    cases_by_variant: dict[str, list] = {}
+    for path in pages:
+        html = path.read_text(encoding="utf-8")
+        head, sep, rest = html.partition("<body>")
+        html = head + sep + rest.replace("</body>", "") * args.inflate + "</body>" if sep else html * args.inflate
+        for label, body, declared, expected in variants(html):
+            cases_by_variant.setdefault(label, []).append((label, body, declared, expected))
+
+    try:
+        import charset_normalizer  # noqa: F401
+        modes = [("detect", detect_whole_body), ("declared", declared_first)]
+    except ImportError:
+        print("charset_normalizer not installed: timing declared-first decoding only\n")
+        modes = [("declared", declared_first)]
+
+    avg_kb = sum(len(c[1]) for cases in cases_by_variant.values() for c in cases) / sum(map(len, cases_by_variant.values())) / 1024
+    print(f"{len(pages)} pages x {len(cases_by_variant)} variants, ~{avg_kb:.0f} KB/body, {args.repeat} passes\n")
+    print(f"{'Variant':<18} | {'Mode':<8} | {'µs/page':>10} | {'MB/s':>8} | {'Correct':>7}")
+    print("-" * 63)
+    for label, cases in cases_by_variant.items():
+        for mode, decode in modes:
+            r = measure(decode, cases, args.repeat)
+            print(f"{label:<18} | {mode:<8} | {r['us_per_page']:>10.0f} | {r['mb_per_s']:>8.1f} | {r['correct']:>3}/{len(cases)}")
+
+
+if __name__ == "__main__":
+    main()
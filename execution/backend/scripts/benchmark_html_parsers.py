@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark: HTML parser backends for ParsedDocument.
+
+Parses every saved page in a corpus directory with each installed backend
+(html.parser, lxml, selectolax) and reports:
+- throughput (pages/s and MB/s over --repeat passes)
+- how far each backend's output drifts from html.parser: text divergence
+  (1 - word-level similarity) and anchor/iframe/title mismatches
+
+With --text-mode main, pages are parsed in main-content mode and the text
+bytes kept per page (full text vs main-content block) are reported too.
+
+The default corpus is tests/fixtures/pages. Capture real careers pages into
+a corpus first with --save (pages are stored as-is, one .html per URL):
+
+Usage:
+    python scripts/benchmark_html_parsers.py
+    python scripts/benchmark_html_parsers.py --save https://example.com/careers --pages data/parser_corpus
+    python scripts/benchmark_html_parsers.py --pages data/parser_corpus --repeat 50
+    python scripts/benchmark_html_parsers.py --pages data/parser_corpus --text-mode main
+"""
+
+import argparse
+import difflib
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+import httpx
+
+from app.services.scrapers import ScraperConfig
+from app.services.scrapers.document import (
+    DEFAULT_HTML_PARSER,
+    HTML_PARSERS,
+    ParsedDocument,
+    available_parsers,
+)
+from app.services.scrapers.main_content import TEXT_MODES
+
+DEFAULT_CORPUS = Path(backend_dir) / "tests" / "fixtures" / "pages"
+
+
+def save_pages(urls: list[str], corpus: Path) -> None:
+    """Fetch URLs and store the raw HTML in the corpus directory."""
+    corpus.mkdir(parents=True, exist_ok=True)
+    config = ScraperConfig()
+    with httpx.Client(follow_redirects=True, timeout=config.timeout_seconds,
+                      headers={"User-Agent": config.user_agent}) as client:
+        for url in urls:
+            try:
+                response = client.get(url)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                print(f"  ✗ {url}: {e}")
+                continue
+            name = re.sub(r"[^a-zA-Z0-9]+", "_", url.split("://", 1)[-1]).strip("_")[:120]
+            path = corpus / f"{name}.html"
+            path.write_text(response.text, encoding="utf-8")
+            print(f"  ✓ {url} → {path.name} ({len(response.content) / 1024:.0f} KB)")
+
+
+def text_divergence(reference: str, other: str) -> float:
+    """1 - word-level similarity ratio (0 = identical)."""
+    if reference == other:
+        return 0.0
+    return 1 - difflib.SequenceMatcher(None, reference.split(), other.split(), autojunk=False).ratio()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=Path, default=DEFAULT_CORPUS, help="Directory of saved .html pages")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed passes over the corpus per backend")
+    parser.add_argument("--save", nargs="+", metavar="URL", help="Fetch these URLs into --pages first")
+    parser.add_argument("--text-mode", choices=TEXT_MODES, default="full", help="Text extraction mode")
+    args = parser.parse_args()
+
+    if args.save:
+        print(f"Saving {len(args.save)} pages to {args.pages}")
+        save_pages(args.save, args.pages)
+
+    pages = {p.name: p.read_text(encoding="utf-8", errors="replace") for p in sorted(args.pages.glob("*.html"))}
+    if not pages:
+        sys.exit(f"No .html pages in {args.pages}")
+    total_mb = sum(len(html.encode("utf-8")) for html in pages.values()) / 1e6
+
+    backends = available_parsers()
+    missing = [b for b in HTML_PARSERS if b not in backends]
+    print(f"Corpus: {len(pages)} pages, {total_mb:.2f} MB  |  repeat={args.repeat}")
+    if missing:
+        print(f"Not installed (skipped): {', '.join(missing)}  — pip install -e '.[fast-html]'")
+    print()
+
+    reference = {name: ParsedDocument.from_html(html, DEFAULT_HTML_PARSER, args.text_mode) for name, html in pages.items()}
+    baseline_rate = None
+
+    print(f"{'backend':<12} {'pages/s':>9} {'MB/s':>7} {'speedup':>8} {'max text diff':>14} {'link/title mismatches':>22}")
+    for backend in backends:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            docs = {name: ParsedDocument.from_html(html, backend, args.text_mode) for name, html in pages.items()}
+        elapsed = time.perf_counter() - start
+
+        rate = len(pages) * args.repeat / elapsed
+        baseline_rate = baseline_rate or rate
+        divergence = {name: text_divergence(reference[name].text, doc.text) for name, doc in docs.items()}
+        mismatches = sum(
+            (doc.anchors != reference[name].anchors)
+            + (doc.iframes != reference[name].iframes)
+            + (doc.title != reference[name].title)
+            for name, doc in docs.items()
+        )
+        print(
+            f"{backend:<12} {rate:>9.1f} {total_mb * args.repeat / elapsed:>7.2f} "
+            f"{rate / baseline_rate:>7.1f}x {max(divergence.values()):>13.2%} {mismatches:>22}"
+        )
+        for name, value in divergence.items():
+            if value > 0.01:
+                print(f"    {name}: text differs by {value:.1%}")
+
+    if args.text_mode == "main":
+        print(f"\n{'page':<40} {'full text':>10} {'main text':>10} {'kept':>6}")
+        for name, doc in reference.items():
+            full = doc.full_text_bytes or 0
+            print(f"{name[:40]:<40} {full:>10} {doc.text_bytes:>10} {doc.text_bytes / full if full else 1:>6.0%}")
+        full = sum(doc.full_text_bytes or 0 for doc in reference.values())
+        main = sum(doc.text_bytes for doc in reference.values())
+        print(f"{'total':<40} {full:>10} {main:>10} {main / full if full else 1:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
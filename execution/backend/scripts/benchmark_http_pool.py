@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-request httpx clients vs the orchestrator's pooled client.
+
+Starts local stub HTTP servers (one per simulated host), then replays the
+fetch pattern of one scoring run (homepage + satellite/subdomain/deep-link
+waves) in both modes. Reports new TCP connections ("handshakes") seen by the
+servers and wall time per run.
+
+The stub servers can add a fixed delay per new connection to emulate TLS
+handshake cost on real sites (--handshake-ms).
+
+Usage:
+    python scripts/benchmark_http_pool.py
+    python scripts/benchmark_http_pool.py --hosts 4 --pages 40 --runs 5 --handshake-ms 60
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from app.services.scrapers import GenericHtmlScraper, ScraperConfig, ScraperOrchestrator
+
+PAGE = (
+    "<html><head><title>Careers</title></head><body>"
+    + "<p>We build AI-powered tools with PyTorch and LangChain.</p>" * 200
+    + "</body></html>"
+).encode()
+
+
+class StubServer(ThreadingHTTPServer):
+    """Keep-alive HTTP/1.1 server that counts accepted connections."""
+
+    daemon_threads = True
+
+    def __init__(self, handshake_delay: float):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.handshake_delay = handshake_delay
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    def count_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Allow keep-alive
+
+    def setup(self):
+        super().setup()
+        self.server.count_connection()
+        if self.server.handshake_delay:
+            time.sleep(self.server.handshake_delay)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def build_run_urls(servers: list[StubServer], pages: int) -> list[list[str]]:
+    """Split one run's URLs into waves, mirroring score_company's scrape waves."""
+    urls = [
+        f"http://127.0.0.1:{servers[i % len(servers)].server_address[1]}/page/{i}"
+        for i in range(pages)
+    ]
+    homepage, rest = urls[:1], urls[1:]
+    third = max(1, len(rest) // 3)
+    return [homepage, rest[:third], rest[third:2 * third], rest[2 * third:]]
+
+
+async def run_per_request(waves: list[list[str]], config: ScraperConfig) -> None:
+    scraper = GenericHtmlScraper(config)  # No shared client: one client per URL
+    for wave in waves:
+        await asyncio.gather(*[scraper.scrape(url) for url in wave])
+
+
+async def run_pooled(waves: list[list[str]], config: ScraperConfig) -> None:
+    async with ScraperOrchestrator(config) as orchestrator:
+        for wave in waves:
+            await asyncio.gather(*[orchestrator.scrape(url) for url in wave])
+
+
+def measure(label, runner, servers, waves, config, runs) -> dict:
+    for server in servers:
+        server.connections = 0
+    start = time.perf_counter()
+    for _ in range(runs):
+        asyncio.run(runner(waves, config))
+    elapsed = time.perf_counter() - start
+    connections = sum(s.connections for s in servers)
+    return {
+        "label": label,
+        "handshakes_per_run": connections / runs,
+        "seconds_per_run": elapsed / runs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP connection pooling benchmark")
+    parser.add_argument("--hosts", type=int, default=4, help="Number of simulated hosts")
+    parser.add_argument("--pages", type=int, default=40, help="URLs fetched per scoring run")
+    parser.add_argument("--runs", type=int, default=5, help="Scoring runs per mode")
+    parser.add_argument("--handshake-ms", type=float, default=50.0, help="Emulated handshake cost")
+    args = parser.parse_args()
+
+    servers = [StubServer(args.handshake_ms / 1000) for _ in range(args.hosts)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    config = ScraperConfig(respect_robots_txt=False)
+    waves = build_run_urls(servers, args.pages)
+
+    try:
+        results = [
+            measure("per-request client", run_per_request, servers, waves, config, args.runs),
+            measure("pooled client", run_pooled, servers, waves, config, args.runs),
+        ]
+    finally:
+        for server in servers:
+            server.shutdown()
+
+    print(f"{args.pages} URLs/run across {args.hosts} hosts, {args.runs} runs, "
+          f"{args.handshake_ms:.0f} ms emulated handshake\n")
+    print(f"{'Mode':<20} | {'Handshakes/run':>14} | {'Wall s/run':>10}")
+    print("-" * 51)
+    for r in results:
+        print(f"{r['label']:<20} | {r['handshakes_per_run']:>14.1f} | {r['seconds_per_run']:>10.3f}")
+
+    before, after = results
+    if after["seconds_per_run"] > 0:
+        print(f"\nHandshakes: -{before['handshakes_per_run'] - after['handshakes_per_run']:.0f}/run, "
+              f"speedup: {before['seconds_per_run'] / after['seconds_per_run']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
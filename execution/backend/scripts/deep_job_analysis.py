@@ -394,10 +394,11 @@ async def analyze_company(company_name: str, jobs: list[dict]) -> CompanyAnalysi
     scraper = ScraperOrchestrator(ScraperConfig())
     
     postings = []
-    for job in jobs:
-        posting = await scrape_job_posting(scraper, job)
-        if posting:
-            postings.append(posting)
+    async with scraper:
+        for job in jobs:
+            posting = await scrape_job_posting(scraper, job)
+            if posting:
+                postings.append(posting)
     
     if not postings:
         return CompanyAnalysis(
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Record a scoring run's HTTP/search traffic, or time score_company offline.
+
+"record" scores each URL live and captures every scrape, probe and search
+into a gzip archive. "replay" serves that archive back (no network, no
+Chrome) and times score_company over several runs, so pipeline changes can
+be compared between commits without live-site noise. Scores go to an
+in-memory database; the real one is never touched.
+
+Usage:
+    python scripts/replay_scoring.py record https://stripe.com https://acme.com
+    python scripts/replay_scoring.py replay https://stripe.com https://acme.com --runs 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+backend_dir = os.path.dirname(script_dir)
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models.company import Company
+from app.services.scoring_service import ScoringService
+from app.services.scrapers import close_shared_orchestrator
+from app.services.scrapers.http_archive import shared_archive
+
+
+async def score_all(urls: list[str]) -> tuple[float, dict]:
+    """Score every URL against a fresh in-memory DB; returns (seconds, {domain: score})."""
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        service = ScoringService(db)
+        start = time.perf_counter()
+        for url in urls:
+            await service.score_company(url)
+        elapsed = time.perf_counter() - start
+        scores = {c.domain: c.scores[-1].score if c.scores else None for c in db.query(Company).all()}
+    finally:
+        db.close()
+        await close_shared_orchestrator()
+    return elapsed, scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or replay score_company traffic")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("urls", nargs="+", help="Company URLs to score")
+    parser.add_argument("--archive", default=settings.HTTP_ARCHIVE_PATH, help="Gzip archive path")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs (replay only)")
+    args = parser.parse_args()
+
+    settings.HTTP_ARCHIVE_MODE = args.mode
+    settings.HTTP_ARCHIVE_PATH = args.archive
+
+    if args.mode == "record":
+        elapsed, scores = asyncio.run(score_all(args.urls))
+        print(f"Recorded {len(args.urls)} companies to {args.archive} in {elapsed:.1f}s")
+        for domain, score in scores.items():
+            print(f"  {domain}: {score}")
+        return
+
+    timings = []
+    for run in range(args.runs):
+        shared_archive().rewind()
+        elapsed, scores = asyncio.run(score_all(args.urls))
+        timings.append(elapsed)
+        print(f"Run {run + 1}: {elapsed:.2f}s  {scores}")
+
+    print(f"\n{len(args.urls)} companies, {args.runs} runs: "
+          f"median {statistics.median(timings):.2f}s, min {min(timings):.2f}s, max {max(timings):.2f}s")
+    print(f"Archive misses: {shared_archive().misses}")
+
+
+if __name__ == "__main__":
+    main()
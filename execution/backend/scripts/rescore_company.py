@@ -14,6 +14,7 @@ if backend_dir not in sys.path:
 from app.services.scoring_service import ScoringService
 from app.services.scrapers import ScraperOrchestrator, ScraperConfig
 from app.services.discovery_service import DiscoveryService
+from app.core.config import settings
 from app.core.database import SessionLocal
 from app.models.company import Company, Score, CompanySource
 from app.models.enums import SourceType
@@ -25,11 +26,12 @@ async def scrape_urls(urls: List[str]) -> dict:
     # M5 Fix: Use shared utility function
     from app.utils.source_detection import detect_source_type
     
-    scraper = ScraperOrchestrator(ScraperConfig())
     text_segments = {}
     
     print(f"Scraping {len(urls)} sources...")
-    results = await asyncio.gather(*[scraper.scrape(url) for url in urls])
+    async with ScraperOrchestrator(ScraperConfig(cache_dir=settings.SCRAPE_CACHE_DIR)) as scraper:
+        results = await scraper.scrape_batch(urls)
+        print(f"Cache: {dict(scraper.stats)}")
     
     for i, res in enumerate(results):
         if res.success:
@@ -131,6 +131,7 @@ async def run_benchmark(file_path: str):
                 print(f"  Notes: {miss.notes}")
                 
     db.close()
+    await service.scraper.aclose()
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -0,0 +1,12 @@
+import pytest
+
+from app.core.config import settings
+
+
+@pytest.fixture(scope="session", autouse=True)
+def scrape_cache_dir(tmp_path_factory):
+    """Keep the scrape cache and persisted circuits out of ./data so runs don't leak into each other."""
+    previous = settings.SCRAPE_CACHE_DIR
+    settings.SCRAPE_CACHE_DIR = str(tmp_path_factory.mktemp("scrape_cache"))
+    yield settings.SCRAPE_CACHE_DIR
+    settings.SCRAPE_CACHE_DIR = previous
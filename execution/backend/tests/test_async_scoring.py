@@ -87,7 +87,7 @@ def test_async_scoring_flow_existing_company():
     assert data["company_name"] == "Existing"
 
 
-@patch("app.services.scoring_service.ScraperOrchestrator.scrape", new_callable=AsyncMock)
+@patch("app.services.scrapers.orchestrator.ScraperOrchestrator.scrape", new_callable=AsyncMock)
 def test_async_scoring_flow_new_company(mock_scrape):
     """
     Test 2: New company returns immediately with status='processing'.
@@ -0,0 +1,206 @@
+"""Tests for native ATS job-board API strategies (Greenhouse, Lever, Ashby)."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.services.scrapers import (
+    AshbyScraper,
+    GreenhouseScraper,
+    LeverScraper,
+    ScraperConfig,
+    ScraperOrchestrator,
+    ScraperResult,
+    ScraperStrategy,
+    SharedHttpClient,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures" / "ats"
+
+# Recorded API responses keyed by request path
+ROUTES = {
+    "/v1/boards/acme/jobs": "greenhouse_jobs.json",
+    "/v1/boards/acme/jobs/4012345": "greenhouse_job.json",
+    "/v0/postings/acme": "lever_postings.json",
+    "/posting-api/job-board/acme": "ashby_job_board.json",
+}
+
+
+@pytest.fixture
+def requests_seen():
+    return []
+
+
+@pytest.fixture
+def http(requests_seen):
+    """Shared client whose transport serves the recorded fixtures."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request.url)
+        fixture = ROUTES.get(request.url.path)
+        if fixture is None:
+            return httpx.Response(404, json={"error": "not found"})
+        return httpx.Response(200, json=json.loads((FIXTURES / fixture).read_text()))
+
+    return SharedHttpClient(ScraperConfig(), transport=httpx.MockTransport(handler))
+
+
+class TestBoardUrlParsing:
+    """ATS URL → board mapping."""
+
+    @pytest.mark.parametrize("url,board,job_id", [
+        ("https://boards.greenhouse.io/acme", "acme", None),
+        ("https://boards.greenhouse.io/acme/jobs/4012345", "acme", "4012345"),
+        ("https://job-boards.greenhouse.io/acme/jobs/4012345?gh_src=x", "acme", "4012345"),
+        ("https://boards.greenhouse.io/embed/job_board?for=acme", "acme", None),
+        ("https://boards.greenhouse.io/embed/job_app?for=acme&token=4012345", "acme", "4012345"),
+    ])
+    def test_greenhouse(self, url, board, job_id):
+        ref = GreenhouseScraper().parse_board(url)
+        assert (ref.board, ref.job_id) == (board, job_id)
+
+    @pytest.mark.parametrize("url,board,job_id", [
+        ("https://jobs.lever.co/acme", "acme", None),
+        ("https://jobs.lever.co/acme/5f1b2c3d/apply", "acme", "5f1b2c3d"),
+        ("https://jobs.eu.lever.co/acme", "acme", None),
+    ])
+    def test_lever(self, url, board, job_id):
+        ref = LeverScraper().parse_board(url)
+        assert (ref.board, ref.job_id) == (board, job_id)
+
+    def test_lever_eu_uses_regional_api(self):
+        scraper = LeverScraper()
+        ref = scraper.parse_board("https://jobs.eu.lever.co/acme")
+        assert scraper.api_url(ref).startswith("https://api.eu.lever.co/")
+
+    def test_ashby(self):
+        ref = AshbyScraper().parse_board("https://jobs.ashbyhq.com/acme/a1b2")
+        assert (ref.board, ref.job_id) == ("acme", "a1b2")
+
+    def test_non_board_urls_rejected(self):
+        assert GreenhouseScraper().parse_board("https://greenhouse.io/") is None
+        assert LeverScraper().parse_board("https://www.lever.co/pricing") is None
+        assert AshbyScraper().parse_board("https://www.ashbyhq.com/") is None
+
+
+class TestAtsApiScraping:
+    """Board fetches against recorded fixtures."""
+
+    @pytest.mark.asyncio
+    async def test_greenhouse_board_one_request(self, http, requests_seen):
+        scraper = GreenhouseScraper(http=http)
+        result = await scraper.scrape("https://boards.greenhouse.io/acme")
+
+        assert result.success is True
+        assert result.strategy_used == ScraperStrategy.GREENHOUSE
+        assert result.metadata["postings"] == 2
+        assert "LLM-powered products with PyTorch" in result.extracted_text
+        assert "<p>" not in result.extracted_text  # Escaped HTML was decoded and stripped
+        assert len(requests_seen) == 1
+        await http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_greenhouse_postings_carry_department(self, http):
+        postings = await GreenhouseScraper(http=http).scrape_postings("https://boards.greenhouse.io/acme")
+        assert [p.metadata["department"] for p in postings] == ["Engineering", "Product"]
+        assert postings[1].url == "https://boards.greenhouse.io/acme/jobs/4012346"
+        await http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_greenhouse_single_job(self, http):
+        result = await GreenhouseScraper(http=http).scrape("https://boards.greenhouse.io/acme/jobs/4012345")
+        assert result.success is True
+        assert result.title == "Machine Learning Engineer"
+        assert result.metadata["postings"] == 1
+        await http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_lever_board(self, http):
+        postings = await LeverScraper(http=http).scrape_postings("https://jobs.lever.co/acme")
+        assert len(postings) == 2
+        legal = postings[0]
+        assert legal.title == "Legal Counsel, Product"
+        assert legal.metadata["department"] == "Legal"
+        assert "AI-assisted contract review" in legal.extracted_text
+        assert "AI governance" in legal.extracted_text
+        await http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_ashby_skips_unlisted(self, http):
+        postings = await AshbyScraper(http=http).scrape_postings("https://jobs.ashbyhq.com/acme")
+        assert [p.title for p in postings] == ["AI Research Scientist"]
+        await http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_board_result_keeps_postings_within_caps(self, http):
+        scraper = GreenhouseScraper(ScraperConfig(ats_max_postings=1), http=http)
+        result = await scraper.scrape("https://boards.greenhouse.io/acme")
+
+        assert (result.metadata["postings"], result.metadata["postings_total"]) == (1, 2)
+        assert [p.title for p in result.postings] == ["Machine Learning Engineer"]
+        assert result.extracted_text.startswith("Machine Learning Engineer\n")
+
+        tight = GreenhouseScraper(ScraperConfig(ats_max_text_bytes=10), http=http)
+        assert len((await tight.scrape("https://boards.greenhouse.io/acme")).postings) == 1  # First one always kept
+        await http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_oversized_api_response_fails(self, http):
+        result = await GreenhouseScraper(ScraperConfig(max_body_bytes=100), http=http).scrape(
+            "https://boards.greenhouse.io/acme"
+        )
+        assert result.success is False
+        assert "larger than 100 bytes" in result.error_message
+        await http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unknown_board_fails_cleanly(self, http):
+        result = await GreenhouseScraper(http=http).scrape("https://boards.greenhouse.io/missing")
+        assert result.success is False
+        assert "404" in result.error_message
+        await http.aclose()
+
+
+class TestOrchestratorAtsRouting:
+    """Orchestrator selects API strategies and falls back to Selenium."""
+
+    def test_ats_urls_use_api_strategies(self):
+        orchestrator = ScraperOrchestrator()
+        assert orchestrator._select_strategy("https://jobs.ashbyhq.com/acme").strategy == ScraperStrategy.ASHBY
+        assert orchestrator._select_strategy("https://acme.wd5.myworkdayjobs.com/x").strategy == ScraperStrategy.SELENIUM
+
+    @pytest.mark.asyncio
+    async def test_api_failure_falls_back_to_selenium(self, http):
+        orchestrator = ScraperOrchestrator(http=http)
+        selenium = orchestrator._select_strategy("https://boards.greenhouse.io/missing", ScraperStrategy.SELENIUM)
+        selenium.scrape = AsyncMock(return_value=ScraperResult(
+            url="https://boards.greenhouse.io/missing",
+            success=True,
+            strategy_used=ScraperStrategy.SELENIUM,
+            extracted_text="rendered",
+        ))
+
+        result = await orchestrator.scrape("https://boards.greenhouse.io/missing")
+
+        assert result.success is True
+        assert result.strategy_used == ScraperStrategy.SELENIUM
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_keeps_board_postings(self, http, requests_seen, tmp_path):
+        config = ScraperConfig(cache_dir=str(tmp_path), respect_robots_txt=False)
+        orchestrator = ScraperOrchestrator(config, http=http)
+
+        miss = await orchestrator.scrape("https://boards.greenhouse.io/acme")
+        hit = await orchestrator.scrape("https://boards.greenhouse.io/acme")
+
+        assert hit.metadata["cache"] == "hit"
+        assert len(requests_seen) == 1
+        assert [(p.url, p.title, p.extracted_text) for p in hit.postings] == [
+            (p.url, p.title, p.extracted_text) for p in miss.postings
+        ]
+        assert len(hit.postings) == 2
+        await orchestrator.aclose()
@@ -0,0 +1,85 @@
+"""Tests for page body charset decoding."""
+
+import codecs
+
+import httpx
+import pytest
+
+from app.services.scrapers import GenericHtmlScraper, ScraperConfig, SharedHttpClient
+from app.services.scrapers import charset
+from app.services.scrapers.charset import decode_body, normalize_charset, sniff_meta_charset
+
+TEXT = "Ingénieur machine learning à Zürich — «IA générative»"
+
+
+def page(meta: str = "") -> str:
+    return f"<html><head>{meta}<title>Jobs</title></head><body><p>{TEXT}</p></body></html>"
+
+
+class TestDecodeBody:
+    def test_declared_charset_wins(self):
+        decoded = decode_body(page().encode("cp1252"), "ISO-8859-1")
+        assert (decoded.encoding, decoded.source) == ("cp1252", "header")
+        assert TEXT in decoded.text
+
+    def test_meta_charset(self):
+        body = page('<meta charset="windows-1252">').encode("cp1252")
+        decoded = decode_body(body)
+        assert decoded.source == "meta"
+        assert TEXT in decoded.text
+
+    def test_http_equiv_meta(self):
+        body = page('<meta http-equiv="Content-Type" content="text/html; charset=windows-1252">').encode("cp1252")
+        decoded = decode_body(body)
+        assert (decoded.encoding, decoded.source) == ("cp1252", "meta")
+        assert TEXT in decoded.text
+
+    def test_undeclared_utf8_skips_detection(self, monkeypatch):
+        monkeypatch.setattr(charset, "_detect", lambda body: pytest.fail("detection ran"))
+        decoded = decode_body(page().encode("utf-8"))
+        assert (decoded.encoding, decoded.source) == ("utf-8", "utf-8")
+
+    def test_truncated_utf8_is_still_utf8(self):
+        body = page().encode("utf-8")
+        cut = body.index("é".encode()) + 1  # Mid-character
+        assert decode_body(body[:cut]).source == "utf-8"
+
+    def test_undeclared_legacy_page_detected(self):
+        body = (page() * 20).encode("cp1252")
+        decoded = decode_body(body)
+        assert decoded.source == ("detected" if charset._detect else "fallback")
+        assert "Ingénieur" in decoded.text and "Zürich" in decoded.text  # Close single-byte codecs may differ elsewhere
+
+    def test_fallback_without_detector(self, monkeypatch):
+        monkeypatch.setattr(charset, "_detect", None)
+        decoded = decode_body(page().encode("cp1252"))
+        assert (decoded.encoding, decoded.source) == ("cp1252", "fallback")
+        assert TEXT in decoded.text
+
+    def test_bom_overrides_header(self):
+        decoded = decode_body(codecs.BOM_UTF8 + page().encode("utf-8"), "iso-8859-1")
+        assert decoded.source == "bom"
+        assert TEXT in decoded.text
+
+
+def test_label_resolution():
+    assert normalize_charset("latin1") == "cp1252"
+    assert normalize_charset("US-ASCII") == "cp1252"
+    assert normalize_charset("bogus-8") is None
+    assert sniff_meta_charset(b'<meta charset="utf-16">') == "utf-8"
+
+
+@pytest.mark.asyncio
+async def test_scraper_uses_meta_charset():
+    body = page('<meta charset="windows-1252">').encode("cp1252")
+
+    def handler(request):
+        return httpx.Response(200, headers={"Content-Type": "text/html"}, content=body)
+
+    config = ScraperConfig()
+    scraper = GenericHtmlScraper(config, http=SharedHttpClient(config, transport=httpx.MockTransport(handler)))
+    result = await scraper.scrape("https://acme.fr/emplois")
+
+    assert TEXT in result.extracted_text
+    assert result.metadata["charset_source"] == "meta"
+    await scraper.http.aclose()
@@ -0,0 +1,162 @@
+"""Tests for the per-host circuit breaker."""
+
+import time
+
+import httpx
+import pytest
+
+from app.services.scrapers import ScraperConfig, ScraperOrchestrator, ScraperResult, ScraperStrategy, SharedHttpClient
+from app.services.scrapers.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, is_host_failure
+
+URL = "https://dead.example.com/careers"
+
+
+def failed(**metadata) -> ScraperResult:
+    return ScraperResult(url=URL, success=False, strategy_used=ScraperStrategy.GENERIC_HTML, metadata=metadata)
+
+
+def ok() -> ScraperResult:
+    return ScraperResult(url=URL, success=True, strategy_used=ScraperStrategy.GENERIC_HTML)
+
+
+def make_breaker(tmp_path, **overrides) -> CircuitBreaker:
+    config = ScraperConfig(
+        cache_dir=str(tmp_path),
+        circuit_failure_threshold=overrides.pop("threshold", 3),
+        circuit_cooldown_seconds=overrides.pop("cooldown", 60),
+        **overrides,
+    )
+    return CircuitBreaker(config)
+
+
+def open_circuit(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.threshold):
+        breaker.record(URL, failed(error_kind="timeout"))
+
+
+class TestFailureClassification:
+    @pytest.mark.parametrize("metadata", [
+        {"error_kind": "timeout"},
+        {"error_kind": "connect"},
+        {"error_kind": "http_status", "status_code": 503},
+        {"error_kind": "http_status", "status_code": 429},
+        {"error_kind": "http_status", "status_code": 403},
+    ])
+    def test_host_failures(self, metadata):
+        assert is_host_failure(failed(**metadata))
+
+    def test_missing_page_is_not_a_host_failure(self):
+        assert not is_host_failure(failed(error_kind="http_status", status_code=404))
+        assert not is_host_failure(ok())
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self, tmp_path):
+        breaker = make_breaker(tmp_path)
+        breaker.record(URL, failed(error_kind="timeout"))
+        breaker.record(URL, failed(error_kind="timeout"))
+        assert breaker.allow(URL)
+
+        breaker.record(URL, failed(error_kind="timeout"))
+        assert breaker.state(URL) == OPEN
+        assert not breaker.allow("https://dead.example.com/other")
+        assert breaker.allow("https://alive.example.com/")
+
+    def test_success_resets_failure_count(self, tmp_path):
+        breaker = make_breaker(tmp_path)
+        breaker.record(URL, failed(error_kind="timeout"))
+        breaker.record(URL, failed(error_kind="timeout"))
+        breaker.record(URL, ok())
+        breaker.record(URL, failed(error_kind="timeout"))
+        assert breaker.state(URL) == CLOSED
+
+    def test_half_open_single_probe(self, tmp_path):
+        breaker = make_breaker(tmp_path)
+        open_circuit(breaker)
+        breaker._circuits["dead.example.com"].opened_at -= 61
+
+        assert breaker.allow(URL)  # The probe
+        assert breaker.state(URL) == HALF_OPEN
+        assert not breaker.allow(URL)  # Others wait for the probe's outcome
+
+        breaker.record(URL, ok())
+        assert breaker.state(URL) == CLOSED
+        assert breaker.allow(URL)
+
+    def test_unused_probe_released(self, tmp_path):
+        breaker = make_breaker(tmp_path)
+        open_circuit(breaker)
+        breaker._circuits["dead.example.com"].opened_at -= 61
+
+        assert breaker.allow(URL)
+        breaker.release(URL)  # e.g. robots.txt disallowed the probe URL
+        assert breaker.allow(URL)
+
+    def test_failed_probe_reopens(self, tmp_path):
+        breaker = make_breaker(tmp_path)
+        open_circuit(breaker)
+        breaker._circuits["dead.example.com"].opened_at -= 61
+
+        assert breaker.allow(URL)
+        breaker.record(URL, failed(error_kind="connect"))
+        assert breaker.state(URL) == OPEN
+        assert not breaker.allow(URL)
+
+    def test_in_flight_failures_ignored_while_open(self, tmp_path):
+        breaker = make_breaker(tmp_path)
+        open_circuit(breaker)
+        opened_at = breaker._circuits["dead.example.com"].opened_at
+        mtime = (tmp_path / "circuits.json").stat().st_mtime_ns
+
+        for _ in range(7):  # Requests that were already out when it opened
+            breaker.record(URL, failed(error_kind="timeout"))
+            breaker.record(URL, ok())
+
+        circuit = breaker._circuits["dead.example.com"]
+        assert (circuit.state, circuit.failures, circuit.opened_at) == (OPEN, 3, opened_at)
+        assert (tmp_path / "circuits.json").stat().st_mtime_ns == mtime
+
+    def test_failed_probe_not_undone_by_stragglers(self, tmp_path):
+        breaker = make_breaker(tmp_path)
+        open_circuit(breaker)
+        breaker._circuits["dead.example.com"].opened_at -= 61
+        assert breaker.allow(URL)
+        breaker.record(URL, failed(error_kind="timeout"))  # The probe
+
+        breaker.record(URL, ok())  # Sent before the circuit opened
+        assert breaker.state(URL) == OPEN
+
+    def test_open_circuits_persist(self, tmp_path):
+        open_circuit(make_breaker(tmp_path))
+
+        restarted = make_breaker(tmp_path)
+        assert restarted.state(URL) == OPEN
+        assert not restarted.allow(URL)
+
+    def test_persistence_optional(self, tmp_path):
+        open_circuit(make_breaker(tmp_path, circuit_persist=False))
+        assert make_breaker(tmp_path).state(URL) == CLOSED
+
+
+class TestOrchestratorBreaker:
+    @pytest.mark.asyncio
+    async def test_dead_host_skipped_without_network(self, tmp_path):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            raise httpx.ConnectTimeout("timed out", request=request)
+
+        config = ScraperConfig(respect_robots_txt=False, circuit_failure_threshold=2, cache_dir=str(tmp_path))
+        orchestrator = ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(handler)))
+
+        for i in range(5):
+            await orchestrator.scrape(f"https://dead.example.com/page/{i}")
+        start = time.monotonic()
+        result = await orchestrator.scrape("https://dead.example.com/careers")
+
+        assert len(requests) == 2
+        assert result.metadata["circuit"] == "open"
+        assert time.monotonic() - start < 0.1
+        assert orchestrator.stats["circuit_open"] == 4
+        await orchestrator.aclose()
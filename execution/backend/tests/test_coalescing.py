@@ -0,0 +1,178 @@
+"""Tests for URL canonicalization and single-flight scrape coalescing."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.services.discovery import DiscoveryService
+from app.services.scrapers import (
+    ScraperConfig,
+    ScraperOrchestrator,
+    SharedHttpClient,
+    finish_scrape_run,
+    start_scrape_run,
+)
+from app.services.scrapers.urls import canonical_url
+
+PAGE = "<html><head><title>Careers</title></head><body>ML Engineer</body></html>"
+
+
+class TestCanonicalUrl:
+    @pytest.mark.parametrize("variant", [
+        "https://acme.com/careers",
+        "https://www.acme.com/careers",
+        "https://acme.com/careers/",
+        "https://ACME.com/careers#open-roles",
+        "https://acme.com/careers?utm_source=google&utm_medium=cpc",
+        "https://acme.com/careers?gclid=abc&fbclid=def",
+    ])
+    def test_trivial_variants_collapse(self, variant):
+        assert canonical_url(variant) == "https://acme.com/careers"
+
+    def test_meaningful_query_kept_and_sorted(self):
+        assert canonical_url("https://acme.com/jobs?team=ml&page=2&utm_campaign=x") == "https://acme.com/jobs?page=2&team=ml"
+
+    def test_root_path(self):
+        assert canonical_url("https://www.acme.com") == "https://acme.com/"
+
+
+class SlowSite:
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.requests: list[str] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(str(request.url))
+        await asyncio.sleep(0.05)
+        return httpx.Response(self.status, text=PAGE, headers={"Content-Type": "text/html"})
+
+
+def make_orchestrator(site: SlowSite) -> ScraperOrchestrator:
+    config = ScraperConfig(respect_robots_txt=False)
+    return ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_concurrent_variants_share_one_fetch(self):
+        site = SlowSite()
+        orchestrator = make_orchestrator(site)
+
+        first, second = await asyncio.gather(
+            orchestrator.scrape("https://acme.com/careers"),
+            orchestrator.scrape("https://www.acme.com/careers/?utm_source=x"),
+        )
+
+        assert len(site.requests) == 1
+        assert first.extracted_text == second.extracted_text
+        assert second.url == "https://www.acme.com/careers/?utm_source=x"
+        assert second.metadata["coalesced"] == "in_flight"
+        assert orchestrator.stats["dedup_inflight"] == 1
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_job_leaves_the_shared_fetch_to_the_other(self):
+        site = SlowSite()
+        orchestrator = make_orchestrator(site)
+
+        async def job_a():
+            async for _ in orchestrator.scrape_stream(["https://acme.com/careers"]):
+                pass
+
+        a = asyncio.create_task(job_a())
+        await asyncio.sleep(0.01)  # A owns the fetch
+        b = asyncio.create_task(orchestrator.scrape("https://acme.com/careers"))
+        await asyncio.sleep(0.01)  # B waits on it
+        a.cancel()
+
+        result = await asyncio.wait_for(b, timeout=2)
+        assert result.success and result.metadata["coalesced"] == "in_flight"
+        assert len(site.requests) == 1
+        assert a.cancelled()
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fetch_cancelled_when_nobody_waits_then_refetched(self):
+        site = SlowSite()
+        orchestrator = make_orchestrator(site)
+
+        a = asyncio.create_task(orchestrator.scrape("https://acme.com/careers"))
+        await asyncio.sleep(0.01)
+        a.cancel()
+        await asyncio.sleep(0)  # The abandoned fetch is being cancelled, not yet forgotten
+
+        result = await asyncio.wait_for(orchestrator.scrape("https://acme.com/careers"), timeout=2)
+        assert result.success
+        assert len(site.requests) == 2
+        assert orchestrator._inflight == {}
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_each_url_fetched_once_per_run(self):
+        site = SlowSite()
+        orchestrator = make_orchestrator(site)
+        run, token = start_scrape_run()
+        try:
+            await orchestrator.scrape("https://acme.com/careers")
+            results = await orchestrator.scrape_batch(["https://acme.com/careers/", "https://acme.com/careers#x"])
+        finally:
+            finish_scrape_run(token)
+
+        assert len(site.requests) == 1
+        assert all(r.metadata["coalesced"] == "run" for r in results)
+        assert run.stats["dedup_run"] == 2
+        assert len(run.results) == 1
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failures_not_retried_within_run(self):
+        site = SlowSite(status=503)
+        orchestrator = make_orchestrator(site)
+        run, token = start_scrape_run()
+        try:
+            await orchestrator.scrape("https://acme.com/careers")
+            again = await orchestrator.scrape("https://acme.com/careers")
+        finally:
+            finish_scrape_run(token)
+
+        assert again.success is False
+        assert len(site.requests) == 1
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_no_memo_outside_a_run(self):
+        site = SlowSite()
+        orchestrator = make_orchestrator(site)
+
+        await orchestrator.scrape("https://acme.com/careers")
+        await orchestrator.scrape("https://acme.com/careers")
+
+        assert len(site.requests) == 2
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_conditional_requests_not_merged_with_plain_ones(self):
+        site = SlowSite()
+        orchestrator = make_orchestrator(site)
+        run, token = start_scrape_run()
+        try:
+            await orchestrator.scrape("https://acme.com/careers", validators={"etag": '"v1"'})
+            await orchestrator.scrape("https://acme.com/careers")
+        finally:
+            finish_scrape_run(token)
+
+        assert len(site.requests) == 2
+        await orchestrator.aclose()
+
+
+def test_subdomain_scan_probed_once_per_domain():
+    discovery = DiscoveryService()
+    with patch.object(discovery, "_check_subdomain_exists", side_effect=lambda url: url.startswith("https://ai.")) as probe:
+        first = discovery.discover_subdomains("Acme", "acme.com")
+        calls = probe.call_count
+        second = discovery.discover_subdomains("Acme", "www.acme.com")
+
+    assert first == second == [{"url": "https://ai.acme.com", "type": "subdomain_ai"}]
+    assert probe.call_count == calls
@@ -0,0 +1,92 @@
+"""Tests for the priority crawl frontier."""
+
+import httpx
+import pytest
+
+from app.services.scrapers import ParsedDocument, ScraperConfig, ScraperOrchestrator, SharedHttpClient
+from app.services.scrapers.frontier import POSTING_SCORE, CrawlFrontier, crawl, same_site, score_link
+
+
+class TestScoreLink:
+    def test_postings_outrank_listings_and_keywords(self):
+        ats_job = score_link("https://boards.greenhouse.io/acme/jobs/4412001")
+        posting = score_link("https://acme.com/careers/ml-engineer", "ML Engineer")
+        listing = score_link("https://acme.com/careers", "Careers")
+        keyword = score_link("https://acme.com/team", "Our team")
+
+        assert ats_job > posting > listing > keyword > 0
+        assert posting >= POSTING_SCORE > listing
+
+    def test_job_id_query(self):
+        assert score_link("https://acme.com/open?gh_jid=4412001") >= POSTING_SCORE
+
+    def test_irrelevant_links_score_zero(self):
+        assert score_link("https://acme.com/blog/careers-at-acme", "Careers at Acme") == 0
+        assert score_link("https://acme.com/careers/handbook.pdf") == 0
+        assert score_link("https://acme.com/pricing", "Pricing") == 0
+
+    def test_same_site(self):
+        assert same_site("https://careers.acme.com/x", "https://www.acme.com/")
+        assert not same_site("https://notacme.com/jobs", "https://acme.com/")
+
+
+class TestCrawlFrontier:
+    def test_pops_best_first_within_page_budget(self):
+        frontier = CrawlFrontier("https://acme.com/", max_pages=2)
+        frontier.add("https://acme.com/team", "Team")
+        frontier.add("https://acme.com/careers", "Careers")
+        frontier.add("https://acme.com/jobs/data-engineer", "Data Engineer")
+
+        assert [item.url for item in frontier.pop_batch(5)] == [
+            "https://acme.com/jobs/data-engineer",
+            "https://acme.com/careers",
+        ]
+        assert frontier.exhausted and frontier.pop_batch(5) == []
+
+    def test_seen_set_and_constraints(self):
+        frontier = CrawlFrontier("https://acme.com/")
+        assert frontier.add("https://acme.com/careers")
+        assert not frontier.add("https://www.acme.com/careers/#open")  # Same canonical URL
+        assert not frontier.add("https://acme.com/")  # The root itself
+        assert not frontier.add("https://linkedin.com/company/acme/jobs", "Jobs")  # Off-site
+        assert frontier.add("https://jobs.lever.co/acme/123-abc")  # Off-site ATS: kept, not fetched
+        assert frontier.add("https://acme.com/careers/ml-engineer", depth=2)  # At max depth: kept, not fetched
+
+        assert frontier.queued == 1
+        assert frontier.ranked()[0] == "https://jobs.lever.co/acme/123-abc"
+
+    def test_add_links_from_document(self):
+        document = ParsedDocument.from_html(
+            '<a href="/jobs/ml-engineer">ML Engineer</a><a href="/about">About</a>'
+            '<iframe src="https://boards.greenhouse.io/embed/job_board?for=acme"></iframe>'
+        )
+        frontier = CrawlFrontier("https://acme.com/")
+        assert frontier.add_links(document, "https://acme.com/", depth=1) == 2
+
+
+SITE = {
+    "/": '<a href="/careers">Careers</a><a href="/blog">Blog</a><a href="/team">Team</a>',
+    "/careers": "".join(f'<a href="/careers/role-{i}">Software Engineer {i}</a>' for i in range(3)),
+    "/team": '<a href="/careers/team-lead">Team Lead</a>',
+}
+
+
+@pytest.mark.asyncio
+async def test_crawl_fetches_most_promising_pages_first():
+    fetched = []
+
+    def site(request):
+        fetched.append(request.url.path)
+        body = f"<html><body>{SITE.get(request.url.path, '<p>Job description</p>')}</body></html>"
+        return httpx.Response(200, text=body, headers={"Content-Type": "text/html"})
+
+    config = ScraperConfig(respect_robots_txt=False)
+    orchestrator = ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+    frontier = CrawlFrontier("https://acme.com/", max_depth=2, max_pages=5)
+    frontier.add_links(ParsedDocument.from_html(SITE["/"]), "https://acme.com/", depth=1)
+
+    links = await crawl(orchestrator, frontier, want=3, batch_size=1)
+
+    assert fetched == ["/careers"]  # Three postings found, /team never needed
+    assert links == [f"https://acme.com/careers/role-{i}" for i in range(3)]
+    await orchestrator.aclose()
@@ -0,0 +1,128 @@
+"""Tests for the per-job scoring deadline."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.company import Company
+from app.services.deadline import Deadline
+from app.services.discovery import DiscoveryService
+from app.services.scoring_service import ScoringService
+from app.services.scrapers import ScraperConfig, ScraperOrchestrator, SharedHttpClient
+
+WEIGHTS = {"discovery": 0.5, "scrape": 0.25, "deep": 0.25}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDeadline:
+    def test_stage_gets_its_share_of_what_remains(self):
+        clock = FakeClock()
+        deadline = Deadline(100, WEIGHTS, clock=clock)
+
+        assert deadline.stage_budget("discovery") == pytest.approx(50)
+        deadline.begin("discovery")
+        clock.now = 20  # Discovery finished early: the 30 s it didn't use roll over
+        deadline.end("discovery")
+        assert deadline.stage_budget("scrape") == pytest.approx(40)
+
+    def test_skipped_stage_share_goes_to_later_stages(self):
+        deadline = Deadline(100, WEIGHTS, clock=FakeClock())
+        assert deadline.stage_budget("deep") == pytest.approx(100)
+
+    def test_unlimited(self):
+        deadline = Deadline(0, WEIGHTS)
+        assert deadline.stage_budget("discovery") is None
+        assert not deadline.expired()
+
+    @pytest.mark.asyncio
+    async def test_run_cancels_late_stage(self):
+        deadline = Deadline(0.2, WEIGHTS)
+        partial = []
+
+        async def slow():
+            partial.append("first")
+            await asyncio.sleep(5)
+            partial.append("never")
+
+        result = await deadline.run("discovery", slow(), default=partial)
+
+        assert result == ["first"]
+        assert deadline.truncated == ["discovery"]
+        assert deadline.summary()["stages"]["discovery"]["spent"] < 1
+
+    @pytest.mark.asyncio
+    async def test_run_in_time(self):
+        deadline = Deadline(10, WEIGHTS)
+        assert await deadline.run("scrape", asyncio.sleep(0, result="ok")) == "ok"
+        assert deadline.truncated == []
+
+
+def test_discovery_stops_searching_after_deadline():
+    discovery = DiscoveryService()
+    discovery.deadline_at = time.monotonic() - 1
+
+    with patch("app.services.discovery.search") as search, \
+            patch.object(discovery, "_check_subdomain_exists") as probe:
+        sources = discovery.find_sources("Acme", "acme.com")
+
+    assert discovery.truncated
+    search.assert_not_called()
+    probe.assert_not_called()
+    assert sources  # Falls back to the heuristic candidates
+    assert discovery.discover_subdomains("Acme", "acme.com") == []
+    assert "acme.com" not in discovery._subdomains  # A cut-short scan isn't memoized
+
+
+PAGE = "<html><head><title>{}</title></head><body><p>We use machine learning and LLM agents.</p></body></html>"
+
+
+async def slow_satellites(request: httpx.Request) -> httpx.Response:
+    if request.url.path.startswith("/slow"):
+        await asyncio.sleep(30)
+    return httpx.Response(200, text=PAGE.format(request.url.path), headers={"Content-Type": "text/html"})
+
+
+@pytest.mark.asyncio
+async def test_score_company_continues_with_partial_evidence():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    config = ScraperConfig(respect_robots_txt=False, timeout_seconds=60, circuit_failure_threshold=0)
+    service = ScoringService(db)
+    service.scraper = ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(slow_satellites)))
+    sources = [
+        {"url": "https://acme.com/blog", "type": "engineering_blog"},
+        {"url": "https://acme.com/slow-1", "type": "newsroom"},
+        {"url": "https://acme.com/slow-2", "type": "newsroom"},
+    ]
+
+    started = time.monotonic()
+    with patch("app.services.scoring_service.settings.SCORING_BUDGET_SECONDS", 1.0), \
+            patch("app.services.discovery.DiscoveryService.find_sources", return_value=sources), \
+            patch("app.services.discovery.DiscoveryService.discover_subdomains", return_value=[]):
+        await service.score_company("https://acme.com/")
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 5
+    company = db.query(Company).filter_by(domain="acme.com").one()
+    assert len(company.scores) == 1
+    steps = {s["step"]: s["detail"] for s in company.discovery_trace["steps"]}
+    assert steps["Deadline budget"]["truncated"] == ["satellites"]
+    assert "homepage" in steps["Deadline budget"]["stages"]
+    await service.scraper.aclose()
+    db.close()
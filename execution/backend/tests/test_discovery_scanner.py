@@ -1,73 +1,122 @@
-import pytest
-from unittest.mock import patch, MagicMock
+import asyncio
+import time
+
+import httpx
+from unittest.mock import patch
 from app.services.discovery import DiscoveryService
 
-@pytest.fixture
-def discovery_service():
-    return DiscoveryService()
 
-def test_discover_subdomains_found(discovery_service):
+def probe_site(statuses, requests=None):
+    """Discovery with a mock transport: `statuses(method, host, path)` -> status code."""
+    def handler(request):
+        if requests is not None:
+            requests.append((request.method, str(request.url)))
+        return httpx.Response(statuses(request.method, request.url.host, request.url.path))
+    return DiscoveryService(transport=httpx.MockTransport(handler))
+
+
+def test_discover_subdomains_found():
     """
     Test that discover_subdomains correctly identifies existing subdomains
     and assigns the correct type.
     """
-    # Mock requests to return 200 OK for 'ai.example.com' only
-    with patch("requests.head") as mock_head:
-        def side_effect(url, timeout, allow_redirects):
-            if "ai.example.com" in url:
-                mock_resp = MagicMock()
-                mock_resp.status_code = 200
-                return mock_resp
-            mock_resp = MagicMock()
-            mock_resp.status_code = 404
-            return mock_resp
-            
-        mock_head.side_effect = side_effect
-        
-        results = discovery_service.discover_subdomains("Example", "example.com")
-        
-        # Should find exactly one
-        assert len(results) == 1
-        assert results[0]["url"] == "https://ai.example.com"
-        assert results[0]["type"] == "subdomain_ai"
-
-def test_discover_subdomains_fallback_get(discovery_service):
+    # 200 OK for 'ai.example.com' only
+    discovery_service = probe_site(lambda method, host, path: 200 if host == "ai.example.com" else 404)
+
+    results = discovery_service.discover_subdomains("Example", "example.com")
+
+    # Should find exactly one
+    assert len(results) == 1
+    assert results[0]["url"] == "https://ai.example.com"
+    assert results[0]["type"] == "subdomain_ai"
+
+def test_discover_subdomains_fallback_get():
     """
     Test that if HEAD returns 405 (Method Not Allowed), it falls back to GET.
     """
-    with patch("requests.head") as mock_head, patch("requests.get") as mock_get:
-        # HEAD -> 405
-        head_resp = MagicMock()
-        head_resp.status_code = 405
-        mock_head.return_value = head_resp
-        
-        # GET -> 200
-        get_resp = MagicMock()
-        get_resp.status_code = 200
-        mock_get.return_value = get_resp
-        
-        # We only want to test one specific subdomain to keep it simple/fast
-        # But the method scans a list. We can patch the class-level list if we want,
-        # or just rely on the fact that it iterates.
-        
-        # Let's just mock one specific call to succeed: 'ai.example.com'
-        # The code iterates ALL prefixes.
-        
-        results = discovery_service.discover_subdomains("Example", "example.com")
-        
-        # We expect it to try HEAD then GET for each.
-        # Since we mocked return_value (not side_effect) for all calls, 
-        # it effectively finds ALL prefixes because GET returns 200 for everything.
-        # There are 11 prefixes in the code.
-        assert len(results) == 11
-        assert mock_get.called
-
-def test_discover_subdomains_none(discovery_service):
+    requests = []
+    discovery_service = probe_site(lambda method, host, path: 405 if method == "HEAD" else 200, requests)
+
+    results = discovery_service.discover_subdomains("Example", "example.com")
+
+    # HEAD then GET for each: GET returns 200 for everything, so all 11 prefixes are found
+    assert len(results) == 11
+    assert sum(method == "GET" for method, _ in requests) == 11
+
+def test_discover_subdomains_none():
     """Test when no subdomains exist."""
-    with patch("requests.head") as mock_head:
-        mock_resp = MagicMock()
-        mock_resp.status_code = 404
-        mock_head.return_value = mock_resp
-        
-        results = discovery_service.discover_subdomains("Example", "example.com")
-        assert len(results) == 0
+    discovery_service = probe_site(lambda method, host, path: 404)
+
+    results = discovery_service.discover_subdomains("Example", "example.com")
+    assert len(results) == 0
+
+def test_unreachable_hosts_count_as_missing():
+    def handler(request):
+        raise httpx.ConnectError("Name or service not known", request=request)
+
+    discovery_service = DiscoveryService(transport=httpx.MockTransport(handler))
+    assert discovery_service.discover_subdomains("Example", "example.com") == []
+
+
+def test_probes_run_concurrently_within_limit():
+    in_flight, peak = 0, 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return httpx.Response(404)
+
+    discovery_service = DiscoveryService(transport=httpx.MockTransport(handler))
+    discovery_service.probe_concurrency = 4
+    started = time.monotonic()
+    discovery_service.discover_subdomains("Example", "example.com")
+
+    assert peak == 4
+    assert time.monotonic() - started < 11 * 0.05  # Not one after another
+
+
+def test_probe_budget_caps_probes_per_company():
+    requests = []
+    discovery_service = probe_site(lambda method, host, path: 200, requests)
+    discovery_service.probes_left = 5
+
+    first = discovery_service.discover_subdomains("Example", "example.com")
+    alternate = discovery_service._probe_alternate_tlds("Example", "example.com")
+
+    assert [r["url"] for r in first] == [
+        "https://ai.example.com", "https://research.example.com", "https://labs.example.com",
+        "https://engineering.example.com", "https://tech.example.com",
+    ]
+    assert alternate == []
+    assert len(requests) == 5
+    assert discovery_service.probe_budget_spent
+
+
+def test_corporate_pages_first_hit_per_type_in_pattern_order():
+    # Later patterns respond too; the earlier pattern still wins its type
+    live = {("example.com", "/ir"), ("example.com", "/news"), ("newsroom.example.com", "/"),
+            ("investors.example.com", "/"), ("press.example.com", "/")}
+    discovery_service = probe_site(lambda method, host, path: 200 if (host, path) in live else 404)
+
+    results = discovery_service._probe_corporate_pages("example.com")
+
+    assert results == [
+        {"url": "https://example.com/ir", "type": "investor_relations"},
+        {"url": "https://example.com/news", "type": "newsroom"},
+        {"url": "https://press.example.com", "type": "press_release"},
+    ]
+
+
+@patch("app.services.discovery.search", return_value=[])
+def test_find_sources_probes_everything_in_one_batch(mock_search):
+    requests = []
+    discovery_service = probe_site(lambda method, host, path: 404, requests)
+
+    with patch.object(discovery_service, "_probe_batch", wraps=discovery_service._probe_batch) as batch:
+        discovery_service.find_sources("Example", "example.com")
+
+    assert batch.call_count == 1  # Corporate pages, alternate TLDs and subdomains together
+    assert len(requests) == 13 + 4 + 11
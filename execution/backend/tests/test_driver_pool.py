@@ -0,0 +1,178 @@
+"""Tests for the Selenium WebDriver pool."""
+
+import threading
+import time
+
+import pytest
+
+from app.services.scrapers import ScraperConfig, ScraperOrchestrator, SeleniumScraper
+from app.services.scrapers.driver_pool import DriverPoolTimeoutError, WebDriverPool
+
+
+class FakeDriver:
+    """Minimal stand-in for a selenium WebDriver."""
+
+    def __init__(self):
+        self.quit_called = False
+        self.alive = True
+        self.visited = []
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return self.visited[-1] if self.visited else "about:blank"
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(**overrides) -> tuple[WebDriverPool, list[FakeDriver]]:
+    created = []
+
+    def factory():
+        driver = FakeDriver()
+        created.append(driver)
+        return driver
+
+    config = ScraperConfig(**overrides)
+    return WebDriverPool(config, driver_factory=factory), created
+
+
+class TestWebDriverPool:
+    """Tests for driver reuse, recycling and metrics."""
+
+    def test_driver_reused_across_leases(self):
+        pool, created = make_pool(selenium_pool_size=1)
+        for _ in range(3):
+            with pool.lease() as lease:
+                lease.driver.get("https://example.com")
+        assert len(created) == 1
+        assert pool.stats()["leases"] == 3
+
+    def test_recycles_after_max_pages(self):
+        pool, created = make_pool(selenium_pool_size=1, selenium_max_pages_per_driver=2)
+        for _ in range(5):
+            with pool.lease():
+                pass
+        assert len(created) == 3
+        assert created[0].quit_called and created[1].quit_called
+        assert pool.stats()["recycled"] == 2
+
+    def test_error_in_lease_discards_driver(self):
+        pool, created = make_pool(selenium_pool_size=1)
+        with pytest.raises(ValueError):
+            with pool.lease():
+                raise ValueError("renderer crashed")
+        assert created[0].quit_called
+
+        with pool.lease() as lease:
+            assert lease.driver is not created[0]
+        assert pool.stats()["crashed"] == 1
+
+    def test_dead_idle_driver_replaced(self):
+        pool, created = make_pool(selenium_pool_size=1)
+        with pool.lease():
+            pass
+        created[0].alive = False
+
+        with pool.lease() as lease:
+            assert lease.driver is created[1]
+
+    def test_pool_is_bounded(self):
+        pool, created = make_pool(selenium_pool_size=2)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def render():
+            nonlocal active, peak
+            with pool.lease():
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=render) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak == 2
+        assert len(created) == 2
+        assert pool.stats()["max_wait_seconds"] > 0
+
+    def test_acquire_timeout(self):
+        pool, _ = make_pool(selenium_pool_size=1, selenium_acquire_timeout_seconds=0.05)
+        with pool.lease():
+            with pytest.raises(DriverPoolTimeoutError):
+                with pool.lease():
+                    pass
+
+    def test_warm_prelaunches_drivers(self):
+        pool, created = make_pool(selenium_pool_size=3)
+        assert pool.warm() == 3
+        assert pool.stats()["idle"] == 3
+        with pool.lease() as lease:
+            assert lease.driver in created
+        assert len(created) == 3
+
+    def test_first_lease_warms_the_rest(self):
+        pool, created = make_pool(selenium_pool_size=3)
+        with pool.lease():
+            for _ in range(100):
+                if pool.stats()["idle"] == 2:
+                    break
+                time.sleep(0.01)
+        assert len(created) == 3
+        assert pool.stats()["live"] == 3
+
+        with pool.lease(), pool.lease():
+            pass
+        assert len(created) == 3  # Later leases found warm drivers
+
+    def test_close_quits_idle_drivers(self):
+        pool, created = make_pool(selenium_pool_size=2)
+        pool.warm()
+        pool.close()
+        assert all(d.quit_called for d in created)
+        assert pool.stats()["live"] == 0
+        with pytest.raises(RuntimeError):
+            with pool.lease():
+                pass
+
+
+class TestSeleniumScraperPool:
+    """SeleniumScraper wiring."""
+
+    def test_scraper_owns_pool(self):
+        scraper = SeleniumScraper(ScraperConfig(selenium_pool_size=3))
+        assert scraper.pool.size == 3
+
+    def test_orchestrator_exposes_pool_stats(self):
+        orchestrator = ScraperOrchestrator(ScraperConfig(selenium_pool_size=3))
+        stats = orchestrator.pool_stats()
+        assert stats["size"] == 3
+        assert stats["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pool_stats_logged_on_close(self, caplog):
+        orchestrator = ScraperOrchestrator(ScraperConfig(selenium_pool_size=1))
+        selenium = orchestrator._strategy(SeleniumScraper)
+        selenium.pool.driver_factory = FakeDriver
+        with selenium.pool.lease():
+            pass
+
+        with caplog.at_level("INFO", logger="app.services.scrapers.orchestrator"):
+            await orchestrator.aclose()
+
+        assert "WebDriver pool stats" in caplog.text
@@ -0,0 +1,153 @@
+"""Tests for adaptive httpx → browser escalation."""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.services.scrapers import (
+    ScraperConfig,
+    ScraperOrchestrator,
+    ScraperResult,
+    ScraperStrategy,
+    SeleniumScraper,
+    SharedHttpClient,
+)
+from app.services.scrapers.escalation import TierMemory, spa_shell_reason
+
+RICH_TEXT = "We are hiring machine learning engineers to build our inference platform. " * 10
+
+STATIC_PAGE = f"<html><head><title>Careers</title></head><body><p>{RICH_TEXT}</p></body></html>"
+SHELL_PAGE = (
+    '<html><head><title>Careers</title><script src="/static/js/main.js"></script></head>'
+    '<body><noscript>You need to enable JavaScript.</noscript><div id="root"></div></body></html>'
+)
+NEXT_DATA_PAGE = (
+    "<html><body><div>Loading</div>"
+    '<script id="__NEXT_DATA__" type="application/json">{"props": {"jobs": []}}</script></body></html>'
+)
+
+
+class TestSpaShellDetection:
+    def test_empty_mount_point(self):
+        assert spa_shell_reason(SHELL_PAGE, "You need to enable JavaScript.", 250) == "empty_root"
+
+    def test_next_data_only(self):
+        assert spa_shell_reason(NEXT_DATA_PAGE, "Loading", 250) == "next_data_only"
+
+    def test_tiny_text_with_scripts(self):
+        html = '<html><body><p>Hi</p><script src="/app.js"></script></body></html>'
+        assert spa_shell_reason(html, "Hi", 250) == "tiny_text"
+
+    def test_small_static_page_is_not_a_shell(self):
+        assert spa_shell_reason("<html><body><p>Hi</p></body></html>", "Hi", 250) is None
+
+    def test_rendered_page_is_not_a_shell(self):
+        assert spa_shell_reason(STATIC_PAGE, RICH_TEXT, 250) is None
+
+    def test_empty_mount_beside_rendered_text_is_not_a_shell(self):
+        html = STATIC_PAGE.replace("</body>", '<div id="app"></div></body>')
+        assert spa_shell_reason(html, RICH_TEXT, 250) is None
+
+
+class TestTierMemory:
+    def test_remembers_per_host_and_expires(self):
+        tiers = TierMemory(ttl_hours=1)
+        tiers.remember("https://jobs.acme.com/a", ScraperStrategy.SELENIUM)
+
+        assert tiers.get("https://JOBS.acme.com/b") == ScraperStrategy.SELENIUM
+        assert tiers.get("https://acme.com/") is None
+
+        tiers._hosts["jobs.acme.com"] = (ScraperStrategy.SELENIUM, 0)
+        assert tiers.get("https://jobs.acme.com/a") is None
+
+    def test_lru_bound(self):
+        tiers = TierMemory(max_entries=2)
+        for host in ("a.com", "b.com", "c.com"):
+            tiers.remember(f"https://{host}/", ScraperStrategy.GENERIC_HTML)
+        assert set(tiers.snapshot()) == {"b.com", "c.com"}
+
+
+class Site:
+    """Serves a static page on static hosts and an SPA shell on spa hosts."""
+
+    def __init__(self):
+        self.requests: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(str(request.url))
+        body = SHELL_PAGE if request.url.host.startswith("spa") else STATIC_PAGE
+        return httpx.Response(200, text=body, headers={"Content-Type": "text/html"})
+
+
+def make_orchestrator(site: Site, rendered_text: str = RICH_TEXT, **overrides) -> ScraperOrchestrator:
+    config = ScraperConfig(respect_robots_txt=False, **{"adaptive_escalation": True, **overrides})
+    orchestrator = ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+    browser = next(s for s in orchestrator.strategies if isinstance(s, SeleniumScraper))
+
+    async def render(url):
+        return ScraperResult(
+            url=url,
+            success=bool(rendered_text),
+            strategy_used=ScraperStrategy.SELENIUM,
+            extracted_text=rendered_text or None,
+            error_message=None if rendered_text else "Selenium dependencies not installed",
+        )
+
+    browser.scrape = AsyncMock(side_effect=render)
+    return orchestrator
+
+
+class TestAdaptiveEscalation:
+    @pytest.mark.asyncio
+    async def test_static_ats_page_skips_browser(self):
+        site = Site()
+        orchestrator = make_orchestrator(site)
+        url = "https://static.myworkdayjobs.com/careers"
+
+        result = await orchestrator.scrape(url)
+
+        assert result.strategy_used == ScraperStrategy.GENERIC_HTML
+        assert orchestrator._strategy(SeleniumScraper).scrape.await_count == 0
+        assert orchestrator.tiers.get(url) == ScraperStrategy.GENERIC_HTML
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_spa_shell_escalates_and_host_is_remembered(self):
+        site = Site()
+        orchestrator = make_orchestrator(site)
+        browser = orchestrator._strategy(SeleniumScraper)
+
+        first = await orchestrator.scrape("https://spa.acme.com/careers")
+        second = await orchestrator.scrape("https://spa.acme.com/careers/engineering")
+
+        assert first.strategy_used == ScraperStrategy.SELENIUM
+        assert first.metadata["spa_shell"] == "empty_root"
+        assert first.metadata["escalated_from"] == "generic_html"
+        assert second.strategy_used == ScraperStrategy.SELENIUM
+        assert site.requests == ["https://spa.acme.com/careers"]  # Second visit skipped HTTP
+        assert browser.scrape.await_count == 2
+        assert orchestrator.stats["escalated"] == 1
+        assert orchestrator.stats["tier_browser"] == 1
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failed_render_keeps_http_result(self):
+        site = Site()
+        orchestrator = make_orchestrator(site, rendered_text="")
+        url = "https://spa.acme.com/careers"
+
+        result = await orchestrator.scrape(url)
+
+        assert result.success
+        assert result.strategy_used == ScraperStrategy.GENERIC_HTML
+        assert result.metadata["spa_shell"] == "empty_root"
+        assert orchestrator.stats["escalation_failed"] == 1
+        assert orchestrator.tiers.get(url) == ScraperStrategy.GENERIC_HTML
+        await orchestrator.aclose()
+
+    def test_disabled_keeps_pattern_selection(self):
+        orchestrator = ScraperOrchestrator(ScraperConfig(adaptive_escalation=False))
+        assert orchestrator.tiers is None
+        scraper = orchestrator._select_strategy("https://acme.wd5.myworkdayjobs.com/careers")
+        assert isinstance(scraper, SeleniumScraper)
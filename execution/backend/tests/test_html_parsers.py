@@ -0,0 +1,76 @@
+"""Tests for pluggable HTML parser backends."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from app.services.scrapers import ScraperConfig, ScraperResult, ScraperStrategy
+from app.services.scrapers import document as document_module
+from app.services.scrapers.document import ParsedDocument, available_parsers, resolve_parser
+
+PAGES = sorted((Path(__file__).parent / "fixtures" / "pages").glob("*.html"))
+OPTIONAL_BACKENDS = {"lxml": "lxml", "selectolax": "selectolax"}
+
+
+def require(backend: str) -> None:
+    module = OPTIONAL_BACKENDS.get(backend)
+    if module and importlib.util.find_spec(module) is None:
+        pytest.skip(f"{module} not installed")
+
+
+@pytest.mark.parametrize("backend", ["lxml", "selectolax"])
+@pytest.mark.parametrize("page", PAGES, ids=[p.stem for p in PAGES])
+def test_backends_match_html_parser(backend, page):
+    require(backend)
+    html = page.read_text(encoding="utf-8")
+
+    reference = ParsedDocument.from_html(html, "html.parser")
+    doc = ParsedDocument.from_html(html, backend)
+
+    assert doc.text == reference.text
+    assert doc.title == reference.title
+    assert doc.anchors == reference.anchors
+    assert doc.iframes == reference.iframes
+    assert doc.structured_data == reference.structured_data
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        ParsedDocument.from_html("<p>x</p>", "html5lib-turbo")
+
+
+def test_missing_backend_falls_back(monkeypatch):
+    resolve_parser.cache_clear()
+    monkeypatch.setattr(document_module, "available_parsers", lambda: ["html.parser"])
+    try:
+        assert resolve_parser("selectolax") == "html.parser"
+        assert ParsedDocument.from_html("<title>t</title><p>x</p>", "selectolax").text == "t x"
+    finally:
+        resolve_parser.cache_clear()
+
+
+def test_html_parser_always_available():
+    assert "html.parser" in available_parsers()
+
+
+def test_configured_backend_used_for_lazy_documents(monkeypatch):
+    seen = []
+    real = ParsedDocument.from_html.__func__
+
+    def spy(cls, html, parser="html.parser", text_mode="full"):
+        seen.append(parser)
+        return real(cls, html, parser, text_mode)
+
+    monkeypatch.setattr(ParsedDocument, "from_html", classmethod(spy))
+    result = ScraperResult(
+        url="https://acme.com/",
+        success=True,
+        strategy_used=ScraperStrategy.GENERIC_HTML,
+        raw_html="<p>x</p>",
+        html_parser="lxml",
+    )
+    result.parsed_document()
+
+    assert seen == ["lxml"]
+    assert ScraperConfig(html_parser="selectolax").html_parser == "selectolax"
@@ -0,0 +1,130 @@
+"""Tests for the record/replay HTTP archive."""
+
+import gzip
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.services.discovery import DiscoveryService
+from app.services.scrapers import ScraperConfig, ScraperOrchestrator, SharedHttpClient
+from app.services.scrapers.http_archive import ArchiveTransport, HttpArchive
+from app.services.scrapers.selenium_scraper import SeleniumScraper
+
+PAGE = "<html><head><title>Careers</title></head><body><p>We hire ML engineers.</p></body></html>"
+
+
+def live_site(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/down":
+        raise httpx.ConnectTimeout("timed out", request=request)
+    if request.url.path == "/missing":
+        return httpx.Response(404, text="nope")
+    # Compressed on the wire: the archive must store the decoded body
+    return httpx.Response(
+        200,
+        content=gzip.compress(PAGE.encode()),
+        headers={"Content-Type": "text/html", "Content-Encoding": "gzip", "ETag": '"v1"'},
+    )
+
+
+def recording_orchestrator(archive: HttpArchive) -> ScraperOrchestrator:
+    config = ScraperConfig(respect_robots_txt=False, circuit_failure_threshold=0)
+    transport = ArchiveTransport(archive, inner=httpx.MockTransport(live_site))
+    return ScraperOrchestrator(config, http=SharedHttpClient(config, transport=transport))
+
+
+class TestScrapeReplay:
+    @pytest.mark.asyncio
+    async def test_replay_matches_recording(self, tmp_path):
+        path = tmp_path / "archive.jsonl.gz"
+        urls = ["https://acme.com/careers", "https://acme.com/missing", "https://acme.com/down"]
+
+        recorder = recording_orchestrator(HttpArchive(path, "record"))
+        recorded = await recorder.scrape_batch(urls)
+        await recorder.aclose()
+
+        config = ScraperConfig(
+            respect_robots_txt=False,
+            circuit_failure_threshold=0,
+            http_archive_mode="replay",
+            http_archive_path=str(path),
+        )
+        replayer = ScraperOrchestrator(config)
+        replayed = await replayer.scrape_batch(urls)
+        await replayer.aclose()
+
+        assert [r.success for r in replayed] == [r.success for r in recorded] == [True, False, False]
+        assert replayed[0].extracted_text == recorded[0].extracted_text
+        assert replayed[0].metadata["etag"] == '"v1"'
+        assert replayed[1].metadata["status_code"] == 404
+        assert replayed[2].metadata["error_kind"] == "timeout"
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_url_fails_like_unreachable_host(self, tmp_path):
+        path = tmp_path / "archive.jsonl.gz"
+        HttpArchive(path, "record").record_http("GET", "https://acme.com/", 200, body=b"<html></html>")
+
+        archive = HttpArchive(path, "replay")
+        transport = ArchiveTransport(archive)
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("https://acme.com/other")
+        assert archive.misses == 1
+
+    def test_archive_mode_leaves_browser_out(self):
+        config = ScraperConfig(adaptive_escalation=True, http_archive_mode="replay", http_archive_path="unused")
+        orchestrator = ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(live_site)))
+        assert orchestrator.tiers is None
+        assert not any(isinstance(s, SeleniumScraper) for s in orchestrator.strategies)
+
+
+def test_repeated_requests_replay_in_order(tmp_path):
+    path = tmp_path / "archive.jsonl.gz"
+    recorder = HttpArchive(path, "record")
+    recorder.record_http("HEAD", "https://ai.acme.com", 503)
+    recorder.record_http("HEAD", "https://ai.acme.com", 200)
+
+    archive = HttpArchive(path, "replay")
+    statuses = [archive.lookup(("http", "HEAD", "https://ai.acme.com"))["status"] for _ in range(3)]
+    assert statuses == [503, 200, 200]
+
+
+def test_unknown_mode_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        HttpArchive(tmp_path / "a.gz", "live")
+
+
+class TestDiscoveryReplay:
+    def test_probes_and_searches_replay_offline(self, tmp_path):
+        path = tmp_path / "archive.jsonl.gz"
+        hits = [SimpleNamespace(url="https://acme.com/blog", title="Acme Engineering", description="ML at Acme")]
+
+        def site(request):
+            return httpx.Response(200 if request.url.host == "ai.acme.com" else 404)
+
+        def offline(request):
+            raise AssertionError("live probe")
+
+        recorder = DiscoveryService(archive=HttpArchive(path, "record"), transport=httpx.MockTransport(site))
+        with patch("app.services.discovery.search", return_value=hits):
+            subdomains = recorder.discover_subdomains("Acme", "acme.com")
+            blog = recorder._search_engineering_blog("Acme", "acme.com")
+
+        replayer = DiscoveryService(archive=HttpArchive(path, "replay"), transport=httpx.MockTransport(offline))
+        with patch("app.services.discovery.search", side_effect=AssertionError("live search")):
+            assert replayer.discover_subdomains("Acme", "acme.com") == subdomains == [
+                {"url": "https://ai.acme.com", "type": "subdomain_ai"}
+            ]
+            assert replayer._search_engineering_blog("Acme", "acme.com") == blog == "https://acme.com/blog"
+            assert replayer.collected_snippets == recorder.collected_snippets
+
+    def test_recorded_rate_limit_replays(self, tmp_path):
+        path = tmp_path / "archive.jsonl.gz"
+        recorder = DiscoveryService(archive=HttpArchive(path, "record"))
+        with patch("app.services.discovery.search", side_effect=Exception("429 Too Many Requests")):
+            recorder._search_github_org("Acme")
+
+        replayer = DiscoveryService(archive=HttpArchive(path, "replay"))
+        assert replayer._search_github_org("Acme") is None
+        assert replayer.search_failed
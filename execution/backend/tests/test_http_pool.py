@@ -0,0 +1,118 @@
+"""Tests for the shared, pooled HTTP client used by the scrapers."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.scrapers import (
+    GenericHtmlScraper,
+    ScraperConfig,
+    ScraperOrchestrator,
+    SharedHttpClient,
+)
+from app.services.scrapers.http_client import HostLimiter
+
+
+def _html_transport(calls: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(
+            200,
+            html="<html><head><title>Jobs</title></head><body><p>Hiring ML engineers</p></body></html>",
+        )
+    return httpx.MockTransport(handler)
+
+
+class TestSharedHttpClient:
+    """Tests for SharedHttpClient lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_within_loop(self):
+        http = SharedHttpClient(ScraperConfig())
+        first = http.client
+        assert http.client is first
+        await http.aclose()
+        assert first.is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_recreated_after_close(self):
+        http = SharedHttpClient(ScraperConfig())
+        first = http.client
+        await http.aclose()
+        assert http.client is not first
+        await http.aclose()
+
+    def test_client_recreated_for_new_event_loop(self):
+        http = SharedHttpClient(ScraperConfig())
+
+        async def get_client():
+            return http.client
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_aclose_is_idempotent(self):
+        http = SharedHttpClient(ScraperConfig())
+        await http.aclose()
+        http.client
+        await http.aclose()
+        await http.aclose()
+
+
+class TestHostLimiter:
+    """Tests for per-host concurrency caps."""
+
+    @pytest.mark.asyncio
+    async def test_same_host_shares_slot(self):
+        limiter = HostLimiter(per_host=2)
+        assert limiter.slot("https://a.com/x") is limiter.slot("https://A.com/y")
+        assert limiter.slot("https://a.com/x") is not limiter.slot("https://b.com/x")
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrency_per_host(self):
+        limiter = HostLimiter(per_host=2)
+        active = 0
+        peak = 0
+
+        async def fetch():
+            nonlocal active, peak
+            async with limiter.slot("https://a.com/page"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*[fetch() for _ in range(6)])
+        assert peak == 2
+
+
+class TestPooledScraping:
+    """GenericHtmlScraper and orchestrator should share one client."""
+
+    @pytest.mark.asyncio
+    async def test_generic_scraper_uses_shared_client(self):
+        calls = []
+        http = SharedHttpClient(ScraperConfig(), transport=_html_transport(calls))
+        client = http.client
+
+        scraper = GenericHtmlScraper(ScraperConfig(), http=http)
+        results = await asyncio.gather(*[
+            scraper.scrape(f"https://example.com/jobs/{i}") for i in range(5)
+        ])
+
+        assert all(r.success for r in results)
+        assert results[0].title == "Jobs"
+        assert len(calls) == 5
+        assert http.client is client  # Never replaced during the run
+        await http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_owns_and_closes_client(self):
+        async with ScraperOrchestrator() as orchestrator:
+            generic = orchestrator._select_strategy("https://example.com/careers")
+            assert generic.http is orchestrator.http
+            client = orchestrator.http.client
+        assert client.is_closed
@@ -0,0 +1,154 @@
+"""Tests for conditional-GET rescoring driven by CompanySource validators."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.company import CompanySource, Score
+from app.services.scoring_service import ScoringService
+from app.services.scrapers import ScraperConfig, ScraperOrchestrator, ScraperResult, ScraperStrategy, SharedHttpClient
+
+URLS = [
+    "https://acme.com/blog/ml-platform",
+    "https://acme.com/blog/llm-agents",
+    "https://github.com/acme",
+]
+
+
+class VersionedSite:
+    """MockTransport handler serving one ETag'd page per path, honouring If-None-Match."""
+
+    def __init__(self):
+        self.versions = {url: 1 for url in URLS}
+        self.requests: list[httpx.Request] = []
+        self.bodies_sent = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        url = str(request.url)
+        etag = f'"v{self.versions[url]}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        self.bodies_sent += 1
+        body = (
+            f"<html><head><title>{url}</title></head><body>"
+            f"<p>Version {self.versions[url]}: we deploy machine learning models with PyTorch.</p>"
+            "</body></html>"
+        )
+        return httpx.Response(200, text=body, headers={"Content-Type": "text/html", "ETag": etag})
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def site():
+    return VersionedSite()
+
+
+@pytest.fixture
+def service(db_session, site, tmp_path, monkeypatch):
+    monkeypatch.setattr("app.core.config.settings.SNAPSHOT_DIR", str(tmp_path))
+    config = ScraperConfig(respect_robots_txt=False)
+    service = ScoringService(db_session)
+    service.scraper = ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+    return service
+
+
+class TestConditionalScrape:
+    @pytest.mark.asyncio
+    async def test_stored_validators_give_bodiless_304(self, site):
+        config = ScraperConfig(respect_robots_txt=False)
+        orchestrator = ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+
+        result = await orchestrator.scrape(URLS[0], validators={"etag": '"v1"'})
+
+        assert site.requests[-1].headers["if-none-match"] == '"v1"'
+        assert result.success and result.not_modified
+        assert result.extracted_text is None
+        assert orchestrator.stats["not_modified"] == 1
+        await orchestrator.aclose()
+
+
+class TestIncrementalRescore:
+    @pytest.mark.asyncio
+    async def test_first_rescore_stores_validators(self, service, db_session):
+        await service.manual_rescore("Acme", "https://acme.com", evidence_urls=URLS)
+
+        sources = db_session.execute(select(CompanySource)).scalars().all()
+        assert {s.url for s in sources} == set(URLS)
+        assert all(s.etag == '"v1"' and len(s.content_hash) == 64 for s in sources)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sources_rescored_without_refetching(self, service, site, db_session):
+        first = await service.manual_rescore("Acme", "https://acme.com", evidence_urls=URLS)
+        site.bodies_sent = 0
+
+        with patch.object(service, "_extract_signals_heuristically", wraps=service._extract_signals_heuristically) as extract:
+            second = await service.manual_rescore("Acme", "https://acme.com")
+
+        assert site.bodies_sent == 0  # Every source answered 304
+        # Extraction reran on the stored text, so lexicon or weight changes would apply
+        [segments], _ = extract.call_args
+        assert "Version 1: we deploy machine learning models" in "\n".join(segments.values())
+        assert second["sources_unchanged"] == len(URLS)
+        assert second["score"] == first["score"]
+        assert {r["status"] for r in second["scrape_results"]} == {"unchanged"}
+        assert len(db_session.execute(select(Score)).scalars().all()) == 2
+
+    @pytest.mark.asyncio
+    async def test_changed_source_triggers_full_rescore(self, service, site, db_session):
+        await service.manual_rescore("Acme", "https://acme.com", evidence_urls=URLS)
+        site.versions[URLS[0]] = 2
+        site.bodies_sent = 0
+
+        result = await service.manual_rescore("Acme", "https://acme.com")
+
+        # Only the changed page; the 304'd pages reuse the text from the last score's snapshot
+        assert site.bodies_sent == 1
+        assert result["sources_unchanged"] == len(URLS) - 1
+        statuses = {r["url"]: r["status"] for r in result["scrape_results"]}
+        assert statuses[URLS[0]] == "success"
+        assert len(db_session.execute(select(Score)).scalars().all()) == 2
+
+        source = db_session.execute(select(CompanySource).where(CompanySource.url == URLS[0])).scalar_one()
+        assert source.etag == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_304s_refetched_without_a_snapshot(self, service, site, db_session, monkeypatch):
+        await service.manual_rescore("Acme", "https://acme.com", evidence_urls=URLS)
+        monkeypatch.setattr("app.core.config.settings.SNAPSHOT_DIR", "")
+        site.versions[URLS[0]] = 2
+        site.bodies_sent = 0
+
+        result = await service.manual_rescore("Acme", "https://acme.com")
+
+        assert site.bodies_sent == len(URLS)  # No stored text to reuse
+        assert {r["status"] for r in result["scrape_results"]} <= {"success", "unchanged"}
+
+
+def test_overlong_validators_not_stored():
+    source = CompanySource(url=URLS[0], etag='"old"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+    result = ScraperResult(
+        url=URLS[0],
+        success=True,
+        strategy_used=ScraperStrategy.GENERIC_HTML,
+        extracted_text="page",
+        metadata={"etag": '"' + "x" * 300 + '"', "last_modified": "Tue, 02 Jan 2024 00:00:00 GMT"},
+    )
+
+    ScoringService._record_source_validators(source, result)
+
+    assert source.etag is None  # Doesn't fit String(255); the page is refetched in full next time
+    assert source.last_modified == "Tue, 02 Jan 2024 00:00:00 GMT"
@@ -0,0 +1,137 @@
+"""Tests for lean scrape results (raw_html released after parsing)."""
+
+import gc
+import tracemalloc
+from unittest.mock import patch
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.services.scoring_service import ScoringService
+from app.services.scrapers import (
+    ScraperConfig,
+    ScraperOrchestrator,
+    ScraperResult,
+    ScraperStrategy,
+    SharedHttpClient,
+)
+
+PARAGRAPH = "<p>We ship machine learning features with PyTorch and evaluate LLM agents weekly.</p>\n"
+SATELLITES = 24
+SUBDOMAINS = 3
+
+
+def page(title: str, size_kb: int = 20, links: str = "") -> str:
+    repeats = size_kb * 1024 // len(PARAGRAPH)
+    return f"<html><head><title>{title}</title></head><body>{links}{PARAGRAPH * repeats}</body></html>"
+
+
+HOMEPAGE = page(
+    "Acme",
+    links="".join(f'<a href="/careers/jobs/role-{i}">Open job {i}</a>' for i in range(8)),
+)
+
+
+def site(request: httpx.Request) -> httpx.Response:
+    body = HOMEPAGE if request.url.path == "/" else page(request.url.path)
+    return httpx.Response(200, text=body, headers={"Content-Type": "text/html"})
+
+
+def make_orchestrator(**overrides) -> ScraperOrchestrator:
+    config = ScraperConfig(respect_robots_txt=False, **overrides)
+    return ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+
+
+class TestReleaseHtml:
+    def test_release_keeps_document(self):
+        result = ScraperResult(
+            url="https://acme.com/",
+            success=True,
+            strategy_used=ScraperStrategy.GENERIC_HTML,
+            raw_html=HOMEPAGE,
+        )
+        result.release_html()
+
+        assert result.raw_html is None
+        assert result.html() is None
+        assert len(result.parsed_document().anchors) == 8
+
+    def test_compressed_copy(self):
+        result = ScraperResult(
+            url="https://acme.com/",
+            success=True,
+            strategy_used=ScraperStrategy.GENERIC_HTML,
+            raw_html=HOMEPAGE,
+        )
+        result.release_html(keep_compressed=True)
+
+        assert result.raw_html is None
+        assert len(result.raw_html_compressed) < len(HOMEPAGE) / 10
+        assert result.html() == HOMEPAGE
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_lean_mode(self):
+        orchestrator = make_orchestrator(lean_results=True)
+        result = await orchestrator.scrape("https://acme.com/")
+
+        assert result.raw_html is None
+        assert result.title == "Acme"
+        assert len(result.parsed_document().anchors) == 8
+        await orchestrator.aclose()
+
+
+async def retained_bytes(orchestrator: ScraperOrchestrator, urls: list[str]) -> int:
+    """Memory still held by a batch's results after the batch finishes."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = await orchestrator.scrape_batch(urls)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    assert all(r.success for r in results)
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+class TestMemory:
+    @pytest.mark.asyncio
+    async def test_lean_results_retain_less(self):
+        urls = [f"https://acme.com/page/{i}" for i in range(10)]
+        full = make_orchestrator()
+        lean = make_orchestrator(lean_results=True)
+
+        full_bytes = await retained_bytes(full, urls)
+        lean_bytes = await retained_bytes(lean, urls)
+
+        assert lean_bytes < full_bytes * 0.7
+        await full.aclose()
+        await lean.aclose()
+
+    @pytest.mark.asyncio
+    async def test_scoring_job_peak_memory(self):
+        """A ~30-page scoring job stays within a fixed peak-memory budget."""
+        engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+
+        service = ScoringService(db)
+        service.scraper = make_orchestrator(lean_results=True)
+        sources = [{"url": f"https://acme.com/blog/{i}", "type": "engineering_blog"} for i in range(SATELLITES)]
+        subdomains = [{"url": f"https://ai{i}.acme.com/", "type": "ai_subdomain"} for i in range(SUBDOMAINS)]
+
+        with patch("app.services.discovery.DiscoveryService.find_sources", return_value=sources), \
+                patch("app.services.discovery.DiscoveryService.discover_subdomains", return_value=subdomains):
+            gc.collect()
+            tracemalloc.start()
+            await service.score_company("https://acme.com/")
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        # ~33 pages x 20 KB fetched; only text + links are retained per page
+        assert peak < 24 * 1024 * 1024, f"peak {peak / 1e6:.1f} MB"
+        await service.scraper.aclose()
+        db.close()
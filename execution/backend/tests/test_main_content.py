@@ -0,0 +1,96 @@
+"""Tests for main-content text extraction."""
+
+import importlib.util
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.services.scrapers import ScraperConfig, ScraperOrchestrator, SharedHttpClient
+from app.services.scrapers.document import ParsedDocument
+
+PAGES = Path(__file__).parent / "fixtures" / "pages"
+BACKENDS = [
+    pytest.param(name, marks=pytest.mark.skipif(
+        name != "html.parser" and importlib.util.find_spec(name) is None, reason=f"{name} not installed",
+    ))
+    for name in ("html.parser", "lxml", "selectolax")
+]
+
+JOB = (
+    "We are hiring a senior machine learning engineer to build LLM agents, retrieval pipelines, "
+    "and evaluation tooling for our production platform. You will work with PyTorch, Kubernetes, "
+    "and our data team, shipping models that serve millions of requests, every day, across regions."
+)
+
+PAGE = f"""<html><head><title>Acme careers</title></head><body>
+<div class="cookie-banner"><p>We use cookies for analytics, personalised ads, and more. Accept all cookies?</p></div>
+<div class="mega-menu"><ul>
+  <li><a href="/platform">Platform overview and pricing</a></li>
+  <li><a href="/solutions">Solutions for enterprise teams</a></li>
+</ul></div>
+<div id="content"><h1>Senior ML Engineer</h1><p>{JOB}</p></div>
+<div class="site-footer"><p>Copyright Acme Inc. All rights reserved. Privacy, Terms, Imprint, Contact.</p></div>
+</body></html>"""
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_boilerplate_dropped(backend):
+    doc = ParsedDocument.from_html(PAGE, backend, "main")
+
+    assert doc.text == f"Senior ML Engineer {JOB}"
+    assert doc.full_text_bytes > doc.text_bytes
+    assert doc.anchors  # Links are still collected from boilerplate
+
+
+def test_full_mode_unchanged():
+    doc = ParsedDocument.from_html(PAGE, "html.parser")
+    assert "cookies" in doc.text and "Copyright" in doc.text
+    assert doc.full_text_bytes is None
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_main_landmark_kept_whole(backend):
+    html = (PAGES / "careers_static.html").read_text(encoding="utf-8")
+    doc = ParsedDocument.from_html(html, backend, "main")
+
+    # Short sections beside the best-scoring one still belong to <main>
+    assert "internal LLM tooling" in doc.text and "ML Engineer, Perception" in doc.text
+    assert "Careers | Acme Robotics" not in doc.text
+
+
+def test_page_without_main_block_keeps_full_text():
+    html = "<html><body><div class='menu'>Home</div><p>Jobs at Nimbus. Loading…</p></body></html>"
+    doc = ParsedDocument.from_html(html, "html.parser", "main")
+    assert doc.text == ParsedDocument.from_html(html, "html.parser").text
+    assert doc.full_text_bytes == doc.text_bytes
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        ParsedDocument.from_html(PAGE, "html.parser", "readability")
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_reports_bytes_saved(tmp_path):
+    def site(request):
+        return httpx.Response(200, text=PAGE, headers={"Content-Type": "text/html"})
+
+    def orchestrator(text_mode: str) -> ScraperOrchestrator:
+        config = ScraperConfig(cache_dir=str(tmp_path), respect_robots_txt=False, text_mode=text_mode)
+        return ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+
+    full = orchestrator("full")
+    await full.scrape("https://acme.com/careers")
+    assert "text_bytes_full" not in full.stats
+    await full.aclose()
+
+    main = orchestrator("main")
+    result = await main.scrape("https://acme.com/careers")
+
+    assert result.metadata.get("cache") is None  # Cached full-mode text isn't reused
+    assert result.extracted_text.startswith("Senior ML Engineer")
+    assert result.metadata["full_text_bytes"] > result.metadata["text_bytes"]
+    assert main.stats["text_bytes_full"] == result.metadata["full_text_bytes"]
+    assert main.stats["text_bytes_main"] == result.metadata["text_bytes"]
+    await main.aclose()
@@ -51,7 +51,7 @@ def test_circular_imports_regression():
     except ImportError as e:
         pytest.fail(f"Circular import error detected: {e}")
 
-@patch("app.services.scoring_service.ScraperOrchestrator.scrape", new_callable=AsyncMock)
+@patch("app.services.scrapers.orchestrator.ScraperOrchestrator.scrape", new_callable=AsyncMock)
 def test_on_demand_scoring_flow(mock_scrape):
     """
     Test the full flow:
@@ -0,0 +1,96 @@
+"""Tests for single-parse ParsedDocument reuse."""
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from app.services.scoring_service import ScoringService
+from app.services.scrapers import ATSDetector, GenericHtmlScraper, ScraperConfig, SharedHttpClient
+from app.services.scrapers import document as document_module
+from app.services.scrapers.document import Anchor, ParsedDocument
+
+CAREERS_HTML = """
+<html>
+<head><title> Careers at Acme </title><style>.x{}</style></head>
+<body>
+  <nav><a href="/careers/engineering">Engineering</a></nav>
+  <h1>Open roles</h1>
+  <p>We build   AI   products.</p>
+  <a href="/job/ml-engineer">ML <b>Engineer</b></a>
+  <a href="https://jobs.lever.co/acme">All jobs</a>
+  <iframe src="https://boards.greenhouse.io/embed/job_board?for=acme"></iframe>
+  <script>var tracking = 1;</script>
+  <footer><a href="/privacy">Privacy</a></footer>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def count_parses():
+    """Count BeautifulSoup constructions made through the document module."""
+    real = document_module.BeautifulSoup
+    calls = []
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return real(*args, **kwargs)
+
+    with patch.object(document_module, "BeautifulSoup", side_effect=counting):
+        yield calls
+
+
+class TestParsedDocument:
+    def test_extracts_everything_in_one_pass(self, count_parses):
+        doc = ParsedDocument.from_html(CAREERS_HTML)
+
+        assert len(count_parses) == 1
+        assert doc.title == "Careers at Acme"
+        assert doc.text == "Careers at Acme Open roles We build AI products. ML Engineer All jobs"
+        assert Anchor(href="/job/ml-engineer", text="ML Engineer") in doc.anchors
+        assert "/careers/engineering" in [a.href for a in doc.anchors]  # Nav links kept for crawling
+        assert doc.iframes == ["https://boards.greenhouse.io/embed/job_board?for=acme"]
+
+    def test_empty_html(self):
+        doc = ParsedDocument.from_html("")
+        assert doc.text == ""
+        assert doc.anchors == []
+
+
+class TestSingleParsePipeline:
+    @pytest.mark.asyncio
+    async def test_scrape_then_link_finding_parses_once(self, count_parses):
+        def handler(request):
+            return httpx.Response(200, text=CAREERS_HTML, headers={"Content-Type": "text/html"})
+
+        http = SharedHttpClient(ScraperConfig(), transport=httpx.MockTransport(handler))
+        result = await GenericHtmlScraper(ScraperConfig(), http=http).scrape("https://acme.com/careers")
+
+        document = result.parsed_document()
+        ats_links = ATSDetector().extract_ats_links(document)
+        job_links = ScoringService(db=MagicMock())._find_job_links(document, "https://acme.com/careers")
+
+        assert len(count_parses) == 1
+        assert result.title == "Careers at Acme"
+        assert "https://jobs.lever.co/acme" in ats_links
+        assert "https://acme.com/job/ml-engineer" in job_links
+        await http.aclose()
+
+    def test_html_and_document_inputs_agree(self):
+        service = ScoringService(db=MagicMock())
+        from_html = service._find_job_links(CAREERS_HTML, "https://acme.com/")
+        from_doc = service._find_job_links(ParsedDocument.from_html(CAREERS_HTML), "https://acme.com/")
+        assert sorted(from_html) == sorted(from_doc)
+
+    def test_lazy_document_for_results_without_one(self, count_parses):
+        from app.services.scrapers import ScraperResult, ScraperStrategy
+
+        result = ScraperResult(
+            url="https://acme.com/",
+            success=True,
+            strategy_used=ScraperStrategy.GENERIC_HTML,
+            raw_html=CAREERS_HTML,
+        )
+        assert result.parsed_document() is result.parsed_document()
+        assert len(count_parses) == 1
@@ -0,0 +1,80 @@
+"""Tests for headless render resource blocking."""
+
+import re
+
+import pytest
+
+from app.services.scrapers import RenderProfile, ScraperConfig, SeleniumScraper
+
+
+class CdpDriver:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if self.fail:
+            raise AttributeError("no CDP on this driver")
+        self.commands.append((cmd, params))
+
+
+def cdp_blocks(patterns: list[str], url: str) -> bool:
+    """Network.setBlockedURLs matching: `*` is the only wildcard and the whole URL must match."""
+    return any(re.fullmatch(".*".join(map(re.escape, p.split("*"))), url) for p in patterns)
+
+
+class TestRenderProfile:
+    def test_scoring_is_the_default(self):
+        profile = ScraperConfig().render_profile
+        assert profile.name == "scoring"
+        patterns = profile.blocked_url_patterns()
+        for expected in ("*.png", "*.woff2", "*.mp4", "*.css", "*google-analytics.com*"):
+            assert expected in patterns
+        assert profile.chrome_prefs()["profile.managed_default_content_settings.images"] == 2
+
+    @pytest.mark.parametrize("url", [
+        "https://acme.com/static/app.css",
+        "https://acme.com/static/app.css?v=3",
+        "https://cdn.acme.com/logo.png?w=200&h=80",
+        "https://acme.com/fonts/inter.woff2?display=swap",
+    ])
+    def test_versioned_assets_blocked(self, url):
+        assert cdp_blocks(RenderProfile.scoring().blocked_url_patterns(), url)
+
+    def test_pages_not_blocked(self):
+        patterns = RenderProfile.scoring().blocked_url_patterns()
+        assert not cdp_blocks(patterns, "https://acme.com/careers?team=css")
+        assert not cdp_blocks(patterns, "https://acme.com/jobs/42")
+
+    def test_debug_blocks_nothing(self):
+        profile = RenderProfile.named("debug")
+        assert profile.blocked_url_patterns() == []
+        assert profile.chrome_prefs() == {}
+
+    def test_selective_blocking(self):
+        profile = RenderProfile(block_stylesheets=False, blocked_hosts=["tracker.example"])
+        patterns = profile.blocked_url_patterns()
+        assert "*.css" not in patterns
+        assert "*tracker.example*" in patterns
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError):
+            RenderProfile.named("fast")
+
+
+class TestDriverBlocking:
+    def test_patterns_sent_over_devtools(self):
+        driver = CdpDriver()
+        SeleniumScraper._block_resources(driver, ["*.png"])
+        assert driver.commands == [
+            ("Network.enable", {}),
+            ("Network.setBlockedURLs", {"urls": ["*.png"]}),
+        ]
+
+    def test_nothing_sent_for_empty_profile(self):
+        driver = CdpDriver()
+        SeleniumScraper._block_resources(driver, RenderProfile.debug().blocked_url_patterns())
+        assert driver.commands == []
+
+    def test_missing_devtools_is_not_fatal(self):
+        SeleniumScraper._block_resources(CdpDriver(fail=True), ["*.png"])
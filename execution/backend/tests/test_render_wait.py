@@ -0,0 +1,90 @@
+"""Tests for the Selenium render readiness wait."""
+
+from app.services.scrapers import ScraperConfig
+from app.services.scrapers.render_wait import ready_selectors_for, wait_until_rendered
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakePage:
+    """
+    execute_script stand-in: the DOM mutates until `settles_at` seconds and
+    the ready selector appears at `selector_at` (None = never).
+    """
+
+    def __init__(self, clock: FakeClock, settles_at: float = 0.0, selector_at=None, observer=True):
+        self.clock = clock
+        self.settles_at = settles_at
+        self.selector_at = selector_at
+        self.observer = observer
+        self.polled_selectors = None
+
+    def execute_script(self, script, *args):
+        if not args:  # Observer install
+            if not self.observer:
+                raise RuntimeError("javascript error")
+            return None
+        self.polled_selectors = args[0]
+        if self.selector_at is not None and self.clock.now >= self.selector_at and args[0]:
+            return ["selector", 0, "complete"]
+        if not self.observer:
+            return ["poll", -1, "complete"]
+        last_mutation = min(self.clock.now, self.settles_at)
+        return ["poll", (self.clock.now - last_mutation) * 1000, "complete"]
+
+
+def wait(page: FakePage, clock: FakeClock, url: str = "https://acme.com/careers", **overrides):
+    config = ScraperConfig(**overrides)
+    return wait_until_rendered(page, url, config, clock=clock, sleep=clock.sleep)
+
+
+class TestWaitUntilRendered:
+    def test_static_page_returns_after_quiet_window(self):
+        clock = FakeClock()
+        result = wait(FakePage(clock, settles_at=0.0), clock, render_quiet_ms=500)
+
+        assert result.outcome == "stable"
+        assert 500 <= result.waited_ms < 700  # Far below the old fixed 2 s sleep
+
+    def test_waits_for_late_mutations(self):
+        clock = FakeClock()
+        result = wait(FakePage(clock, settles_at=3.0), clock, render_quiet_ms=500)
+
+        assert result.outcome == "stable"
+        assert result.waited_ms >= 3500
+
+    def test_ready_selector_short_circuits(self):
+        clock = FakeClock()
+        page = FakePage(clock, settles_at=10.0, selector_at=0.3)
+        result = wait(page, clock, url="https://acme.wd5.myworkdayjobs.com/careers")
+
+        assert result.outcome == "selector"
+        assert result.waited_ms <= 400
+        assert '[data-automation-id="jobTitle"]' in page.polled_selectors
+
+    def test_hard_cap(self):
+        clock = FakeClock()
+        result = wait(FakePage(clock, settles_at=60.0), clock, render_max_wait_ms=2000)
+
+        assert result.outcome == "timeout"
+        assert 2000 <= result.waited_ms < 2200
+
+    def test_no_observer_falls_back_to_cap(self):
+        clock = FakeClock()
+        result = wait(FakePage(clock, observer=False), clock, render_max_wait_ms=1000)
+        assert result.outcome == "timeout"
+
+
+def test_config_selectors_extend_builtins():
+    config = ScraperConfig(render_ready_selectors={"careers.acme.com": [".job-card"]})
+    assert ready_selectors_for("https://careers.acme.com/", config) == [".job-card"]
+    assert ready_selectors_for("https://jobs.lever.co/acme", config) == [".posting", ".posting-headline"]
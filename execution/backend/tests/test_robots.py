@@ -0,0 +1,194 @@
+"""Tests for robots.txt enforcement and Crawl-delay pacing."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services.scrapers import ScraperConfig, ScraperOrchestrator, ScraperResult, ScraperStrategy, SharedHttpClient
+from app.services.scrapers import robots as robots_module
+from app.services.scrapers.robots import HostPacer, RobotsCache, TokenBucket
+
+ROBOTS = """
+User-agent: *
+Disallow: /private/
+Crawl-delay: 0.1
+
+User-agent: BadBot
+Disallow: /
+"""
+
+
+class FakeSite:
+    """Serves a robots.txt per host and a small page for everything else."""
+
+    def __init__(self, robots: dict[str, tuple[int, str]]):
+        self.robots = robots
+        self.requests: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(str(request.url))
+        if request.url.path == "/robots.txt":
+            status, body = self.robots.get(request.url.host, (404, ""))
+            return httpx.Response(status, text=body)
+        return httpx.Response(200, text="<html><title>Jobs</title><body>Open roles</body></html>")
+
+    def page_requests(self) -> list[str]:
+        return [u for u in self.requests if not u.endswith("/robots.txt")]
+
+    def robots_requests(self) -> list[str]:
+        return [u for u in self.requests if u.endswith("/robots.txt")]
+
+
+def make_orchestrator(site: FakeSite, **overrides) -> ScraperOrchestrator:
+    config = ScraperConfig(**overrides)
+    return ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+
+
+class TestRobotsCache:
+    @pytest.mark.asyncio
+    async def test_rules_parsed_and_fetched_once(self):
+        site = FakeSite({"acme.com": (200, ROBOTS)})
+        config = ScraperConfig()
+        robots = RobotsCache(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+
+        rules = await robots.rules_for("https://acme.com/jobs")
+        await asyncio.gather(*[robots.rules_for(f"https://acme.com/p/{i}") for i in range(5)])
+
+        assert rules.allows("https://acme.com/jobs", config.user_agent)
+        assert not rules.allows("https://acme.com/private/x", config.user_agent)
+        assert not rules.allows("https://acme.com/jobs", "BadBot/1.0")
+        assert rules.crawl_delay(config.user_agent) == 0.1
+        assert len(site.robots_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_and_erroring_robots_allow_everything(self):
+        site = FakeSite({"down.com": (503, "")})
+        config = ScraperConfig()
+        robots = RobotsCache(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+
+        assert (await robots.rules_for("https://none.com/")).allows("https://none.com/x", "x")
+        assert (await robots.rules_for("https://down.com/")).allows("https://down.com/x", "x")
+
+    @pytest.mark.asyncio
+    async def test_unreadable_robots_allow_everything(self, monkeypatch):
+        def handler(request):
+            if request.url.host == "broken.com":
+                raise ValueError("malformed response")
+            return httpx.Response(200, text=ROBOTS)
+
+        config = ScraperConfig()
+        robots = RobotsCache(config, http=SharedHttpClient(config, transport=httpx.MockTransport(handler)))
+        monkeypatch.setattr(robots_module, "_parse_crawl_delays", lambda lines: 1 / 0)
+
+        for origin in ("https://broken.com", "https://acme.com"):
+            rules = await robots.rules_for(f"{origin}/")
+            assert rules.status == 0
+            assert rules.allows(f"{origin}/private/x", config.user_agent)
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_shared_between_instances(self, tmp_path):
+        site = FakeSite({"acme.com": (200, ROBOTS)})
+        config = ScraperConfig(cache_dir=str(tmp_path))
+        transport = httpx.MockTransport(site)
+
+        await RobotsCache(config, http=SharedHttpClient(config, transport=transport)).rules_for("https://acme.com/")
+        rules = await RobotsCache(config, http=SharedHttpClient(config, transport=transport)).rules_for("https://acme.com/")
+
+        assert not rules.allows("https://acme.com/private/", config.user_agent)
+        assert len(site.robots_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_bounded(self):
+        site = FakeSite({})
+        config = ScraperConfig(robots_memory_entries=2)
+        robots = RobotsCache(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+
+        for host in ("a.com", "b.com", "c.com"):
+            await robots.rules_for(f"https://{host}/")
+
+        assert list(robots._memory) == ["https://b.com", "https://c.com"]
+
+
+class TestPacing:
+    def test_token_bucket_spaces_reservations(self):
+        bucket = TokenBucket(rate=10)  # One request per 100 ms
+        waits = [bucket.reserve() for _ in range(3)]
+        assert waits[0] == 0
+        assert waits[1] == pytest.approx(0.1, abs=0.01)
+        assert waits[2] == pytest.approx(0.2, abs=0.01)
+
+    def test_hosts_paced_independently(self):
+        pacer = HostPacer()
+        pacer.reserve("https://a.com/1", 1.0)
+        assert pacer.reserve("https://a.com/2", 1.0) > 0.9
+        assert pacer.reserve("https://b.com/1", 1.0) == 0
+        assert pacer.reserve("https://c.com/1", 0) == 0
+
+
+class TestOrchestratorRobots:
+    @pytest.mark.asyncio
+    async def test_disallowed_url_skipped_before_fetch(self):
+        site = FakeSite({"acme.com": (200, ROBOTS)})
+        orchestrator = make_orchestrator(site)
+
+        result = await orchestrator.scrape("https://acme.com/private/roles")
+
+        assert result.success is False
+        assert result.metadata["robots"] == "disallowed"
+        assert site.page_requests() == []
+        assert orchestrator.stats["robots_disallowed"] == 1
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_robots_fetch(self, tmp_path):
+        site = FakeSite({"acme.com": (200, ROBOTS)})
+        orchestrator = make_orchestrator(site, cache_dir=str(tmp_path))
+        for _ in range(orchestrator.breaker.threshold):
+            orchestrator.breaker.record("https://acme.com/", ScraperResult(
+                url="https://acme.com/", success=False, strategy_used=ScraperStrategy.GENERIC_HTML,
+                metadata={"error_kind": "timeout"},
+            ))
+
+        result = await orchestrator.scrape("https://acme.com/jobs")
+
+        assert result.metadata["circuit"] == "open"
+        assert site.requests == []
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_crawl_delay_paces_same_host(self):
+        site = FakeSite({"acme.com": (200, ROBOTS)})
+        orchestrator = make_orchestrator(site)
+
+        start = time.monotonic()
+        results = await orchestrator.scrape_batch([f"https://acme.com/jobs/{i}" for i in range(3)])
+        elapsed = time.monotonic() - start
+
+        assert all(r.success for r in results)
+        assert elapsed >= 0.19  # Two 100 ms gaps
+        assert orchestrator.stats["robots_paced"] == 2
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_crawl_delay_clamped(self):
+        site = FakeSite({"slow.com": (200, "User-agent: *\nCrawl-delay: 120\n")})
+        orchestrator = make_orchestrator(site, max_crawl_delay_seconds=0.05)
+
+        start = time.monotonic()
+        await orchestrator.scrape_batch(["https://slow.com/a", "https://slow.com/b"])
+
+        assert time.monotonic() - start < 1
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_config(self):
+        site = FakeSite({"acme.com": (200, ROBOTS)})
+        orchestrator = make_orchestrator(site, respect_robots_txt=False)
+
+        result = await orchestrator.scrape("https://acme.com/private/roles")
+
+        assert result.success is True
+        assert site.robots_requests() == []
+        await orchestrator.aclose()
@@ -6,6 +6,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from app.core.database import Base
 from app.services.scoring_service import ScoringService
+from app.services.scrapers import ScraperResult, ScraperStrategy
 from app.models.company import Company
 
 # Setup in-memory DB
@@ -34,11 +35,18 @@ async def test_scoring_populates_trace():
         service.calculator = MagicMock()
         
         # Mock Scraper Results
-        mock_result = AsyncMock()
-        mock_result.success = True
-        mock_result.raw_html = "<html><body><p>AI Company</p></body></html>"
-        mock_result.extracted_text = "AI Company working on LLMs."
+        mock_result = ScraperResult(
+            url="https://trace-test.com",
+            success=True,
+            strategy_used=ScraperStrategy.GENERIC_HTML,
+            raw_html="<html><body><p>AI Company</p></body></html>",
+            extracted_text="AI Company working on LLMs.",
+        )
         service.scraper.scrape.return_value = mock_result
+        async def scrape_stream(urls):
+            for i, _ in enumerate(urls):
+                yield i, mock_result
+        service.scraper.scrape_stream = scrape_stream
         
         # Mock Calculator
         mock_score = MagicMock()
@@ -72,6 +80,7 @@ async def test_scoring_populates_trace():
         assert "Starting scoring" in step_names
         assert "DiscoveryService: Finding sources" in step_names
         assert "Scoring Complete" in step_names
+        assert "Deadline budget" in step_names
 
     finally:
         db_session.close()
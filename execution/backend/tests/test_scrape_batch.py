@@ -0,0 +1,157 @@
+"""Tests for concurrent batch scraping (scrape_stream / scrape_batch)."""
+
+import asyncio
+from collections import Counter
+from urllib.parse import urlparse
+
+import pytest
+
+from app.services.scrapers import ScraperConfig, ScraperOrchestrator, ScraperResult, ScraperStrategy
+
+
+class ConcurrencyProbe:
+    """Stand-in for a strategy's scrape() that records parallelism."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.active_per_host: Counter = Counter()
+        self.peak_per_host: Counter = Counter()
+        self.started: list[str] = []
+
+    async def __call__(self, url, headers=None):
+        host = urlparse(url).hostname
+        self.started.append(url)
+        self.active += 1
+        self.active_per_host[host] += 1
+        self.peak = max(self.peak, self.active)
+        self.peak_per_host[host] = max(self.peak_per_host[host], self.active_per_host[host])
+        try:
+            await asyncio.sleep(self.delay)
+            if "boom" in url:
+                raise RuntimeError("driver crashed")
+            return ScraperResult(url=url, success=True, strategy_used=ScraperStrategy.GENERIC_HTML)
+        finally:
+            self.active -= 1
+            self.active_per_host[host] -= 1
+
+
+def make_orchestrator(probe: ConcurrencyProbe, **overrides) -> ScraperOrchestrator:
+    orchestrator = ScraperOrchestrator(ScraperConfig(respect_robots_txt=False, **overrides))
+    for strategy in orchestrator.strategies:
+        strategy.scrape = probe
+    return orchestrator
+
+
+class TestScrapeBatch:
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self):
+        probe = ConcurrencyProbe()
+        orchestrator = make_orchestrator(probe)
+        urls = [f"https://site{i}.com/jobs" for i in range(12)]
+
+        results = await orchestrator.scrape_batch(urls)
+
+        assert [r.url for r in results] == urls
+        assert probe.peak > 1  # Actually concurrent
+
+    @pytest.mark.asyncio
+    async def test_global_and_per_host_limits(self):
+        probe = ConcurrencyProbe()
+        orchestrator = make_orchestrator(probe, max_concurrent_scrapes=4, max_concurrent_scrapes_per_host=2)
+        urls = [f"https://big.com/jobs/{i}" for i in range(8)]
+        urls += [f"https://site{i}.com/" for i in range(8)]
+
+        await orchestrator.scrape_batch(urls)
+
+        assert probe.peak == 4
+        assert probe.peak_per_host["big.com"] == 2
+
+    @pytest.mark.asyncio
+    async def test_limit_shared_across_concurrent_batches(self):
+        probe = ConcurrencyProbe()
+        orchestrator = make_orchestrator(probe, max_concurrent_scrapes=3)
+
+        await asyncio.gather(
+            orchestrator.scrape_batch([f"https://a{i}.com/" for i in range(6)]),
+            orchestrator.scrape_batch([f"https://b{i}.com/" for i in range(6)]),
+        )
+
+        assert probe.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_single_scrapes_share_global_limit(self):
+        probe = ConcurrencyProbe()
+        orchestrator = make_orchestrator(probe, max_concurrent_scrapes=2)
+
+        await asyncio.gather(*[orchestrator.scrape(f"https://site{i}.com/") for i in range(6)])
+
+        assert probe.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_become_failed_results(self):
+        orchestrator = make_orchestrator(ConcurrencyProbe())
+
+        results = await orchestrator.scrape_batch(["https://ok.com/", "https://boom.com/"])
+
+        assert results[0].success is True
+        assert results[1].success is False
+        assert "driver crashed" in results[1].error_message
+
+
+class TestScrapeStream:
+    @pytest.mark.asyncio
+    async def test_yields_as_completed(self):
+        probe = ConcurrencyProbe()
+        orchestrator = make_orchestrator(probe)
+
+        async def slow_first(url, headers=None):
+            await asyncio.sleep(0.05 if "slow" in url else 0)
+            return ScraperResult(url=url, success=True, strategy_used=ScraperStrategy.GENERIC_HTML)
+
+        for strategy in orchestrator.strategies:
+            strategy.scrape = slow_first
+        order = [i async for i, _ in orchestrator.scrape_stream(["https://slow.com/", "https://fast.com/"])]
+
+        assert order == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_backpressure_bounds_work_ahead_of_consumer(self):
+        probe = ConcurrencyProbe(delay=0)
+        orchestrator = make_orchestrator(probe, max_concurrent_scrapes=2, batch_queue_size=2)
+        urls = [f"https://site{i}.com/" for i in range(50)]
+
+        stream = orchestrator.scrape_stream(urls)
+        await stream.__anext__()
+        await asyncio.sleep(0.05)  # Consumer stalls
+
+        # Bounded by result queue + in-flight workers, not the whole batch
+        assert len(probe.started) <= 2 + 2 + 2
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_consumes_lazy_iterables(self):
+        orchestrator = make_orchestrator(ConcurrencyProbe(delay=0))
+        urls = (f"https://site{i}.com/" for i in range(5))
+
+        seen = sorted([i async for i, _ in orchestrator.scrape_stream(urls)])
+
+        assert seen == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_stream_finishes_when_a_worker_dies(self):
+        orchestrator = make_orchestrator(ConcurrencyProbe(), max_concurrent_scrapes=2)
+
+        async def dies(url, headers=None):
+            if "dies" in url:
+                raise asyncio.CancelledError()
+            return ScraperResult(url=url, success=True, strategy_used=ScraperStrategy.GENERIC_HTML)
+
+        for strategy in orchestrator.strategies:
+            strategy.scrape = dies
+
+        async def consume():
+            return [i async for i, _ in orchestrator.scrape_stream(["https://dies.com/", "https://ok.com/"])]
+
+        assert await asyncio.wait_for(consume(), timeout=2) == [1]
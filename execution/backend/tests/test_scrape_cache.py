@@ -0,0 +1,186 @@
+"""Tests for the on-disk scrape cache."""
+
+import os
+import time
+
+import httpx
+import pytest
+
+from app.services.scrapers import (
+    ScrapeCache,
+    ScraperConfig,
+    ScraperOrchestrator,
+    ScraperResult,
+    ScraperStrategy,
+    SharedHttpClient,
+    finish_scrape_run,
+    start_scrape_run,
+)
+from app.services.scrapers.urls import canonical_url
+
+PAGE = "<html><head><title>Careers</title></head><body><h1>Join us</h1> ML Engineer</body></html>"
+
+
+class FakeSite:
+    """MockTransport handler that honours If-None-Match."""
+
+    def __init__(self, etag='"v1"'):
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag and request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        headers = {"Content-Type": "text/html"}
+        if self.etag:
+            headers["ETag"] = self.etag
+        return httpx.Response(200, text=PAGE, headers=headers)
+
+
+def make_orchestrator(tmp_path, site, **overrides) -> ScraperOrchestrator:
+    config = ScraperConfig(cache_dir=str(tmp_path / "cache"), respect_robots_txt=False, **overrides)
+    http = SharedHttpClient(config, transport=httpx.MockTransport(site))
+    return ScraperOrchestrator(config, http=http)
+
+
+def age_entry(orchestrator: ScraperOrchestrator, url: str, hours: float) -> None:
+    entry = orchestrator.cache.get(url)
+    entry.stored_at -= hours * 3600
+    orchestrator.cache._write(url, entry)
+
+
+class TestCanonicalUrl:
+    def test_trivial_variants_share_a_key(self):
+        assert canonical_url("HTTPS://Acme.com:443#top") == "https://acme.com/"
+        assert ScrapeCache.key("https://acme.com/jobs#x") == ScrapeCache.key("https://ACME.com/jobs")
+
+    def test_query_and_port_preserved(self):
+        assert canonical_url("http://acme.com:8080/jobs?page=2") == "http://acme.com:8080/jobs?page=2"
+
+
+class TestScrapeCache:
+    def test_disabled_without_cache_dir(self):
+        assert ScraperOrchestrator().cache is None
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit_skips_network(self, tmp_path):
+        site = FakeSite()
+        orchestrator = make_orchestrator(tmp_path, site)
+
+        first = await orchestrator.scrape("https://acme.com/careers")
+        second = await orchestrator.scrape("https://ACME.com/careers#open-roles")
+
+        assert len(site.requests) == 1
+        assert second.success is True
+        assert second.metadata["cache"] == "hit"
+        assert second.extracted_text == first.extracted_text
+        assert second.title == "Careers"
+        assert dict(orchestrator.stats) == {"cache_miss": 1, "cache_hit": 1}
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidated_with_conditional_get(self, tmp_path):
+        site = FakeSite()
+        orchestrator = make_orchestrator(tmp_path, site, cache_duration_hours=1)
+        url = "https://acme.com/careers"
+
+        await orchestrator.scrape(url)
+        age_entry(orchestrator, url, hours=2)
+        result = await orchestrator.scrape(url)
+
+        assert site.requests[-1].headers["if-none-match"] == '"v1"'
+        assert result.metadata["cache"] == "revalidated"
+        assert "ML Engineer" in result.extracted_text
+        assert orchestrator.cache.is_fresh(orchestrator.cache.get(url))
+        assert orchestrator.stats["cache_revalidated"] == 1
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_changed_page_replaces_entry(self, tmp_path):
+        site = FakeSite()
+        orchestrator = make_orchestrator(tmp_path, site, cache_duration_hours=1)
+        url = "https://acme.com/careers"
+
+        await orchestrator.scrape(url)
+        age_entry(orchestrator, url, hours=2)
+        site.etag = '"v2"'
+        result = await orchestrator.scrape(url)
+
+        assert "cache" not in result.metadata
+        assert orchestrator.cache.get(url).etag == '"v2"'
+        assert orchestrator.stats["cache_miss"] == 2
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self, tmp_path):
+        def handler(request):
+            return httpx.Response(503)
+
+        orchestrator = make_orchestrator(tmp_path, handler)
+        result = await orchestrator.scrape("https://acme.com/careers")
+
+        assert result.success is False
+        assert orchestrator.cache.get("https://acme.com/careers") is None
+        await orchestrator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_counters_reported_to_active_run(self, tmp_path):
+        orchestrator = make_orchestrator(tmp_path, FakeSite())
+        await orchestrator.scrape("https://acme.com/careers")
+        run, token = start_scrape_run()
+        try:
+            await orchestrator.scrape("https://acme.com/careers")
+            await orchestrator.scrape("https://acme.com/careers")  # Reused within the run
+        finally:
+            finish_scrape_run(token)
+        await orchestrator.scrape("https://acme.com/careers")
+
+        assert dict(run.stats) == {"cache_hit": 1, "dedup_run": 1}
+        await orchestrator.aclose()
+
+    def test_body_stored_compressed(self, tmp_path):
+        cache = ScrapeCache(tmp_path)
+        html = "<p>" + "machine learning " * 2000 + "</p>"
+        cache.put(ScraperResult(
+            url="https://acme.com/jobs",
+            success=True,
+            strategy_used=ScraperStrategy.GENERIC_HTML,
+            raw_html=html,
+        ))
+        assert cache.stats()["bytes"] < len(html) / 10
+        assert cache.get("https://acme.com/jobs").raw_html == html
+
+
+class TestEviction:
+    def _fill(self, cache: ScrapeCache, count: int) -> list[str]:
+        urls = [f"https://acme.com/jobs/{i}" for i in range(count)]
+        for i, url in enumerate(urls):
+            cache.put(ScraperResult(
+                url=url,
+                success=True,
+                strategy_used=ScraperStrategy.GENERIC_HTML,
+                raw_html=os.urandom(2000).hex(),  # Incompressible
+            ))
+            # Spread validation times so eviction order is deterministic
+            stamp = time.time() - (count - i) * 60
+            os.utime(cache._path(url), (stamp, stamp))
+        return urls
+
+    def test_evicts_oldest_over_size_budget(self, tmp_path):
+        cache = ScrapeCache(tmp_path, max_bytes=10_000)
+        urls = self._fill(cache, 6)
+        cache.evict()
+
+        assert cache.stats()["bytes"] <= 10_000
+        assert cache.get(urls[0]) is None
+        assert cache.get(urls[-1]) is not None
+
+    def test_evicts_past_max_age(self, tmp_path):
+        cache = ScrapeCache(tmp_path, ttl_hours=0, max_age_hours=0.5)
+        urls = self._fill(cache, 3)
+        old = time.time() - 3600
+        os.utime(cache._path(urls[0]), (old, old))
+
+        assert cache.evict() == 1
+        assert cache.stats()["entries"] == 2
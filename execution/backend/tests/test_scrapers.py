@@ -19,13 +19,18 @@ class TestScraperOrchestrator:
         return ScraperOrchestrator()
 
     def test_strategy_selection_greenhouse(self, orchestrator):
-        """Selenium should be selected for Greenhouse URLs."""
+        """Greenhouse board API should be selected for Greenhouse URLs."""
         scraper = orchestrator._select_strategy("https://boards.greenhouse.io/stripe")
-        assert scraper.strategy == ScraperStrategy.SELENIUM
+        assert scraper.strategy == ScraperStrategy.GREENHOUSE
 
     def test_strategy_selection_lever(self, orchestrator):
-        """Selenium should be selected for Lever URLs."""
+        """Lever postings API should be selected for Lever URLs."""
         scraper = orchestrator._select_strategy("https://jobs.lever.co/company")
+        assert scraper.strategy == ScraperStrategy.LEVER
+
+    def test_strategy_selection_workday(self, orchestrator):
+        """Selenium should be selected for JS-heavy ATS without a public API."""
+        scraper = orchestrator._select_strategy("https://acme.wd5.myworkdayjobs.com/careers")
         assert scraper.strategy == ScraperStrategy.SELENIUM
 
     def test_strategy_selection_generic(self, orchestrator):
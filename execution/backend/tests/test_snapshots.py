@@ -0,0 +1,121 @@
+"""Tests for the content-addressed scrape snapshot store."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.company import Company
+from app.services import snapshots
+from app.services.scoring_service import ScoringService
+from app.services.scrapers import ScraperConfig, ScraperOrchestrator, SharedHttpClient
+from app.services.snapshots import (
+    Snapshot,
+    SnapshotStore,
+    load_latest_snapshots,
+    snapshot_segments,
+    zstd_available,
+)
+
+TEXT = "We deploy machine learning models and LLM agents in production. " * 50
+FETCHED = datetime(2026, 10, 1, 12, 0)
+
+
+def stored_objects(root) -> list:
+    return [p for p in (root / "objects").rglob("*") if p.is_file()]
+
+
+class TestSnapshotStore:
+    def test_round_trip(self, tmp_path):
+        store = SnapshotStore(tmp_path)
+        docs = [
+            Snapshot("https://acme.com/careers", "careers", FETCHED, TEXT),
+            Snapshot(None, "google_snippets", FETCHED, "Acme hires AI engineers."),
+        ]
+
+        assert store.load_set(store.save_set(docs)) == docs
+
+    def test_identical_text_stored_once(self, tmp_path):
+        store = SnapshotStore(tmp_path)
+        first = store.save_set([Snapshot("https://acme.com/a", "careers", FETCHED, TEXT)])
+        second = store.save_set([Snapshot("https://acme.com/b", "careers", FETCHED, TEXT)])
+
+        assert first != second
+        assert len(stored_objects(tmp_path)) == 1
+        assert store.save_set([Snapshot("https://acme.com/a", "careers", FETCHED, TEXT)]) == first
+
+    def test_text_is_compressed(self, tmp_path):
+        SnapshotStore(tmp_path).put_text(TEXT)
+        [path] = stored_objects(tmp_path)
+        assert path.stat().st_size < len(TEXT) / 10
+
+    def test_zlib_fallback(self, tmp_path):
+        with patch.object(snapshots, "_zstd", None):
+            digest = SnapshotStore(tmp_path).put_text(TEXT)
+            assert SnapshotStore(tmp_path).get_text(digest) == TEXT
+        assert stored_objects(tmp_path)[0].suffix == ".zz"
+
+    @pytest.mark.skipif(not zstd_available(), reason="no zstd codec installed")
+    def test_zstd_when_available(self, tmp_path):
+        digest = SnapshotStore(tmp_path).put_text(TEXT)
+        assert stored_objects(tmp_path)[0].suffix == ".zst"
+        assert SnapshotStore(tmp_path).get_text(digest) == TEXT
+
+
+def test_segments_match_scoring_layout():
+    docs = [
+        Snapshot("https://acme.com/a", "careers", FETCHED, "first"),
+        Snapshot("https://acme.com/b", "careers", FETCHED, "second"),
+        Snapshot("https://acme.com/", "homepage", FETCHED, "home"),
+    ]
+    assert snapshot_segments(docs) == {"careers": "first\nsecond", "homepage": "home"}
+
+
+def site(request: httpx.Request) -> httpx.Response:
+    body = f"<html><head><title>Acme</title></head><body><p>{request.url.path}: {TEXT}</p></body></html>"
+    return httpx.Response(200, text=body, headers={"Content-Type": "text/html"})
+
+
+@pytest.mark.asyncio
+async def test_score_references_snapshot_set(tmp_path):
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    config = ScraperConfig(respect_robots_txt=False)
+    service = ScoringService(db)
+    service.scraper = ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+    sources = [{"url": "https://acme.com/blog", "type": "engineering_blog"}]
+
+    with patch("app.core.config.settings.SNAPSHOT_DIR", str(tmp_path)), \
+            patch("app.services.discovery.DiscoveryService.find_sources", return_value=sources), \
+            patch("app.services.discovery.DiscoveryService.discover_subdomains", return_value=[]):
+        await service.score_company("https://acme.com/")
+        company = db.query(Company).filter_by(domain="acme.com").one()
+        docs = load_latest_snapshots(db, company.id)
+
+    assert company.scores[0].snapshot_id is not None
+    assert {(d.url, d.source_type) for d in docs} == {
+        ("https://acme.com/", "homepage"),
+        ("https://acme.com/blog", "engineering_blog"),
+    }
+
+    # Re-extraction from the snapshot reproduces the stored signals without scraping
+    signals = service._extract_signals_heuristically(snapshot_segments(docs))
+    assert service.calculator.calculate("Acme", signals).signals.to_dict() == company.scores[0].signals
+
+    await service.scraper.aclose()
+    db.close()
+
+
+def test_no_snapshot_for_company(tmp_path):
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    assert load_latest_snapshots(db, 1, store=SnapshotStore(tmp_path)) is None
+    db.close()
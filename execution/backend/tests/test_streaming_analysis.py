@@ -0,0 +1,99 @@
+"""Tests for analyzing scraped pages while the rest of a stage downloads."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from app.services.deadline import SCORING_STAGE_WEIGHTS, Deadline
+from app.services.scoring_service import ScoringService, _AnalysisPipeline, _analyze_document
+from app.services.scrapers import ScraperConfig, ScraperOrchestrator, ScraperResult, ScraperStrategy, SharedHttpClient
+
+PAGES = [
+    ((0, 0), "https://acme.com/", "homepage", "Acme is AI-powered. Our platform runs on AWS."),
+    ((1, 0), "https://acme.com/blog", "engineering_blog", "We deployed AI with PyTorch and LangChain agents."),
+    ((1, 1), "https://acme.com/eng", "engineering_blog", "Our ML platform uses GPT-4 and Ray.\nAgentic workflows."),
+    ((3, 0), "https://ai.acme.com/", "subdomain_ai", "Our API, our SDK and our model playground."),
+    ((5, 0), None, "google_snippets", "AI Product Manager - Acme\nLegal team AI guidelines"),
+]
+
+
+def test_segment_features_merge_like_joined_text():
+    first, second = PAGES[1][3], PAGES[2][3]
+    merged = _analyze_document("engineering_blog", first).merge(_analyze_document("engineering_blog", second))
+    assert merged == _analyze_document("engineering_blog", first + "\n" + second)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_matches_analyzing_all_text_at_once():
+    service = ScoringService(MagicMock())
+    pipeline = _AnalysisPipeline()
+    for order, url, source_type, text in reversed(PAGES):  # Finish order doesn't matter
+        pipeline.add(order, url, source_type, text, None)
+
+    segments, documents = await pipeline.finish()
+
+    text_segments = {}
+    for _, _, source_type, text in PAGES:
+        text_segments[source_type] = text_segments[source_type] + "\n" + text if source_type in text_segments else text
+    expected = service._extract_signals_heuristically(text_segments)
+    signals = service._signals_from_features(segments)
+    assert signals == expected
+    assert [doc.url for doc in documents] == [url for _, url, _, _ in PAGES]
+
+
+@pytest.mark.asyncio
+async def test_pages_analyzed_while_stage_still_downloading():
+    service = ScoringService(MagicMock())
+    pipeline = _AnalysisPipeline()
+    analyzed_before_slow_page = []
+
+    async def site(request):
+        if request.url.path == "/slow":
+            for _ in range(100):
+                if pipeline._analyzed:
+                    break
+                await asyncio.sleep(0.01)
+            analyzed_before_slow_page.extend(page.url for page, _ in pipeline._analyzed.values())
+        return httpx.Response(200, text="<html><body><p>Machine learning jobs</p></body></html>",
+                              headers={"Content-Type": "text/html"})
+
+    config = ScraperConfig(respect_robots_txt=False)
+    service.scraper = ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+    urls = ["https://acme.com/slow", "https://acme.com/fast"]
+
+    results = await service._scrape_stage(
+        Deadline(0, SCORING_STAGE_WEIGHTS), "deep_scrape", urls,
+        on_result=lambda i, res: pipeline.add((4, i), urls[i], "job_posting", res.extracted_text, res.scraped_at),
+    )
+    segments, documents = await pipeline.finish()
+
+    assert analyzed_before_slow_page == ["https://acme.com/fast"]
+    assert [res.success for res in results] == [True, True]
+    assert [doc.url for doc in documents] == urls  # Input order, not finish order
+    assert segments["job_posting"].tier_matches["generic"] == 2
+    await service.scraper.aclose()
+
+
+@pytest.mark.asyncio
+async def test_ats_board_postings_classified_one_by_one():
+    def posting(url, title, text):
+        return ScraperResult(url=url, success=True, strategy_used=ScraperStrategy.GREENHOUSE, title=title, extracted_text=text)
+
+    board = ScraperResult(
+        url="https://boards.greenhouse.io/acme",
+        success=True,
+        strategy_used=ScraperStrategy.GREENHOUSE,
+        extracted_text="combined",
+        postings=[
+            posting("https://boards.greenhouse.io/acme/jobs/1", "ML Engineer", "Software engineer building LLM agents"),
+            posting("https://boards.greenhouse.io/acme/jobs/2", "Legal Counsel", "Legal counsel for AI governance"),
+        ],
+    )
+    pipeline = _AnalysisPipeline()
+    pipeline.add_result((1, 0), board.url, None, board)
+    segments, documents = await pipeline.finish()
+
+    assert [doc.url for doc in documents] == [p.url for p in board.postings]
+    assert len(segments) == 2  # Each posting got its own source type
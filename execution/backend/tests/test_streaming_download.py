@@ -0,0 +1,103 @@
+"""Tests for streamed, size-capped page downloads."""
+
+import httpx
+import pytest
+
+from app.services.scrapers import GenericHtmlScraper, ScraperConfig, SharedHttpClient
+from app.services.scrapers.http_client import is_html_content_type
+
+
+class ChunkedBody(httpx.AsyncByteStream):
+    """Response body served in fixed-size chunks, recording how much was pulled."""
+
+    def __init__(self, chunk: bytes, count: int):
+        self.chunk = chunk
+        self.count = count
+        self.chunks_sent = 0
+
+    async def __aiter__(self):
+        for _ in range(self.count):
+            self.chunks_sent += 1
+            yield self.chunk
+
+
+def make_scraper(handler, **overrides) -> GenericHtmlScraper:
+    config = ScraperConfig(**overrides)
+    return GenericHtmlScraper(config, http=SharedHttpClient(config, transport=httpx.MockTransport(handler)))
+
+
+class TestContentTypeRejection:
+    @pytest.mark.parametrize("content_type,allowed", [
+        ("text/html; charset=utf-8", True),
+        ("application/xhtml+xml", True),
+        ("", True),
+        ("application/pdf", False),
+        ("video/mp4", False),
+        ("application/javascript", False),
+    ])
+    def test_is_html_content_type(self, content_type, allowed):
+        assert is_html_content_type(content_type) is allowed
+
+    @pytest.mark.asyncio
+    async def test_pdf_rejected_before_body_read(self):
+        body = ChunkedBody(b"%PDF-1.7" + b"\0" * 65536, count=100)
+
+        def handler(request):
+            return httpx.Response(200, headers={"Content-Type": "application/pdf"}, stream=body)
+
+        scraper = make_scraper(handler)
+        result = await scraper.scrape("https://acme.com/annual-report.pdf")
+
+        assert result.success is False
+        assert "application/pdf" in result.error_message
+        assert body.chunks_sent == 0
+        await scraper.http.aclose()
+
+
+class TestByteCap:
+    @pytest.mark.asyncio
+    async def test_large_page_truncated(self):
+        chunk = b"<p>" + b"x" * 1021 + b"</p>"  # 1 KiB
+        body = ChunkedBody(chunk, count=1000)
+
+        def handler(request):
+            return httpx.Response(200, headers={"Content-Type": "text/html"}, stream=body)
+
+        scraper = make_scraper(handler, max_body_bytes=10 * 1024)
+        result = await scraper.scrape("https://acme.com/huge")
+
+        assert result.success is True
+        assert result.metadata["truncated"] is True
+        assert result.metadata["body_bytes"] == 10 * 1024
+        assert body.chunks_sent <= 11  # Stopped reading at the cap
+        await scraper.http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_small_page_complete(self):
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={"Content-Type": "text/html; charset=utf-8"},
+                content="<title>Jobs</title><p>Machine learning — Zürich</p>".encode(),
+            )
+
+        scraper = make_scraper(handler)
+        result = await scraper.scrape("https://acme.com/jobs")
+
+        assert result.metadata["truncated"] is False
+        assert result.metadata["content_length"] == result.metadata["body_bytes"]
+        assert "Zürich" in result.extracted_text
+        assert result.title == "Jobs"
+        await scraper.http.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unknown_charset_falls_back_to_utf8(self):
+        def handler(request):
+            return httpx.Response(200, headers={"Content-Type": "text/html; charset=bogus-8"}, content=b"<p>ok</p>")
+
+        scraper = make_scraper(handler)
+        result = await scraper.scrape("https://acme.com/")
+
+        assert result.success is True
+        assert result.extracted_text == "ok"
+        await scraper.http.aclose()
@@ -0,0 +1,148 @@
+"""Tests for job postings embedded as structured data."""
+
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models.company import Company
+from app.services.scoring_service import ScoringService
+from app.services.scrapers import ParsedDocument, ScraperConfig, ScraperOrchestrator, SharedHttpClient
+from app.services.scrapers.run import current_run
+from app.services.scrapers.structured_data import extract_from_pages, extract_job_postings
+
+DESCRIPTION = "<p>You will build retrieval pipelines and evaluate LLM agents in production with PyTorch.</p>" * 3
+
+
+def page(*scripts: str, body: str = "<p>Careers</p>") -> str:
+    return f"<html><head>{''.join(scripts)}</head><body>{body}</body></html>"
+
+
+def json_ld(data) -> str:
+    return f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+
+def next_data(jobs: list) -> str:
+    data = {"props": {"pageProps": {"jobs": jobs}}, "page": "/careers", "buildId": "abc123"}
+    return f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data)}</script>'
+
+
+def job(title: str, url: str = None) -> dict:
+    posting = {
+        "@context": "https://schema.org",
+        "@type": "JobPosting",
+        "title": title,
+        "description": DESCRIPTION,
+        "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+        "jobLocation": {"@type": "Place", "address": {"@type": "PostalAddress", "addressLocality": "Berlin"}},
+        "employmentType": "FULL_TIME",
+    }
+    if url:
+        posting["url"] = url
+    return posting
+
+
+class TestExtractJobPostings:
+    def test_json_ld_graph(self):
+        html = page(json_ld({"@graph": [{"@type": "Organization", "name": "Acme"}, job("ML Engineer", "/jobs/ml")]}))
+        [posting] = extract_job_postings(ParsedDocument.from_html(html), "https://acme.com/careers")
+
+        assert posting.url == "https://acme.com/jobs/ml"
+        assert posting.source == "json-ld"
+        assert posting.text.startswith("ML Engineer\nAcme · Berlin · FULL_TIME\nYou will build")
+        assert "<p>" not in posting.text
+
+    def test_json_ld_list_without_urls(self):
+        html = page(json_ld([job("ML Engineer"), job("Data Engineer")]))
+        postings = extract_job_postings(ParsedDocument.from_html(html), "https://acme.com/careers")
+
+        assert [p.title for p in postings] == ["ML Engineer", "Data Engineer"]
+        assert postings[0].url.startswith("https://acme.com/careers#job-0-ml-engineer")
+
+    def test_next_data_jobs(self):
+        jobs = [
+            {"id": 1, "title": "Data Scientist", "content": DESCRIPTION, "absolute_url": "https://boards.greenhouse.io/acme/jobs/1"},
+            {"id": 2, "title": "Backend Engineer", "content": "Short teaser", "location": {"name": "Remote"}},
+        ]
+        cms_block = {"title": "Our values", "description": DESCRIPTION}  # No job-only fields
+        html = page(next_data(jobs + [cms_block]))
+        [posting] = extract_job_postings(ParsedDocument.from_html(html), "https://acme.com/careers")
+
+        assert (posting.title, posting.source) == ("Data Scientist", "next-data")
+        assert posting.url == "https://boards.greenhouse.io/acme/jobs/1"
+
+    def test_invalid_json_ignored(self):
+        html = page('<script type="application/ld+json">{"@type": "JobPosting",</script>', json_ld(job("ML Engineer")))
+        assert len(extract_job_postings(ParsedDocument.from_html(html), "https://acme.com/")) == 1
+
+    def test_same_job_on_two_pages_kept_once(self):
+        doc = ParsedDocument.from_html(page(json_ld(job("ML Engineer", "https://acme.com/jobs/ml"))))
+        postings = extract_from_pages([("https://acme.com/", doc, None), ("https://acme.com/careers", doc, None)])
+        assert len(postings) == 1
+
+
+@pytest.mark.asyncio
+async def test_embedded_postings_replace_deep_fetches(tmp_path):
+    postings = [job(f"ML Engineer {i}", f"https://acme.com/jobs/ml-{i}") for i in range(5)]
+    links = "".join(f'<a href="/jobs/ml-{i}">ML Engineer {i}</a>' for i in range(5))
+    homepage = page(json_ld(postings), body=links + "<p>Acme builds robots.</p>")
+    fetched = []
+
+    def site(request):
+        fetched.append(request.url.path)
+        return httpx.Response(200, text=homepage, headers={"Content-Type": "text/html"})
+
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    config = ScraperConfig(respect_robots_txt=False)
+    service = ScoringService(db)
+    service.scraper = ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+
+    with patch("app.core.config.settings.SNAPSHOT_DIR", str(tmp_path)), \
+            patch("app.services.discovery.DiscoveryService.find_sources", return_value=[]), \
+            patch("app.services.discovery.DiscoveryService.discover_subdomains", return_value=[]):
+        await service.score_company("https://acme.com/")
+
+    assert fetched == ["/"]
+    assert current_run() is None  # The job's scrape run was closed
+    company = db.query(Company).filter_by(domain="acme.com").one()
+    steps = {step["step"]: step["detail"] for step in company.discovery_trace["steps"]}
+    assert steps["Embedded job postings"]["deep_fetches_avoided"] == 5
+    assert steps["Scrape stats"]["deep_fetches_avoided"] == 5
+
+    await service.scraper.aclose()
+    db.close()
+
+
+@pytest.mark.asyncio
+async def test_postings_without_urls_are_scored(tmp_path):
+    homepage = page(json_ld([job("ML Engineer"), job("Data Engineer")]), body="<p>Acme builds robots.</p>")
+
+    def site(request):
+        return httpx.Response(200, text=homepage, headers={"Content-Type": "text/html"})
+
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    config = ScraperConfig(respect_robots_txt=False)
+    service = ScoringService(db)
+    service.scraper = ScraperOrchestrator(config, http=SharedHttpClient(config, transport=httpx.MockTransport(site)))
+
+    with patch("app.core.config.settings.SNAPSHOT_DIR", str(tmp_path)), \
+            patch("app.services.discovery.DiscoveryService.find_sources", return_value=[]), \
+            patch("app.services.discovery.DiscoveryService.discover_subdomains", return_value=[]):
+        await service.score_company("https://acme.com/")
+
+    company = db.query(Company).filter_by(domain="acme.com").one()
+    steps = {step["step"]: step["detail"] for step in company.discovery_trace["steps"]}
+    assert steps["Embedded job postings"]["postings"] == 2
+    assert steps["Embedded job postings"]["json_ld"] == 2
+
+    await service.scraper.aclose()
+    db.close()